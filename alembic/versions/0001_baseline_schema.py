@@ -0,0 +1,211 @@
+"""baseline schema
+
+The tables of app/db/sql/models as they stood before any revision of this series
+(no missions.version, no list filter/sort indexes; 0001a adds those). Databases
+created before migrations were introduced already have them: `alembic stamp 0001`
+instead of upgrading through this revision.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 02:09:15.540026
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('blacks',
+    sa.Column('num', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('site', sa.Enum('NORTH', 'SOUTH', 'CENTER', name='sites'), nullable=False),
+    sa.PrimaryKeyConstraint('num'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_index(op.f('ix_blacks_num'), 'blacks', ['num'], unique=False)
+
+    op.create_table('missions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('section', sa.Enum('SECTION_A', 'SECTION_B', name='sections'), nullable=False),
+    sa.Column('type', sa.Enum('TRAINING', 'OPERATIONAL', name='missiontypes'), nullable=False),
+    sa.Column('status', sa.Enum('PLANNED', 'ACTIVE', 'COMPLETED', 'CANCELLED', name='missionstatuses'), nullable=False),
+    sa.Column('origin', sa.Enum('INTERNAL', 'EXTERNAL', name='missionorigins'), nullable=False),
+    sa.Column('scheduled_start_time', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('scheduled_end_time', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('actual_end_time', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+
+    op.create_table('operators',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('first_name', sa.String(), nullable=False),
+    sa.Column('last_name', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('platforms',
+    sa.Column('tail_num', sa.Integer(), nullable=False),
+    sa.Column('type', sa.Enum('TYPE_A', 'TYPE_B', name='platformtypes'), nullable=False),
+    sa.PrimaryKeyConstraint('tail_num')
+    )
+
+    op.create_table('roles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.Enum('COMMANDER', 'OPERATOR', 'TECHNICIAN', name='operatorrolesenum'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('rts',
+    sa.Column('num', sa.Integer(), nullable=False),
+    sa.Column('location', sa.Enum('LOC_1', 'LOC_2', name='rtlocations'), nullable=False),
+    sa.Column('is_main', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('num')
+    )
+
+    op.create_table('crawlers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('site', postgresql.ENUM('NORTH', 'SOUTH', 'CENTER', name='sites', create_type=False), nullable=False),
+    sa.Column('black_num', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['black_num'], ['blacks.num'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_crawlers_name'), 'crawlers', ['name'], unique=True)
+
+    op.create_table('mission_operators',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('mission_id', sa.Integer(), nullable=False),
+    sa.Column('operator_id', sa.Integer(), nullable=False),
+    sa.Column('role_id', sa.Integer(), nullable=False),
+    sa.Column('start_time', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('end_time', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['operator_id'], ['operators.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['role_id'], ['roles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_mission_operators_mission_id'), 'mission_operators', ['mission_id'], unique=False)
+    op.create_index(op.f('ix_mission_operators_operator_id'), 'mission_operators', ['operator_id'], unique=False)
+    op.create_index(op.f('ix_mission_operators_role_id'), 'mission_operators', ['role_id'], unique=False)
+    op.create_index(op.f('ix_mission_operators_start_time'), 'mission_operators', ['start_time'], unique=False)
+
+    op.create_table('mission_platform_rts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('mission_id', sa.Integer(), nullable=False),
+    sa.Column('platform_id', sa.Integer(), nullable=False),
+    sa.Column('rt_num', sa.Integer(), nullable=False),
+    sa.Column('start_time', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('end_time', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('up_channel', sa.Integer(), nullable=False),
+    sa.Column('down_channel', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['platform_id'], ['platforms.tail_num'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['rt_num'], ['rts.num'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_mission_platform_rts_mission_id'), 'mission_platform_rts', ['mission_id'], unique=False)
+    op.create_index(op.f('ix_mission_platform_rts_platform_id'), 'mission_platform_rts', ['platform_id'], unique=False)
+    op.create_index(op.f('ix_mission_platform_rts_rt_num'), 'mission_platform_rts', ['rt_num'], unique=False)
+    op.create_index(op.f('ix_mission_platform_rts_start_time'), 'mission_platform_rts', ['start_time'], unique=False)
+
+    op.create_table('mission_platforms',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('mission_id', sa.Integer(), nullable=False),
+    sa.Column('platform_id', sa.Integer(), nullable=False),
+    sa.Column('start_time', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('end_time', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('main_rt_num', sa.Integer(), nullable=True),
+    sa.Column('backup_rt_num', sa.Integer(), nullable=True),
+    sa.Column('pod_num', sa.Integer(), nullable=True),
+    sa.Column('rass_num', sa.Integer(), nullable=True),
+    sa.Column('atru_num', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['backup_rt_num'], ['rts.num'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['main_rt_num'], ['rts.num'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['platform_id'], ['platforms.tail_num'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_mission_platforms_mission_id'), 'mission_platforms', ['mission_id'], unique=False)
+    op.create_index(op.f('ix_mission_platforms_platform_id'), 'mission_platforms', ['platform_id'], unique=False)
+    op.create_index(op.f('ix_mission_platforms_start_time'), 'mission_platforms', ['start_time'], unique=False)
+
+    op.create_table('operator_roles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('operator_id', sa.Integer(), nullable=False),
+    sa.Column('role_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['operator_id'], ['operators.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['role_id'], ['roles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_operator_roles_operator_id'), 'operator_roles', ['operator_id'], unique=False)
+    op.create_index(op.f('ix_operator_roles_role_id'), 'operator_roles', ['role_id'], unique=False)
+
+    op.create_table('stations',
+    sa.Column('num', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('site', postgresql.ENUM('NORTH', 'SOUTH', 'CENTER', name='sites', create_type=False), nullable=False),
+    sa.Column('black_num', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['black_num'], ['blacks.num'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('num')
+    )
+
+    op.create_table('mission_crawlers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('mission_id', sa.Integer(), nullable=False),
+    sa.Column('crawler_id', sa.Integer(), nullable=False),
+    sa.Column('start_time', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('end_time', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['crawler_id'], ['crawlers.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_mission_crawlers_crawler_id'), 'mission_crawlers', ['crawler_id'], unique=False)
+    op.create_index(op.f('ix_mission_crawlers_mission_id'), 'mission_crawlers', ['mission_id'], unique=False)
+    op.create_index(op.f('ix_mission_crawlers_start_time'), 'mission_crawlers', ['start_time'], unique=False)
+
+    op.create_table('mission_stations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('mission_id', sa.Integer(), nullable=False),
+    sa.Column('station_id', sa.Integer(), nullable=False),
+    sa.Column('start_time', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('end_time', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['station_id'], ['stations.num'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_mission_stations_mission_id'), 'mission_stations', ['mission_id'], unique=False)
+    op.create_index(op.f('ix_mission_stations_start_time'), 'mission_stations', ['start_time'], unique=False)
+    op.create_index(op.f('ix_mission_stations_station_id'), 'mission_stations', ['station_id'], unique=False)
+
+
+
+def downgrade() -> None:
+    op.drop_table('mission_stations')
+    op.drop_table('mission_crawlers')
+    op.drop_table('stations')
+    op.drop_table('operator_roles')
+    op.drop_table('mission_platforms')
+    op.drop_table('mission_platform_rts')
+    op.drop_table('mission_operators')
+    op.drop_table('crawlers')
+    op.drop_table('rts')
+    op.drop_table('roles')
+    op.drop_table('platforms')
+    op.drop_table('operators')
+    op.drop_table('missions')
+    op.drop_table('blacks')
+
+    # PostgreSQL keeps enum types after their tables are dropped
+    for name in ('sites', 'sections', 'missiontypes', 'missionstatuses', 'missionorigins',
+                 'platformtypes', 'operatorrolesenum', 'rtlocations'):
+        sa.Enum(name=name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,57 @@
+"""mission version and list indexes
+
+missions.version (the ETag of GET /missions/{id}) and the B-tree indexes list
+queries filter and sort on: the enum/foreign key columns of the resource tables
+and (status, scheduled_start_time, id) for the mission summary listing.
+
+Revision 0002 revised 0001 before this revision existed; databases already past
+it have all of this from the earlier 0001 and never run it.
+
+Indexes are built CONCURRENTLY on PostgreSQL, outside the migration transaction.
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-18 14:10:52.310488
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0001a'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_blacks_site', 'blacks', ['site']),
+    ('ix_crawlers_black_num', 'crawlers', ['black_num']),
+    ('ix_crawlers_site', 'crawlers', ['site']),
+    ('ix_stations_black_num', 'stations', ['black_num']),
+    ('ix_stations_site', 'stations', ['site']),
+    ('ix_platforms_type', 'platforms', ['type']),
+    ('ix_rts_location', 'rts', ['location']),
+    ('ix_missions_scheduled_start_time', 'missions', ['scheduled_start_time']),
+    ('ix_missions_status_start_time', 'missions', ['status', 'scheduled_start_time', 'id']),
+]
+
+
+def upgrade() -> None:
+    op.add_column('missions', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    with op.batch_alter_table('missions') as batch_op:
+        batch_op.drop_column('version')
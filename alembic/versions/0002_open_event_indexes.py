@@ -0,0 +1,50 @@
+"""partial indexes on open events
+
+One index per event table over the rows with end_time IS NULL only:
+(mission_id, start_time, <resource column>). See app/db/sql/models/indexes.py.
+
+Built and dropped CONCURRENTLY on PostgreSQL, outside the migration transaction, so
+writes to the event tables go on meanwhile. A build that fails leaves an INVALID
+index behind: drop it and run the upgrade again.
+
+Revision ID: 0002
+Revises: 0001a
+Create Date: 2026-10-18 02:20:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN_EVENT = sa.text("end_time IS NULL")
+
+EVENT_TABLES = {
+    'mission_stations': 'station_id',
+    'mission_crawlers': 'crawler_id',
+    'mission_platforms': 'platform_id',
+    'mission_platform_rts': 'rt_num',
+    'mission_operators': 'operator_id',
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, resource_column in EVENT_TABLES.items():
+            op.create_index(
+                f'ix_{table}_open', table, ['mission_id', 'start_time', resource_column], unique=False,
+                postgresql_where=OPEN_EVENT, sqlite_where=OPEN_EVENT,
+                postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in EVENT_TABLES:
+            op.drop_index(f'ix_{table}_open', table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,81 @@
+"""availability versions
+
+availability_versions holds one counter per resource type, bumped by triggers on every
+write to the type's event table (per statement on PostgreSQL, per row on SQLite).
+Workers compare it with the version of their in-memory availability index.
+See app/db/sql/models/availability.py.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 04:05:12.803114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EVENT_TABLES = {
+    'mission_stations': 'station',
+    'mission_crawlers': 'crawler',
+    'mission_platforms': 'platform',
+    'mission_platform_rts': 'rt',
+    'mission_operators': 'operator',
+}
+
+SQLITE_OPERATIONS = ('INSERT', 'UPDATE', 'DELETE')
+
+
+def upgrade() -> None:
+    versions = op.create_table('availability_versions',
+    sa.Column('resource_type', sa.String(), nullable=False),
+    sa.Column('version', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('resource_type')
+    )
+    op.bulk_insert(versions, [{'resource_type': t, 'version': 0} for t in EVENT_TABLES.values()])
+
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute("""
+            CREATE OR REPLACE FUNCTION bump_availability_version() RETURNS trigger AS $$
+            BEGIN
+                INSERT INTO availability_versions (resource_type, version) VALUES (TG_ARGV[0], 1)
+                ON CONFLICT (resource_type) DO UPDATE SET version = availability_versions.version + 1;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        for table, resource_type in EVENT_TABLES.items():
+            op.execute(f"""
+                CREATE TRIGGER {table}_availability
+                AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+                FOR EACH STATEMENT EXECUTE FUNCTION bump_availability_version('{resource_type}')
+            """)
+    else:
+        for table, resource_type in EVENT_TABLES.items():
+            for operation in SQLITE_OPERATIONS:
+                op.execute(f"""
+                    CREATE TRIGGER {table}_availability_{operation}
+                    AFTER {operation} ON {table}
+                    BEGIN
+                        INSERT INTO availability_versions (resource_type, version) VALUES ('{resource_type}', 1)
+                        ON CONFLICT (resource_type) DO UPDATE SET version = version + 1;
+                    END
+                """)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        for table in EVENT_TABLES:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_availability ON {table}")
+        op.execute("DROP FUNCTION IF EXISTS bump_availability_version()")
+    else:
+        for table in EVENT_TABLES:
+            for operation in SQLITE_OPERATIONS:
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_availability_{operation}")
+    op.drop_table('availability_versions')
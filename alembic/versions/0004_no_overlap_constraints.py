@@ -0,0 +1,56 @@
+"""no-overlap exclusion constraints
+
+PostgreSQL only (a no-op on SQLite, which keeps relying on the application-side
+availability check): one GiST exclusion constraint per event table rejecting two
+events of the same resource in different missions whose [start_time, end_time)
+ranges overlap; an open end_time is an unbounded range. btree_gist provides the
+= and <> operators on the integer columns.
+
+Adding a constraint validates the existing rows under an ACCESS EXCLUSIVE lock
+and fails on the first double booking found; clear those first.
+See app/db/sql/models/availability.py.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 05:12:40.227561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EVENT_TABLES = {
+    'mission_stations': 'station_id',
+    'mission_crawlers': 'crawler_id',
+    'mission_platforms': 'platform_id',
+    'mission_platform_rts': 'rt_num',
+    'mission_operators': 'operator_id',
+}
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    for table, resource_column in EVENT_TABLES.items():
+        op.execute(f"""
+            ALTER TABLE {table} ADD CONSTRAINT ex_{table}_no_overlap
+            EXCLUDE USING gist (
+                {resource_column} WITH =,
+                mission_id WITH <>,
+                tstzrange(start_time, end_time, '[)') WITH &&
+            )
+        """)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    for table in EVENT_TABLES:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS ex_{table}_no_overlap")
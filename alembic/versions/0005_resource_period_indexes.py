@@ -0,0 +1,59 @@
+"""resource period indexes
+
+One (resource, end_time, start_time) index per event table for the availability
+predicate, replacing the single-column index on the resource, which is now its
+prefix. get_last_active_event already has ix_<table>_open from 0002.
+See app/db/sql/models/indexes.py.
+
+Built and dropped CONCURRENTLY on PostgreSQL, outside the migration transaction, so
+writes to the event tables go on meanwhile. A build that fails leaves an INVALID
+index behind: drop it and run the upgrade again.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 06:02:17.904418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EVENT_TABLES = {
+    'mission_stations': 'station_id',
+    'mission_crawlers': 'crawler_id',
+    'mission_platforms': 'platform_id',
+    'mission_platform_rts': 'rt_num',
+    'mission_operators': 'operator_id',
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, resource_column in EVENT_TABLES.items():
+            op.create_index(
+                f'ix_{table}_{resource_column}_period', table, [resource_column, 'end_time', 'start_time'],
+                unique=False, postgresql_concurrently=True, if_not_exists=True
+            )
+            op.drop_index(
+                f'ix_{table}_{resource_column}', table_name=table,
+                postgresql_concurrently=True, if_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, resource_column in EVENT_TABLES.items():
+            op.create_index(
+                f'ix_{table}_{resource_column}', table, [resource_column],
+                unique=False, postgresql_concurrently=True, if_not_exists=True
+            )
+            op.drop_index(
+                f'ix_{table}_{resource_column}_period', table_name=table,
+                postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,75 @@
+"""drop availability triggers
+
+Removes the availability_versions triggers 0003 installed on every event table.
+Each write bumped and locked the type's counter row until commit, serializing the
+writers of a resource type even where the availability index is off. Workers with
+DB_AVAILABILITY_INDEX on now install them at startup (see
+app/infrastructure/availability/triggers.py), so restart those after upgrading.
+availability_versions itself stays.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 07:14:52.316207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EVENT_TABLES = {
+    'mission_stations': 'station',
+    'mission_crawlers': 'crawler',
+    'mission_platforms': 'platform',
+    'mission_platform_rts': 'rt',
+    'mission_operators': 'operator',
+}
+
+SQLITE_OPERATIONS = ('INSERT', 'UPDATE', 'DELETE')
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        for table in EVENT_TABLES:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_availability ON {table}")
+        op.execute("DROP FUNCTION IF EXISTS bump_availability_version()")
+    else:
+        for table in EVENT_TABLES:
+            for operation in SQLITE_OPERATIONS:
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_availability_{operation}")
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute("""
+            CREATE OR REPLACE FUNCTION bump_availability_version() RETURNS trigger AS $$
+            BEGIN
+                INSERT INTO availability_versions (resource_type, version) VALUES (TG_ARGV[0], 1)
+                ON CONFLICT (resource_type) DO UPDATE SET version = availability_versions.version + 1;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        for table, resource_type in EVENT_TABLES.items():
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_availability ON {table}")
+            op.execute(f"""
+                CREATE TRIGGER {table}_availability
+                AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+                FOR EACH STATEMENT EXECUTE FUNCTION bump_availability_version('{resource_type}')
+            """)
+    else:
+        for table, resource_type in EVENT_TABLES.items():
+            for operation in SQLITE_OPERATIONS:
+                op.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_availability_{operation}
+                    AFTER {operation} ON {table}
+                    BEGIN
+                        INSERT INTO availability_versions (resource_type, version) VALUES ('{resource_type}', 1)
+                        ON CONFLICT (resource_type) DO UPDATE SET version = version + 1;
+                    END
+                """)
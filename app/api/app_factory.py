@@ -1,24 +1,46 @@
+import asyncio
 from contextlib import asynccontextmanager
+from datetime import timedelta
 from typing import cast, AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.exceptions.handlers import domain_exception_handler, unhandled_exception_handler
-from app.api.v1.endpoints import resources, operators, missions
+from app.api.middleware.query_stats import QueryStatsMiddleware
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.api.v1.endpoints import resources, operators, missions, assignments, availability, conflicts, admin
+from app.core.config import get_settings
 from app.db.sql.manager import SQLAlchemyManager
 from app.domain.exceptions.domain_exception import DomainException
+from app.infrastructure.availability.interval_index import AvailabilityIndex
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
+    settings = get_settings().database
+
     # Initialize manager
-    app.state.db_manager = SQLAlchemyManager
+    app.state.db_manager = SQLAlchemyManager(settings)
+
+    # Caps the extra sessions fan-out reads open (see get_read_session_factory)
+    app.state.read_fanout_slots = asyncio.Semaphore(settings.read_fanout_sessions)
+
+    # Optional in-memory availability index, warmed before serving
+    app.state.availability_index = None
+    if settings.availability_index:
+        app.state.availability_index = AvailabilityIndex(
+            app.state.db_manager,
+            lookback=timedelta(hours=settings.availability_index_lookback_hours)
+        )
+        await app.state.availability_index.warm()
 
     yield
 
     # Cleanup
-    # await app.state.db_manager.close()
+    if app.state.availability_index is not None:
+        await app.state.availability_index.close()
+    await app.state.db_manager.close()
 
 
 class AppFactory:
@@ -31,8 +53,12 @@ class AppFactory:
             allow_origins=["*"],
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=["Server-Timing", NEXT_CURSOR_HEADER],
         )
 
+        # Per-request SQL statement count and DB time (Server-Timing header + log line)
+        app.add_middleware(QueryStatsMiddleware)
+
         # Register global exception handlers
         app.add_exception_handler(DomainException, domain_exception_handler)
         app.add_exception_handler(Exception, unhandled_exception_handler)
@@ -41,5 +67,9 @@ class AppFactory:
         app.include_router(resources.router, prefix="/api/v1")
         app.include_router(operators.router, prefix="/api/v1")
         app.include_router(missions.router, prefix="/api/v1")
+        app.include_router(assignments.router, prefix="/api/v1")
+        app.include_router(availability.router, prefix="/api/v1")
+        app.include_router(conflicts.router, prefix="/api/v1")
+        app.include_router(admin.router, prefix="/api/v1")
 
         return app
@@ -1,20 +1,115 @@
-from typing import AsyncGenerator
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncContextManager, Callable
 
 from app.db.base_manager import AbstractDBManager
-from fastapi import Depends, Request
+from app.infrastructure.availability.interval_index import AvailabilityIndex
+from fastapi import Depends, Request, Response
+
+# Cookie carrying the epoch time of the client's last write (read-your-writes routing)
+LAST_WRITE_COOKIE = "last_write_at"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
 
 
 async def get_db_manager(request: Request) -> AbstractDBManager:
     return request.app.state.db_manager
 
 
+async def get_availability_index(request: Request) -> AvailabilityIndex | None:
+    # None unless enabled in the settings (DB_AVAILABILITY_INDEX)
+    return getattr(request.app.state, "availability_index", None)
+
+
+def _get_last_write_at(request: Request) -> float | None:
+    value = request.cookies.get(LAST_WRITE_COOKIE)
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
 async def get_session(
+        request: Request,
+        response: Response,
         db_manager: AbstractDBManager = Depends(get_db_manager)
 ) -> AsyncGenerator:
     """
     Yields a database session that is automatically committed/rolled back
     by the context manager in db_manager.
     """
+    window = db_manager.read_your_writes_window
+    if window > 0 and request.method not in SAFE_METHODS:
+        # Pin this client's reads to the primary until the replica catches up
+        response.set_cookie(LAST_WRITE_COOKIE, str(time.time()), max_age=int(window) + 1, httponly=True)
+
     async with db_manager.get_connection() as session:
         async with db_manager.transaction(session) as tx_session:
             yield tx_session
+
+
+async def get_read_session(
+        request: Request,
+        db_manager: AbstractDBManager = Depends(get_db_manager)
+) -> AsyncGenerator:
+    """
+    Yields a session for read-only routes: no commit, no autoflush.
+    Served by the replica when one is configured, unless the client wrote recently.
+    """
+    async with db_manager.get_connection(
+            read_only=True,
+            last_write_at=_get_last_write_at(request)
+    ) as session:
+        async with db_manager.read_only_transaction(session) as ro_session:
+            yield ro_session
+
+
+def get_read_session_factory(
+        request: Request,
+        db_manager: AbstractDBManager = Depends(get_db_manager),
+        session=Depends(get_read_session)
+) -> Callable[[], AsyncContextManager]:
+    """
+    Like get_read_session, as a factory: for routes that run several queries concurrently,
+    each on a read-only session (and pooled connection) of its own.
+
+    A worker holds at most DB_READ_FANOUT_SESSIONS such sessions. When none is free, the query
+    runs on the request's read session instead, one at a time: waiting for a pool connection
+    while the request holds one could exhaust the pool under load.
+    """
+    last_write_at = _get_last_write_at(request)
+    slots: asyncio.Semaphore = request.app.state.read_fanout_slots
+    shared = asyncio.Lock()
+
+    @asynccontextmanager
+    async def open_session():
+        if slots.locked():
+            async with shared:
+                yield session
+            return
+        async with slots:
+            async with db_manager.get_connection(read_only=True, last_write_at=last_write_at) as own_session:
+                async with db_manager.read_only_transaction(own_session) as ro_session:
+                    yield ro_session
+
+    return open_session
+
+
+def get_stream_session(
+        request: Request,
+        db_manager: AbstractDBManager = Depends(get_db_manager)
+) -> Callable[[], AsyncContextManager]:
+    """
+    For streaming responses, whose body is produced after yield dependencies have exited.
+    Returns a factory the response body uses to open (and close) its own read-only snapshot session.
+    """
+    last_write_at = _get_last_write_at(request)
+
+    @asynccontextmanager
+    async def open_session():
+        async with db_manager.get_connection(read_only=True, last_write_at=last_write_at) as session:
+            async with db_manager.snapshot_transaction(session) as snapshot_session:
+                yield snapshot_session
+
+    return open_session
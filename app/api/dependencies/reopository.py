@@ -1,14 +1,18 @@
 from typing import Type
 
+from app.core.config import get_settings
 from app.db.sql.manager import SQLAlchemyManager
 from fastapi import Depends
 
-from app.api.dependencies.db import get_db_manager, get_session
-from app.domain.interfaces.repository import IMissionRepository, IEventRepository, IOperatorRepository, IRepository
+from app.api.dependencies.db import get_db_manager, get_session, get_read_session, get_availability_index
+from app.domain.interfaces.repository import (
+    IMissionRepository, IEventRepository, IOperatorRepository, IRepository, IResourceRepository
+)
 from app.infrastructure.repositories.sql.base import SQLAlchemyRepository
 from app.infrastructure.repositories.sql.event_repository import SQLEventRepository
 from app.infrastructure.repositories.sql.mission import SQLMissionRepository
 from app.infrastructure.repositories.sql.operator import SQLOperatorRepository
+from app.infrastructure.repositories.sql.resource import SQLResourceRepository
 
 
 def get_generic_repo_class(
@@ -23,6 +27,21 @@ def get_generic_repo_class(
 def get_mission_repo(
         conn=Depends(get_session),
         db_manager=Depends(get_db_manager),
+        availability_index=Depends(get_availability_index),
+) -> IMissionRepository:
+    if isinstance(db_manager, SQLAlchemyManager):
+        return SQLMissionRepository(
+            conn,
+            availability_index,
+            skip_availability_precheck=not get_settings().database.availability_precheck
+        )
+    else:
+        raise RuntimeError("Unknown DB manager")
+
+
+def get_read_mission_repo(
+        conn=Depends(get_read_session),
+        db_manager=Depends(get_db_manager),
 ) -> IMissionRepository:
     if isinstance(db_manager, SQLAlchemyManager):
         return SQLMissionRepository(conn)
@@ -32,7 +51,18 @@ def get_mission_repo(
 
 def get_event_repo(
         conn=Depends(get_session),
-        db_manager=Depends(get_db_manager)
+        db_manager=Depends(get_db_manager),
+        availability_index=Depends(get_availability_index),
+) -> IEventRepository:
+    if isinstance(db_manager, SQLAlchemyManager):
+        return SQLEventRepository(conn, availability_index)
+    else:
+        raise RuntimeError("Unknown DB manager")
+
+
+def get_read_event_repo(
+        conn=Depends(get_read_session),
+        db_manager=Depends(get_db_manager),
 ) -> IEventRepository:
     if isinstance(db_manager, SQLAlchemyManager):
         return SQLEventRepository(conn)
@@ -48,3 +78,23 @@ def get_operator_repo(
         return SQLOperatorRepository(conn)
     else:
         raise RuntimeError("Unknown DB manager")
+
+
+def get_read_operator_repo(
+        conn=Depends(get_read_session),
+        db_manager=Depends(get_db_manager)
+) -> IOperatorRepository:
+    if isinstance(db_manager, SQLAlchemyManager):
+        return SQLOperatorRepository(conn)
+    else:
+        raise RuntimeError("Unknown DB manager")
+
+
+def get_read_resource_repo(
+        conn=Depends(get_read_session),
+        db_manager=Depends(get_db_manager)
+) -> IResourceRepository:
+    if isinstance(db_manager, SQLAlchemyManager):
+        return SQLResourceRepository(conn)
+    else:
+        raise RuntimeError("Unknown DB manager")
@@ -1,19 +1,32 @@
-from typing import Type
+from contextlib import asynccontextmanager
+from typing import Type, Optional, AsyncContextManager, Callable
 
 from fastapi import Depends
+from pydantic import BaseModel
 
-from app.api.dependencies.db import get_session
+from app.api.dependencies.db import (
+    get_session, get_read_session, get_stream_session, get_read_session_factory, get_db_manager,
+    get_availability_index
+)
 from app.api.dependencies.registry import get_resource_registry
-from app.api.dependencies.reopository import get_mission_repo, get_event_repo, get_operator_repo, get_generic_repo_class
+from app.api.dependencies.reopository import (
+    get_mission_repo, get_event_repo, get_operator_repo, get_generic_repo_class,
+    get_read_mission_repo, get_read_operator_repo, get_read_event_repo, get_read_resource_repo
+)
 from app.application.services.base_service import BaseService
+from app.application.services.conflict_report_service import ConflictReportService
 from app.application.services.mission_event_service import MissionEventService
 from app.application.services.mission_service import MissionService
+from app.application.services.mission_timeline_service import MissionTimelineService
 from app.application.services.operator_service import OperatorService
 from app.application.services.timeline_calculator import TimelineCalculator
+from app.application.services.timeline_import_service import TimelineImportService
+from app.db.base_manager import AbstractDBManager
 from app.domain.interfaces.resource_registry import ResourceRegistry
 from app.infrastructure.repositories.sql.event_repository import SQLEventRepository
 from app.infrastructure.repositories.sql.mission import SQLMissionRepository
 from app.infrastructure.repositories.sql.operator import SQLOperatorRepository
+from app.infrastructure.repositories.sql.resource import SQLResourceRepository
 
 
 def get_timeline_calculator() -> TimelineCalculator:
@@ -28,6 +41,33 @@ def get_mission_service(
     return MissionService(repo, calc, resource_registry)
 
 
+def get_mission_read_service(
+        repo: SQLMissionRepository = Depends(get_read_mission_repo),
+        calc: TimelineCalculator = Depends(get_timeline_calculator),
+        resource_registry: Type[ResourceRegistry] = Depends(get_resource_registry),
+) -> MissionService:
+    return MissionService(repo, calc, resource_registry)
+
+
+def get_mission_timeline_service(
+        repo: SQLMissionRepository = Depends(get_read_mission_repo),
+        resource_repo: SQLResourceRepository = Depends(get_read_resource_repo),
+        open_session=Depends(get_read_session_factory),
+) -> MissionTimelineService:
+    @asynccontextmanager
+    async def open_event_repo():
+        async with open_session() as session:
+            yield SQLEventRepository(session)
+
+    return MissionTimelineService(repo, resource_repo, open_event_repo)
+
+
+def get_conflict_report_service(
+        repo: SQLEventRepository = Depends(get_read_event_repo),
+) -> ConflictReportService:
+    return ConflictReportService(repo)
+
+
 def get_mission_event_service(
         mission_repo: SQLMissionRepository = Depends(get_mission_repo),
         event_repo: SQLEventRepository = Depends(get_event_repo),
@@ -42,17 +82,106 @@ def get_operator_service(
     return OperatorService(repo)
 
 
-def get_generic_service_factory[T](model_class: Type[T]):
+def get_operator_read_service(
+        repo: SQLOperatorRepository = Depends(get_read_operator_repo)
+) -> OperatorService:
+    return OperatorService(repo)
+
+
+def get_generic_service_factory[T](
+        model_class: Type[T],
+        read_only: bool = False,
+        response_schema: Optional[Type[BaseModel]] = None
+):
     """
     Creates a dependency that returns a BaseService for a specific model.
     Decoupled from specific Repo implementation via dependency injection.
+    read_only services get a session that may be served by a replica.
+    response_schema tells the repository which relationships to load after a write.
     """
+    session_dependency = get_read_session if read_only else get_session
 
     def _get_service(
-            session=Depends(get_session),
+            session=Depends(session_dependency),
             repo_class=Depends(get_generic_repo_class)
     ) -> BaseService:
-        repo = repo_class(session, model_class)
+        repo = repo_class(session, model_class, response_schema)
         return BaseService(repo)
 
     return _get_service
+
+
+def get_generic_export_service_factory[T](model_class: Type[T]):
+    """
+    Like get_generic_service_factory, for streaming exports: the dependency returns a
+    factory that opens a BaseService on its own snapshot session (see get_stream_session).
+    """
+
+    def _get_service_factory(
+            open_session=Depends(get_stream_session),
+            repo_class=Depends(get_generic_repo_class)
+    ) -> Callable[[], AsyncContextManager[BaseService]]:
+        @asynccontextmanager
+        async def open_service():
+            async with open_session() as session:
+                yield BaseService(repo_class(session, model_class))
+
+        return open_service
+
+    return _get_service_factory
+
+
+def get_mission_export_service(
+        open_session=Depends(get_stream_session),
+        calc: TimelineCalculator = Depends(get_timeline_calculator),
+        resource_registry: Type[ResourceRegistry] = Depends(get_resource_registry),
+) -> Callable[[], AsyncContextManager[MissionService]]:
+    @asynccontextmanager
+    async def open_service():
+        async with open_session() as session:
+            yield MissionService(SQLMissionRepository(session), calc, resource_registry)
+
+    return open_service
+
+
+def get_mission_event_export_service(
+        open_session=Depends(get_stream_session),
+        resource_registry: Type[ResourceRegistry] = Depends(get_resource_registry),
+) -> Callable[[], AsyncContextManager[MissionEventService]]:
+    @asynccontextmanager
+    async def open_service():
+        async with open_session() as session:
+            yield MissionEventService(SQLMissionRepository(session), SQLEventRepository(session), resource_registry)
+
+    return open_service
+
+
+def get_timeline_import_service(
+        db_manager: AbstractDBManager = Depends(get_db_manager),
+        resource_registry: Type[ResourceRegistry] = Depends(get_resource_registry),
+        availability_index=Depends(get_availability_index),
+) -> TimelineImportService:
+    """
+    Imports commit chunk by chunk, so the service opens its own transactions
+    instead of using the request-scoped session.
+    """
+
+    @asynccontextmanager
+    async def open_unit():
+        async with db_manager.get_connection() as session:
+            async with db_manager.transaction(session) as tx_session:
+                # Keeps this worker's availability index current without a full reload
+                yield SQLEventRepository(tx_session, availability_index)
+
+    return TimelineImportService(open_unit, resource_registry)
+
+
+def get_conflict_export_service(
+        open_session=Depends(get_stream_session),
+) -> Callable[[], AsyncContextManager[ConflictReportService]]:
+    @asynccontextmanager
+    async def open_service():
+        async with open_session() as session:
+            yield ConflictReportService(SQLEventRepository(session))
+
+    return open_service
@@ -1,4 +1,5 @@
 from fastapi import Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 from app.domain.exceptions.domain_exception import DomainException
@@ -8,7 +9,7 @@ async def domain_exception_handler(request: Request, exc: Exception) -> JSONResp
     if isinstance(exc, DomainException):
         return JSONResponse(
             status_code=exc.status_code,
-            content={"detail": exc.message}
+            content={"detail": exc.message, **jsonable_encoder(exc.details)}
         )
     # fallback for other exceptions
     return JSONResponse(
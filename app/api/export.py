@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, AsyncContextManager, List, Optional
+
+from fastapi.responses import StreamingResponse
+
+from app.domain.interfaces.repository import ListQuery
+
+# Rows encoded per chunk handed to the server; bounds memory and the number of ASGI sends
+CHUNK_ROWS = 500
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _encode_ndjson(rows: List[list], columns: List[str]) -> str:
+    return "".join(
+        json.dumps(dict(zip(columns, row)), separators=(",", ":"), default=str) + "\n"
+        for row in rows
+    )
+
+
+def _encode_csv(rows: List[list], columns: List[str]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+async def _encode(items: AsyncIterator[Any], columns: List[str], fmt: ExportFormat) -> AsyncIterator[str]:
+    encode = _encode_csv if fmt is ExportFormat.CSV else _encode_ndjson
+    if fmt is ExportFormat.CSV:
+        yield _encode_csv([columns], columns)
+
+    chunk = []
+    async for item in items:
+        chunk.append([_plain(getattr(item, c)) for c in columns])
+        if len(chunk) >= CHUNK_ROWS:
+            yield encode(chunk, columns)
+            chunk = []
+    if chunk:
+        yield encode(chunk, columns)
+
+
+async def export_response(
+        open_service: Callable[[], AsyncContextManager[Any]],
+        stream: Callable[[Any], AsyncIterator[Any]],
+        model: type,
+        query: ListQuery,
+        fmt: ExportFormat,
+        filename: str
+) -> StreamingResponse:
+    """
+    Streams every row `stream(service)` yields as NDJSON or CSV.
+
+    The service (and its session) is opened inside the body iterator, because the body is
+    sent after the request's dependencies have exited. The first row is fetched before the
+    response starts, so invalid filters still produce a normal error response.
+    """
+    columns = query.fields or [c.key for c in model.__table__.columns]
+
+    async def items() -> AsyncIterator[Any]:
+        async with open_service() as service:
+            async for item in stream(service):
+                yield item
+
+    rows = items()
+    first: Optional[Any] = None
+    try:
+        first = await anext(rows)
+    except StopAsyncIteration:
+        pass
+
+    async def with_first() -> AsyncIterator[Any]:
+        if first is not None:
+            yield first
+            async for item in rows:
+                yield item
+
+    return StreamingResponse(
+        _encode(with_first(), columns, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt.value}"'}
+    )
@@ -1,10 +1,43 @@
-from typing import Type, List, Any
+from typing import Type, List, Any, Optional, Dict
 
-from fastapi import APIRouter, Depends, status
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, status, Query, Request, Response, Body
+from pydantic import BaseModel, ValidationError
 
-from app.api.dependencies.service import get_generic_service_factory
+from app.api.dependencies.service import get_generic_service_factory, get_generic_export_service_factory
+from app.api.export import ExportFormat, export_response
+from app.api.pagination import page_items, build_list_query, projected_response
 from app.application.services.base_service import BaseService
+from app.domain.exceptions.domain_exception import BulkOperationException
+from app.domain.schemas.bulk import BulkResult, BulkItemError, BulkUpdateItem
+
+MAX_BULK_ITEMS = 10_000
+
+
+def _validate_items(schema: Type[BaseModel], raw_items: List[Any]) -> tuple[list, list[BulkItemError]]:
+    """
+    Validates each item on its own so one bad item doesn't reject the whole request.
+    Returns ([(index, model)], [errors]).
+    """
+    valid, errors = [], []
+    for index, raw in enumerate(raw_items):
+        try:
+            valid.append((index, schema.model_validate(raw)))
+        except ValidationError as e:
+            detail = "; ".join(
+                f"{'.'.join(str(part) for part in err['loc']) or 'item'}: {err['msg']}" for err in e.errors()
+            )
+            errors.append(BulkItemError(index=index, detail=detail))
+    return valid, errors
+
+
+def _check_atomic(atomic: bool, errors: list[BulkItemError]) -> None:
+    if atomic and errors:
+        raise BulkOperationException("Bulk request rejected: invalid items", errors=[e.model_dump() for e in errors])
+
+
+def _merge_errors(result: BulkResult, errors: list[BulkItemError]) -> BulkResult:
+    result.errors = sorted(result.errors + errors, key=lambda e: e.index)
+    return result
 
 
 def create_crud_router(
@@ -20,23 +53,88 @@ def create_crud_router(
     """
     router = APIRouter(prefix=prefix, tags=tags)
 
-    # Create the dependency specifically for this model
-    get_service = get_generic_service_factory(model_class)
+    # Create the dependencies specifically for this model
+    get_service = get_generic_service_factory(model_class, response_schema=read_schema)
+    get_read_service = get_generic_service_factory(model_class, read_only=True)
+    get_export_service = get_generic_export_service_factory(model_class)
+
+    # Bulk routes are registered before "/{id}" so "bulk" is not captured as an id
+    @router.post("/bulk", response_model=BulkResult)
+    async def bulk_create(
+            payload: List[Dict[str, Any]] = Body(..., max_length=MAX_BULK_ITEMS),
+            atomic: bool = Query(False, description="Reject the whole batch if any item fails"),
+            service: BaseService = Depends(get_service)
+    ):
+        valid, errors = _validate_items(create_schema, payload)
+        _check_atomic(atomic, errors)
+        return _merge_errors(await service.bulk_create(valid, atomic), errors)
+
+    @router.patch("/bulk", response_model=BulkResult)
+    async def bulk_update(
+            payload: List[BulkUpdateItem] = Body(..., max_length=MAX_BULK_ITEMS),
+            atomic: bool = Query(False, description="Reject the whole batch if any item fails"),
+            service: BaseService = Depends(get_service)
+    ):
+        valid, errors = _validate_items(update_schema, [item.data for item in payload])
+        _check_atomic(atomic, errors)
+        items = [(index, payload[index].id, obj_in) for index, obj_in in valid]
+        return _merge_errors(await service.bulk_update(items, atomic), errors)
+
+    @router.delete("/bulk", response_model=BulkResult)
+    async def bulk_delete(
+            ids: List[int] = Body(..., max_length=MAX_BULK_ITEMS),
+            atomic: bool = Query(False, description="Reject the whole batch if any id is missing"),
+            service: BaseService = Depends(get_service)
+    ):
+        return await service.bulk_delete(list(enumerate(ids)), atomic)
+
+    @router.get("/export")
+    async def export(
+            request: Request,
+            format: ExportFormat = Query(ExportFormat.NDJSON),
+            sort: Optional[str] = Query(None, description="Indexed fields, comma-separated; prefix '-' for descending"),
+            fields: Optional[str] = Query(None, description="Columns to export, comma-separated"),
+            open_service=Depends(get_export_service)
+    ):
+        """
+        Streams every matching row as NDJSON or CSV. Takes the same filters as the list endpoint.
+        """
+        query = build_list_query(request, sort, fields)
+        return await export_response(
+            open_service, lambda service: service.stream(query), model_class, query, format, prefix.strip("/")
+        )
 
     @router.get("/{id}", response_model=read_schema)
     async def get_one(
             id: int,
-            service: BaseService = Depends(get_service)
+            service: BaseService = Depends(get_read_service)
     ):
         return await service.get(id)
 
     @router.get("", response_model=List[read_schema])
     async def get_multi(
-            skip: int = 0,
-            limit: int = 100,
-            service: BaseService = Depends(get_service)
+            request: Request,
+            response: Response,
+            skip: Optional[int] = Query(None, ge=0, description="Legacy offset paging; omit to page by cursor"),
+            limit: int = Query(100, ge=1, le=1000),
+            cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+            sort: Optional[str] = Query(None, description="Indexed fields, comma-separated; prefix '-' for descending"),
+            fields: Optional[str] = Query(None, description="Columns to return, comma-separated"),
+            service: BaseService = Depends(get_read_service)
     ):
-        return await service.get_multi(skip, limit)
+        """
+        Lists resources. Any other query parameter naming an indexed column is an
+        equality filter (repeat it for IN), e.g. `?site=NORTH&black_num=3`.
+        """
+        query = build_list_query(request, sort, fields)
+        if skip is not None:
+            items = await service.get_multi(skip, limit, query)
+        else:
+            items = page_items(await service.get_page(limit, cursor, query), response)
+
+        if query.fields is not None:
+            return projected_response(items, query.fields, response)
+        return items
 
     @router.post("", response_model=read_schema, status_code=status.HTTP_201_CREATED)
     async def create(
@@ -51,7 +149,7 @@ def create_crud_router(
             payload: update_schema,
             service: BaseService = Depends(get_service)
     ):
-        return await service.update(id, payload)
+        return await service.update_by_id(id, payload)
 
     @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
     async def delete(
@@ -1,12 +1,19 @@
-from typing import Type
+from typing import Type, Optional
 
-from fastapi import APIRouter, Depends, status, Path
+from fastapi import APIRouter, Depends, status, Path, Query, Request
 from pydantic import BaseModel
 
-from app.api.dependencies.service import get_mission_service, get_mission_event_service
+from app.api.dependencies.registry import get_resource_registry
+from app.api.dependencies.service import (
+    get_mission_service, get_mission_event_service, get_mission_event_export_service, get_timeline_import_service
+)
+from app.api.export import ExportFormat, export_response
+from app.api.pagination import build_list_query
 from app.application.services.mission_event_service import MissionEventService
 from app.application.services.mission_service import MissionService
+from app.application.services.timeline_import_service import TimelineImportService, read_rows, DEFAULT_CHUNK_SIZE
 from app.domain.schemas.enums import ResourceType
+from app.domain.schemas.imports import ImportFormat, ImportReport
 
 
 def register_mission_resource_routes(
@@ -39,6 +46,45 @@ def register_mission_resource_routes(
             auto_fix=payload.auto_fix_gaps
         )
 
+    # --- Export of this event table (all missions) ---
+    @router.get(f"/{slug}/export")
+    async def export_events(
+            request: Request,
+            format: ExportFormat = Query(ExportFormat.NDJSON),
+            sort: Optional[str] = Query(None, description="Indexed fields, comma-separated; prefix '-' for descending"),
+            fields: Optional[str] = Query(None, description="Columns to export, comma-separated"),
+            open_service=Depends(get_mission_event_export_service),
+            resource_registry=Depends(get_resource_registry)
+    ):
+        """
+        Streams every event as NDJSON or CSV. Indexed columns filter, e.g. `?mission_id=3`.
+        """
+        query = build_list_query(request, sort, fields)
+        return await export_response(
+            open_service,
+            lambda service: service.stream_events(resource_type, query),
+            resource_registry.get(resource_type).event_model,
+            query,
+            format,
+            f"mission_{slug}"
+        )
+
+    # --- Bulk import into this event table (all missions) ---
+    @router.post(f"/{slug}/import", response_model=ImportReport)
+    async def import_events(
+            request: Request,
+            format: ImportFormat = Query(ImportFormat.NDJSON),
+            chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=100_000, description="Rows per transaction"),
+            service: TimelineImportService = Depends(get_timeline_import_service)
+    ):
+        """
+        Backfills events from an NDJSON or CSV request body (one event per row, with mission_id).
+        The body is read as it arrives; every chunk is committed separately, and rejected
+        rows are reported with their row number instead of failing the import.
+        """
+        service.chunk_size = chunk_size
+        return await service.import_events(resource_type, read_rows(request.stream(), format))
+
     # --- B. Real-Time Switch ---
     @router.post(f"/{{id}}/{slug}/switch", status_code=status.HTTP_200_OK)
     async def switch_resource(
@@ -0,0 +1,55 @@
+from typing import Optional, Sequence
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.domain.interfaces.repository import Page, ListQuery
+
+# Keyset-paginated list endpoints return the token for the following page here
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Query parameters of list endpoints that are not column filters; "_" is the usual cache buster
+RESERVED_PARAMS = {"skip", "limit", "cursor", "sort", "fields", "format", "_"}
+
+
+def page_items(page: Page, response: Response) -> list:
+    """
+    Exposes the page's next_cursor as a response header and returns its items as the body.
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+
+def _split(value: Optional[str]) -> list[str]:
+    return [part.strip() for part in value.split(",") if part.strip()] if value else []
+
+
+def build_list_query(request: Request, sort: Optional[str], fields: Optional[str]) -> ListQuery:
+    """
+    Builds a ListQuery from the request.
+    Every non-reserved query parameter is a filter (`?site=NORTH&site=SOUTH` means IN);
+    `sort=-name,num` sorts descending by name, then by num; `fields=num,name` projects columns.
+    The repository validates the names against the model's indexed columns, so a misspelt
+    filter is rejected instead of silently listing the whole table.
+    """
+    filters = {
+        key: request.query_params.getlist(key)
+        for key in request.query_params.keys()
+        if key not in RESERVED_PARAMS
+    }
+    sort_keys = [(key.lstrip("-"), key.startswith("-")) for key in _split(sort)]
+    return ListQuery(filters=filters, sort=sort_keys, fields=_split(fields) or None)
+
+
+def projected_response(items: Sequence, fields: list[str], response: Response) -> JSONResponse:
+    """
+    Serializes only the requested columns. Projected rows don't satisfy the full
+    read schema, so they bypass response_model validation.
+    """
+    rows = [{f: getattr(item, f) for f in fields} for item in items]
+    headers = None
+    if NEXT_CURSOR_HEADER in response.headers:
+        headers = {NEXT_CURSOR_HEADER: response.headers[NEXT_CURSOR_HEADER]}
+    return JSONResponse(jsonable_encoder(rows), headers=headers)
@@ -0,0 +1,42 @@
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def schema_adapter(schema: Any) -> TypeAdapter:
+    """One TypeAdapter per response schema (e.g. MissionRead, List[MissionSummary]); building one is costly."""
+    return TypeAdapter(schema)
+
+
+def dump_schema_json(content: Any, schema: Any) -> bytes:
+    """
+    Reads `content` (ORM objects, dicts or schema instances) into `schema` once, by attribute,
+    and serializes the result straight to JSON bytes.
+    """
+    adapter = schema_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True), by_alias=True)
+
+
+class SchemaResponse(Response):
+    """
+    Fast path for large read responses.
+
+    Returning a plain object makes FastAPI validate it against response_model, dump it to
+    JSON-compatible Python objects, then encode those with json.dumps. This response does a single
+    validation and dumps to bytes in pydantic-core. FastAPI passes Response instances through
+    untouched, so routes keep response_model for the OpenAPI schema, and headers set on an
+    injected Response must be passed here instead.
+    """
+    media_type = "application/json"
+
+    def __init__(
+            self,
+            content: Any,
+            schema: Any,
+            status_code: int = 200,
+            headers: Optional[Mapping[str, str]] = None
+    ):
+        super().__init__(dump_schema_json(content, schema), status_code=status_code, headers=headers)
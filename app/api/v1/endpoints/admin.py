@@ -0,0 +1,23 @@
+from typing import Dict, List
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.dependencies.db import get_db_manager
+from app.db.base_manager import AbstractDBManager, PoolStats, SlowQuery
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/db/pool", response_model=Dict[str, PoolStats])
+async def get_pool_stats(
+        db_manager: AbstractDBManager = Depends(get_db_manager)
+):
+    return db_manager.pool_stats()
+
+
+@router.get("/db/slow-queries", response_model=List[SlowQuery])
+async def get_slow_queries(
+        limit: int = Query(50, ge=1, le=1000),
+        db_manager: AbstractDBManager = Depends(get_db_manager)
+):
+    return db_manager.slow_queries()[:limit]
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.dependencies.service import get_mission_timeline_service
+from app.application.services.mission_timeline_service import MissionTimelineService
+from app.domain.schemas.enums import ResourceType
+from app.domain.schemas.events import ActiveAssignments
+
+router = APIRouter(prefix="/assignments", tags=["Assignments"])
+
+
+@router.get("/active", response_model=ActiveAssignments)
+async def get_active_assignments(
+        types: List[ResourceType] = Query([], description="Repeat for several; all types when omitted"),
+        at: Optional[datetime] = Query(None, description="Defaults to now"),
+        service: MissionTimelineService = Depends(get_mission_timeline_service)
+):
+    """
+    Fleet-wide snapshot: the mission each station, crawler, platform, RT and operator is active in,
+    read from the open events (end_time IS NULL) of every event table.
+    """
+    return await service.get_active_assignments(list(dict.fromkeys(types)) or list(ResourceType), at)
@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.dependencies.service import get_mission_timeline_service
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.api.serialization import SchemaResponse
+from app.application.services.mission_timeline_service import MissionTimelineService
+from app.domain.interfaces.repository import ResourceFilter
+from app.domain.schemas.enums import ResourceType, Sites
+from app.domain.schemas.resources import RESOURCE_READ_SCHEMAS
+
+router = APIRouter(prefix="/availability", tags=["Availability"])
+
+
+@router.get("/{resource_type}", response_model=List[Union[tuple(RESOURCE_READ_SCHEMAS.values())]])
+async def get_available_resources(
+        resource_type: ResourceType,
+        start: datetime = Query(..., alias="from", description="Period start (inclusive)"),
+        end: datetime = Query(..., alias="to", description="Period end (exclusive)"),
+        site: List[Sites] = Query([], description="Repeat for several; stations and crawlers only"),
+        black_num: List[int] = Query([], description="Repeat for several; stations and crawlers only"),
+        limit: int = Query(100, ge=1, le=1000),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+        service: MissionTimelineService = Depends(get_mission_timeline_service)
+):
+    """
+    Resources of the type with no event overlapping [from, to) in any mission (an open event
+    overlaps everything after its start), ordered by primary key.
+    """
+    filters = ResourceFilter(sites=site, black_nums=black_num)
+    page = await service.find_available(resource_type, start, end, filters, limit, cursor)
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+    return SchemaResponse(page.items, List[RESOURCE_READ_SCHEMAS[resource_type]], headers=headers)
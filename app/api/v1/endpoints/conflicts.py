@@ -0,0 +1,67 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.dependencies.service import get_conflict_export_service, get_conflict_report_service
+from app.api.export import ExportFormat, export_response
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.api.serialization import SchemaResponse
+from app.application.services.conflict_report_service import ConflictReportService
+from app.domain.interfaces.repository import ListQuery, Page
+from app.domain.schemas.conflicts import EventConflict, ResourceConflictSummary
+from app.domain.schemas.enums import ResourceType
+
+router = APIRouter(prefix="/conflicts", tags=["Conflicts"])
+
+
+def _page_response(page: Page, schema) -> SchemaResponse:
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+    return SchemaResponse(page.items, schema, headers=headers)
+
+
+@router.get("/{resource_type}", response_model=List[EventConflict])
+async def list_conflicts(
+        resource_type: ResourceType,
+        limit: int = Query(100, ge=1, le=1000),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+        service: ConflictReportService = Depends(get_conflict_report_service)
+):
+    """
+    Events overlapping an event of the same resource in another mission (double bookings),
+    ordered by resource then start_time. Both sides of every overlap are listed.
+    """
+    return _page_response(await service.get_conflicts(resource_type, limit, cursor), List[EventConflict])
+
+
+@router.get("/{resource_type}/summary", response_model=List[ResourceConflictSummary])
+async def list_conflict_summaries(
+        resource_type: ResourceType,
+        limit: int = Query(100, ge=1, le=1000),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+        service: ConflictReportService = Depends(get_conflict_report_service)
+):
+    """
+    One row per double-booked resource: how many of its events overlap and across how many missions.
+    """
+    page = await service.get_summaries(resource_type, limit, cursor)
+    return _page_response(page, List[ResourceConflictSummary])
+
+
+@router.get("/{resource_type}/export")
+async def export_conflicts(
+        resource_type: ResourceType,
+        format: ExportFormat = Query(ExportFormat.NDJSON),
+        open_service=Depends(get_conflict_export_service)
+):
+    """
+    Streams every conflicting event as NDJSON or CSV, in the order of the listing.
+    """
+    query = ListQuery(fields=list(EventConflict.model_fields))
+    return await export_response(
+        open_service,
+        lambda service: service.stream_conflicts(resource_type),
+        EventConflict,
+        query,
+        format,
+        f"{resource_type.value}_conflicts"
+    )
@@ -1,11 +1,23 @@
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+from typing import Optional, List
 
-from app.api.dependencies.service import get_mission_service
+from fastapi import APIRouter, Depends, status, Query, Request, Response, Header
+
+from app.api.dependencies.service import (
+    get_mission_service, get_mission_read_service, get_mission_export_service, get_mission_timeline_service
+)
+from app.api.etag import version_etag, etag_matches
+from app.api.export import ExportFormat, export_response
 from app.api.factories.mission_router_factory import register_mission_resource_routes
 from app.application.services.mission_service import MissionService
+from app.application.services.mission_timeline_service import MissionTimelineService
+from app.api.pagination import build_list_query, page_items
+from app.api.serialization import SchemaResponse
+from app.db.sql.models.mission import Mission
+from app.domain.interfaces.repository import MissionFilter
 from app.domain.schemas import events as event_schemas
 from app.domain.schemas import mission as mission_schemas
-from app.domain.schemas.enums import ResourceType
+from app.domain.schemas.enums import ResourceType, MissionStatuses, Sections, MissionTypes, MissionOrigins
 
 router = APIRouter(prefix="/missions", tags=["Missions"])
 
@@ -18,12 +30,91 @@ async def create_mission(
     return await service.create(payload)
 
 
-@router.get("/{id}", response_model=mission_schemas.MissionRead)
+@router.get("", response_model=List[mission_schemas.MissionSummary])
+async def list_missions(
+        response: Response,
+        status: List[MissionStatuses] = Query([], description="Repeat for several"),
+        section: List[Sections] = Query([], description="Repeat for several"),
+        type: List[MissionTypes] = Query([], description="Repeat for several"),
+        origin: List[MissionOrigins] = Query([], description="Repeat for several"),
+        scheduled_from: Optional[datetime] = Query(None, description="scheduled_start_time >= this"),
+        scheduled_to: Optional[datetime] = Query(None, description="scheduled_start_time < this"),
+        descending: bool = Query(False, description="Latest scheduled_start_time first"),
+        limit: int = Query(100, ge=1, le=1000),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+        service: MissionService = Depends(get_mission_read_service)
+):
+    """
+    Lists missions without their timelines, ordered by scheduled_start_time.
+    Use GET /missions/{id} for a mission's full timeline.
+    """
+    filters = MissionFilter(
+        statuses=status, sections=section, types=type, origins=origin,
+        start_from=scheduled_from, start_to=scheduled_to
+    )
+    return page_items(await service.list_summaries(filters, limit, cursor, descending), response)
+
+
+@router.get("/export")
+async def export_missions(
+        request: Request,
+        format: ExportFormat = Query(ExportFormat.NDJSON),
+        sort: Optional[str] = Query(None, description="Indexed fields, comma-separated; prefix '-' for descending"),
+        fields: Optional[str] = Query(None, description="Columns to export, comma-separated"),
+        open_service=Depends(get_mission_export_service)
+):
+    """
+    Streams every mission row (without its timelines) as NDJSON or CSV.
+    """
+    query = build_list_query(request, sort, fields)
+    return await export_response(
+        open_service, lambda service: service.stream(query), Mission, query, format, "missions"
+    )
+
+
+@router.get(
+    "/{id}",
+    response_model=mission_schemas.MissionRead,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Unchanged since the If-None-Match ETag"}}
+)
 async def get_mission(
         id: int,
-        service: MissionService = Depends(get_mission_service)
+        if_none_match: Optional[str] = Header(None),
+        service: MissionService = Depends(get_mission_read_service)
+):
+    """
+    The ETag is the mission's version, bumped by every timeline write and by every edit or delete
+    of a resource the response serializes (stations, their blacks, operators and their roles, ...).
+    Pollers sending it back in If-None-Match get a 304 after a primary key lookup of the version.
+    """
+    if if_none_match:
+        etag = version_etag(await service.get_version(id))
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    mission = await service.get_full_timeline(id)
+    return SchemaResponse(mission, mission_schemas.MissionRead, headers={"ETag": version_etag(mission.version)})
+
+
+@router.get("/{id}/timeline", response_model=mission_schemas.MissionTimelineWindow)
+async def get_mission_timeline_window(
+        id: int,
+        start: datetime = Query(..., alias="from", description="Window start (inclusive)"),
+        end: datetime = Query(..., alias="to", description="Window end (exclusive)"),
+        types: List[ResourceType] = Query([], description="Repeat for several; all types when omitted"),
+        service: MissionTimelineService = Depends(get_mission_timeline_service)
 ):
-    return await service.get_full_timeline(id)
+    """
+    Returns only the mission's events intersecting [from, to), including events still open.
+    """
+    resource_types = list(dict.fromkeys(types)) or list(ResourceType)
+    windows = await service.get_window(id, start, end, resource_types)
+    return SchemaResponse({
+        "mission_id": id,
+        "window_start": start,
+        "window_end": end,
+        **{mission_schemas.TIMELINE_FIELDS[rt]: events for rt, events in windows.items()}
+    }, mission_schemas.MissionTimelineWindow)
 
 
 resources_config = [
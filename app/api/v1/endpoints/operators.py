@@ -1,9 +1,14 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Query, Response, Request
 
-from app.api.dependencies.service import get_operator_service
+from app.api.dependencies.service import (
+    get_operator_service, get_operator_read_service, get_generic_export_service_factory
+)
+from app.api.export import ExportFormat, export_response
+from app.api.pagination import page_items, build_list_query
 from app.application.services.operator_service import OperatorService
+from app.db.sql.models.operator import Operator
 from app.domain.schemas import resources as schemas
 
 router = APIRouter(prefix="/operators", tags=["Operators"])
@@ -19,16 +24,38 @@ async def create_operator(
 
 @router.get("", response_model=List[schemas.OperatorRead])
 async def get_operators(
-        skip: int = 0, limit: int = 100,
-        service: OperatorService = Depends(get_operator_service)
+        response: Response,
+        skip: Optional[int] = Query(None, ge=0, description="Legacy offset paging; omit to page by cursor"),
+        limit: int = Query(100, ge=1, le=1000),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+        service: OperatorService = Depends(get_operator_read_service)
 ):
-    return await service.get_multi(skip, limit)
+    if skip is not None:
+        return await service.get_multi(skip, limit)
+    return page_items(await service.get_page(limit, cursor), response)
+
+
+@router.get("/export")
+async def export_operators(
+        request: Request,
+        format: ExportFormat = Query(ExportFormat.NDJSON),
+        sort: Optional[str] = Query(None, description="Indexed fields, comma-separated; prefix '-' for descending"),
+        fields: Optional[str] = Query(None, description="Columns to export, comma-separated"),
+        open_service=Depends(get_generic_export_service_factory(Operator))
+):
+    """
+    Streams every operator row (without roles) as NDJSON or CSV.
+    """
+    query = build_list_query(request, sort, fields)
+    return await export_response(
+        open_service, lambda service: service.stream(query), Operator, query, format, "operators"
+    )
 
 
 @router.get("/{id}", response_model=schemas.OperatorRead)
 async def get_operator(
         id: int,
-        service: OperatorService = Depends(get_operator_service)
+        service: OperatorService = Depends(get_operator_read_service)
 ):
     return await service.get(id)
 
@@ -1,9 +1,10 @@
-from typing import List, Any
+from typing import List, Any, AsyncIterator
 
 from pydantic import BaseModel
 
 from app.domain.exceptions.domain_exception import NotFoundException
-from app.domain.interfaces.repository import IRepository
+from app.domain.interfaces.repository import IRepository, Page, ListQuery
+from app.domain.schemas.bulk import BulkResult
 
 
 class BaseService[T, CreateSchema: BaseModel, UpdateSchema: BaseModel]:
@@ -25,11 +26,28 @@ class BaseService[T, CreateSchema: BaseModel, UpdateSchema: BaseModel]:
             raise NotFoundException(f"Resource with id {id} not found")
         return item
 
-    async def get_multi(self, skip: int = 0, limit: int = 100) -> List[T]:
+    async def get_multi(self, skip: int = 0, limit: int = 100, query: ListQuery | None = None) -> List[T]:
         """
         Fetches a list of resources.
         """
-        return await self.repository.get_multi(skip, limit)
+        return await self.repository.get_multi(skip, limit, query)
+
+    async def get_page(
+            self,
+            limit: int = 100,
+            cursor: str | None = None,
+            query: ListQuery | None = None
+    ) -> Page[T]:
+        """
+        Fetches one keyset-paginated page of resources.
+        """
+        return await self.repository.get_page(limit, cursor, query)
+
+    def stream(self, query: ListQuery | None = None, batch_size: int = 1000) -> AsyncIterator[T]:
+        """
+        Iterates over all matching resources in batches, for exports.
+        """
+        return self.repository.stream(query, batch_size)
 
     async def create(self, obj_in: CreateSchema) -> T:
         """
@@ -60,9 +78,42 @@ class BaseService[T, CreateSchema: BaseModel, UpdateSchema: BaseModel]:
         # The generic SQLAlchemyRepository knows how to call .model_dump() on it.
         return await self.repository.update(current, obj_in)
 
+    async def update_by_id(self, id: Any, obj_in: UpdateSchema) -> T:
+        """
+        Partial update in a single UPDATE ... RETURNING (no fetch first).
+        Only for plain column updates; services with relationship payloads keep using update().
+        """
+        item = await self.repository.update_by_id(id, obj_in.model_dump(exclude_unset=True))
+        if not item:
+            raise NotFoundException(f"Resource with id {id} not found")
+        return item
+
     async def delete(self, id: Any) -> bool:
         """
         Deletes a resource.
+        The repository reports whether a row was deleted, so no existence check is needed first.
+        """
+        if not await self.repository.delete(id):
+            raise NotFoundException(f"Resource with id {id} not found")
+        return True
+
+    async def bulk_create(self, items: List[tuple[int, CreateSchema]], atomic: bool = False) -> BulkResult:
+        """
+        Creates many resources in one statement.
+        Items are (index in request, schema) pairs so errors can point back at the input.
+        """
+        objs = [(index, self.model.model_validate(obj_in)) for index, obj_in in items]
+        return await self.repository.bulk_create(objs, atomic)
+
+    async def bulk_update(self, items: List[tuple[int, Any, UpdateSchema]], atomic: bool = False) -> BulkResult:
+        """
+        Applies partial updates to many resources. Items are (index, id, schema) triples.
+        """
+        rows = [(index, id, obj_in.model_dump(exclude_unset=True)) for index, id, obj_in in items]
+        return await self.repository.bulk_update(rows, atomic)
+
+    async def bulk_delete(self, items: List[tuple[int, Any]], atomic: bool = False) -> BulkResult:
+        """
+        Deletes many resources. Items are (index, id) pairs.
         """
-        await self.get(id)  # Check existence first
-        return await self.repository.delete(id)
+        return await self.repository.bulk_delete(items, atomic)
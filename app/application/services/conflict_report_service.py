@@ -0,0 +1,71 @@
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+from app.domain.interfaces.repository import IEventRepository, Page
+from app.domain.schemas.conflicts import ConflictReport, EventConflict, ResourceConflictSummary
+from app.domain.schemas.enums import ResourceType
+
+
+def _summarize(resource_id: int, conflicts: List[EventConflict]) -> ResourceConflictSummary:
+    return ResourceConflictSummary(
+        resource_id=resource_id,
+        events=len(conflicts),
+        missions=len({c.mission_id for c in conflicts}),
+        first_start=conflicts[0].start_time,
+        last_start=conflicts[-1].start_time
+    )
+
+
+class ConflictReportService:
+    """
+    Double bookings across missions (legacy data, direct database edits): events of a resource
+    overlapping an event of the same resource in another mission. Each event table is scanned in one
+    windowed pass inside the database rather than mission by mission.
+    """
+
+    def __init__(self, event_repository: IEventRepository):
+        self.event_repo = event_repository
+
+    async def get_conflicts(self, resource_type: ResourceType, limit: int = 100, cursor: str | None = None) -> Page:
+        """
+        A page of the conflicting events, ordered by resource then start_time.
+        """
+        return await self.event_repo.get_conflict_page(resource_type, limit, cursor)
+
+    async def get_summaries(self, resource_type: ResourceType, limit: int = 100, cursor: str | None = None) -> Page:
+        """
+        A page of per-resource conflict counts, ordered by resource.
+        """
+        return await self.event_repo.get_conflict_summary_page(resource_type, limit, cursor)
+
+    def stream_conflicts(self, resource_type: ResourceType, batch_size: int = 1000) -> AsyncIterator[Any]:
+        """
+        Iterates over every conflicting event of one resource type, for exports.
+        """
+        return self.event_repo.stream_conflicts(resource_type, batch_size)
+
+    async def scan(
+            self,
+            resource_types: List[ResourceType],
+            on_conflict: Optional[Callable[[ResourceType, EventConflict], None]] = None
+    ) -> ConflictReport:
+        """
+        Streams the conflicts of each type once, passing every event to `on_conflict`, and
+        summarizes them per resource as they arrive (rows come grouped by resource).
+        """
+        report = ConflictReport()
+        for resource_type in resource_types:
+            summaries = []
+            current: List[EventConflict] = []
+            async for row in self.event_repo.stream_conflicts(resource_type):
+                conflict = EventConflict.model_validate(row)
+                if current and current[-1].resource_id != conflict.resource_id:
+                    summaries.append(_summarize(current[-1].resource_id, current))
+                    current = []
+                current.append(conflict)
+                report.events += 1
+                if on_conflict:
+                    on_conflict(resource_type, conflict)
+            if current:
+                summaries.append(_summarize(current[-1].resource_id, current))
+            report.resources[resource_type] = summaries
+        return report
@@ -1,13 +1,18 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, Type
+from typing import Any, Dict, Type, AsyncIterator
 
 from pydantic import BaseModel
 
-from app.domain.exceptions.domain_exception import NotFoundException, ResourceUnavailableException
-from app.domain.interfaces.repository import IEventRepository
+from app.domain.exceptions.domain_exception import (
+    InvalidTimeRangeException,
+    NotFoundException,
+    ResourceUnavailableException
+)
+from app.domain.interfaces.repository import IEventRepository, ListQuery
 from app.domain.interfaces.repository import IMissionRepository
 from app.domain.interfaces.resource_registry import ResourceRegistry
 from app.domain.schemas.enums import ResourceType
+from app.domain.schemas.events import ends_after_start
 
 
 class MissionEventService:
@@ -56,18 +61,19 @@ class MissionEventService:
             if current_resource_id == new_resource_id:
                 return active_event
 
-        # 5. Availability Check
-        # Ensure max time is UTC aware to match 'now'
-        max_time = datetime.max.replace(tzinfo=timezone.utc)
-        conflicts = await self.mission_repo.check_resource_availability(
-            resource_type=resource_type,
-            resource_id=new_resource_id,
-            start=now,
-            end=max_time,
-            exclude_mission_id=mission_id
-        )
-        if conflicts:
-            raise ResourceUnavailableException(f"Resource {new_resource_id} is currently in use.")
+        # 5. Availability Check (the database's own on PostgreSQL when configured so)
+        if not self.mission_repo.enforces_availability:
+            # Ensure max time is UTC aware to match 'now'
+            max_time = datetime.max.replace(tzinfo=timezone.utc)
+            conflicts = await self.mission_repo.check_resource_availability(
+                resource_type=resource_type,
+                resource_id=new_resource_id,
+                start=now,
+                end=max_time,
+                exclude_mission_id=mission_id
+            )
+            if conflicts:
+                raise ResourceUnavailableException(f"Resource {new_resource_id} is currently in use.")
 
         # 6. Close old event
         if active_event:
@@ -81,7 +87,9 @@ class MissionEventService:
         data_dict["end_time"] = None
 
         new_event_obj = meta.event_model(**data_dict)
-        return await self.event_repo.create(resource_type, new_event_obj)
+        new_event = await self.event_repo.create(resource_type, new_event_obj)
+        await self.mission_repo.bump_version(mission_id)
+        return new_event
 
     async def create_event(
             self,
@@ -99,24 +107,27 @@ class MissionEventService:
         start_time = getattr(event_data, "start_time")
         end_time = getattr(event_data, "end_time", None)
 
-        # Ensure max time is UTC aware
-        max_time = datetime.max.replace(tzinfo=timezone.utc)
-        conflicts = await self.mission_repo.check_resource_availability(
-            resource_type=resource_type,
-            resource_id=new_resource_id,
-            start=start_time,
-            end=end_time or max_time,
-            exclude_mission_id=mission_id
-        )
-        if conflicts:
-            raise ResourceUnavailableException(f"Resource {new_resource_id} is busy during the requested time.")
+        if not self.mission_repo.enforces_availability:
+            # Ensure max time is UTC aware
+            max_time = datetime.max.replace(tzinfo=timezone.utc)
+            conflicts = await self.mission_repo.check_resource_availability(
+                resource_type=resource_type,
+                resource_id=new_resource_id,
+                start=start_time,
+                end=end_time or max_time,
+                exclude_mission_id=mission_id
+            )
+            if conflicts:
+                raise ResourceUnavailableException(f"Resource {new_resource_id} is busy during the requested time.")
 
         # 2. Create
         data_dict = event_data.model_dump()
         data_dict["mission_id"] = mission_id
 
         new_event_obj = meta.event_model(**data_dict)
-        return await self.event_repo.create(resource_type, new_event_obj)
+        new_event = await self.event_repo.create(resource_type, new_event_obj)
+        await self.mission_repo.bump_version(mission_id)
+        return new_event
 
     async def update_event(
             self,
@@ -127,13 +138,35 @@ class MissionEventService:
         """
         Updates a specific event by ID.
         """
-        # 1. Get existing
-        event = await self.event_repo.get_by_id(resource_type, event_id)
+        # The database would reject an inverted range with a data error (tstzrange), or store it (SQLite)
+        if update_data.keys() & {"start_time", "end_time"}:
+            start_time, end_time = update_data.get("start_time"), update_data.get("end_time")
+            if "start_time" not in update_data or "end_time" not in update_data:
+                current = await self.event_repo.get_by_id(resource_type, event_id)
+                if not current:
+                    raise NotFoundException(f"Event {event_id} not found")
+                start_time = update_data.get("start_time", current.start_time)
+                end_time = update_data.get("end_time", current.end_time)
+            if start_time is not None and not ends_after_start(start_time, end_time):
+                raise InvalidTimeRangeException()
+
+        # Single UPDATE ... RETURNING; no row back means the event does not exist
+        event = await self.event_repo.update_by_id(resource_type, event_id, update_data)
         if not event:
             raise NotFoundException(f"Event {event_id} not found")
+        await self.mission_repo.bump_version(event.mission_id)
+        return event
 
-        # 2. Update
-        return await self.event_repo.update(resource_type, event, update_data)
+    def stream_events(
+            self,
+            resource_type: ResourceType,
+            query: ListQuery | None = None,
+            batch_size: int = 1000
+    ) -> AsyncIterator[Any]:
+        """
+        Iterates over every event of one resource type (across missions), for exports.
+        """
+        return self.event_repo.stream(resource_type, query, batch_size)
 
     async def delete_event(
             self,
@@ -143,7 +176,8 @@ class MissionEventService:
         """
         Deletes a specific event by ID.
         """
-        success = await self.event_repo.delete(resource_type, event_id)
-        if not success:
+        mission_id = await self.event_repo.delete_returning_mission(resource_type, event_id)
+        if mission_id is None:
             raise NotFoundException(f"Event {event_id} not found")
+        await self.mission_repo.bump_version(mission_id)
         return True
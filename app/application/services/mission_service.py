@@ -4,8 +4,8 @@ from typing import List, Any, Type
 from app.application.services.base_service import BaseService
 from app.application.services.timeline_calculator import TimelineCalculator
 from app.db.sql.models.mission import Mission
-from app.domain.exceptions.domain_exception import ResourceUnavailableException, DomainException
-from app.domain.interfaces.repository import IMissionRepository
+from app.domain.exceptions.domain_exception import ResourceUnavailableException, DomainException, NotFoundException
+from app.domain.interfaces.repository import IMissionRepository, MissionLoadProfile, MissionFilter, Page
 from app.domain.interfaces.resource_registry import ResourceRegistry
 from app.domain.schemas.enums import ResourceType
 from app.domain.schemas.mission import MissionCreate, MissionUpdate
@@ -24,7 +24,90 @@ class MissionService(BaseService[Mission, MissionCreate, MissionUpdate]):
         self.resource_registry = resource_registry
 
     async def get_full_timeline(self, mission_id: int) -> Mission:
-        return await self.get(mission_id)
+        return await self._get_with_profile(mission_id, MissionLoadProfile.FULL)
+
+    async def get_version(self, mission_id: int) -> int:
+        version = await self.mission_repo.get_version(mission_id)
+        if version is None:
+            raise NotFoundException(f"Resource with id {mission_id} not found")
+        return version
+
+    async def list_summaries(
+            self,
+            filters: MissionFilter,
+            limit: int = 100,
+            cursor: str | None = None,
+            descending: bool = False
+    ) -> Page[Mission]:
+        return await self.mission_repo.get_summary_page(filters, limit, cursor, descending)
+
+    async def _get_with_profile(
+            self,
+            mission_id: int,
+            profile: MissionLoadProfile,
+            resource_type: ResourceType | None = None
+    ) -> Mission:
+        mission = await self.mission_repo.get_with_profile(mission_id, profile, resource_type)
+        if not mission:
+            raise NotFoundException(f"Resource with id {mission_id} not found")
+        return mission
+
+    async def _check_timeline_availability(
+            self,
+            mission_id: int,
+            resource_type: ResourceType,
+            current_events: List[Any],
+            creates: List[Any],
+            updates: List[Any]
+    ) -> None:
+        """
+        Raises ResourceUnavailableException listing every create/update item that books a resource
+        another mission uses at the same time.
+        """
+        meta = self.resource_registry.get(resource_type)
+        # Every item that sets a resource or times is checked against other missions in one query;
+        # update items inherit whatever they don't change from the event they update
+        current_by_id = {event.id: event for event in current_events}
+        checked: List[tuple[str, int]] = []
+        candidates: List[tuple[Any, datetime, datetime]] = []
+        open_end = datetime.max.replace(tzinfo=timezone.utc)
+        for operation, items in (("create", creates), ("update", updates)):
+            for index, item in enumerate(items):
+                changed = item.model_fields_set & {meta.fk_field, "start_time", "end_time"}
+                current = current_by_id.get(getattr(item, "id", None))
+                if operation == "update" and (not changed or current is None):
+                    continue
+
+                res_id, start_time, end_time = (
+                    getattr(item if field in changed or current is None else current, field)
+                    for field in (meta.fk_field, "start_time", "end_time")
+                )
+                if res_id is None or start_time is None:
+                    continue
+                checked.append((operation, index))
+                candidates.append((res_id, start_time, end_time or open_end))
+
+        clashes = await self.mission_repo.find_conflicts(resource_type, candidates, exclude_mission_id=mission_id)
+        if clashes:
+            conflicts = []
+            for candidate, event in clashes:
+                operation, index = checked[candidate]
+                res_id, start_time, end_time = candidates[candidate]
+                conflicts.append({
+                    "operation": operation,
+                    "index": index,
+                    "resource_id": res_id,
+                    "start_time": start_time,
+                    "end_time": None if end_time is open_end else end_time,
+                    "conflicts_with": {
+                        "event_id": event.id,
+                        "mission_id": event.mission_id,
+                        "start_time": event.start_time,
+                        "end_time": event.end_time,
+                    },
+                })
+            busy = ", ".join(str(r) for r in dict.fromkeys(c["resource_id"] for c in conflicts))
+            raise ResourceUnavailableException(f"Resources busy in other missions: {busy}.", conflicts=conflicts)
 
     async def update_timeline(
             self,
@@ -41,7 +124,8 @@ class MissionService(BaseService[Mission, MissionCreate, MissionUpdate]):
         meta = self.resource_registry.get(resource_type)
 
         # A. Fetch Current Events for this specific resource type
-        mission = await self.get(mission_id)
+        # Only this resource's timeline is loaded; the rest of the mission graph stays untouched
+        mission = await self._get_with_profile(mission_id, MissionLoadProfile.TIMELINE, resource_type)
         attr_name = f"mission_{resource_type.value}s"
 
         if not hasattr(mission, attr_name):
@@ -50,31 +134,10 @@ class MissionService(BaseService[Mission, MissionCreate, MissionUpdate]):
         current_events = getattr(mission, attr_name, [])
 
         # B. Availability Checks
-        # Only check items that change time or resource ID
-        for item in creates + updates:
-            res_id = getattr(item, meta.fk_field, None)
-
-            # If update doesn't change resource_id, we might need to fetch the existing event to know the ID
-            # But usually, updates just shift time.
-            # If creates, we MUST check availability.
-            if res_id:
-                # Ensure strict timezone handling
-                start_time = getattr(item, "start_time")
-                end_time = getattr(item, "end_time", None)
-
-                # If end_time is None (active) or not provided, assume max time for the check
-                if end_time is None:
-                    end_time = datetime.max.replace(tzinfo=timezone.utc)
-
-                conflicts = await self.mission_repo.check_resource_availability(
-                    resource_type=resource_type,
-                    resource_id=res_id,
-                    start=start_time,
-                    end=end_time,
-                    exclude_mission_id=mission_id
-                )
-                if conflicts:
-                    raise ResourceUnavailableException(f"Resource {res_id} is busy.")
+        # Skipped where the database rejects overlapping bookings itself (PostgreSQL exclusion
+        # constraints); the batch then fails as a whole on write instead of listing each clash
+        if not self.mission_repo.enforces_availability:
+            await self._check_timeline_availability(mission_id, resource_type, current_events, creates, updates)
 
         # C. Calculator
         # Helper to convert Pydantic schema -> SQLModel
@@ -94,6 +157,7 @@ class MissionService(BaseService[Mission, MissionCreate, MissionUpdate]):
 
         # D. Bulk Update
         await self.mission_repo.bulk_update_timeline(
+            mission_id=mission_id,
             events_to_create=change_plan.to_create,
             events_to_update=change_plan.to_update,
             events_to_delete_ids=change_plan.to_delete_ids,
@@ -0,0 +1,97 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import AsyncContextManager, Callable, List
+
+from pydantic import BaseModel
+
+from app.domain.exceptions.domain_exception import InvalidQueryException, NotFoundException
+from app.domain.interfaces.repository import (
+    IEventRepository,
+    IMissionRepository,
+    IResourceRepository,
+    Page,
+    ResourceFilter
+)
+from app.domain.schemas.enums import ResourceType
+from app.domain.schemas.events import EVENT_READ_SCHEMAS, ActiveAssignments
+
+
+class MissionTimelineService:
+    """
+    Reads across event tables: windows of a mission's timelines (e.g. the 24h viewport of the UI),
+    the fleet-wide snapshot of active assignments and the resources free over a period.
+
+    Each resource type is read from its own event table, so the per-type queries
+    run concurrently, each on its own read-only session (a session runs one query at a time)
+    while the worker has sessions to spare.
+    """
+
+    def __init__(
+            self,
+            mission_repository: IMissionRepository,
+            resource_repository: IResourceRepository,
+            open_event_repo: Callable[[], AsyncContextManager[IEventRepository]]
+    ):
+        self.mission_repo = mission_repository
+        self.resource_repo = resource_repository
+        # open_event_repo yields an event repository on a session of its own, or on a shared one
+        self.open_event_repo = open_event_repo
+
+    async def get_window(
+            self,
+            mission_id: int,
+            start: datetime,
+            end: datetime,
+            resource_types: List[ResourceType]
+    ) -> dict[ResourceType, List[BaseModel]]:
+        """
+        Events of the given types intersecting [start, end), keyed by resource type.
+        """
+        if start >= end:
+            raise InvalidQueryException("'from' must be before 'to'")
+
+        async def read(resource_type: ResourceType) -> List[BaseModel]:
+            schema = EVENT_READ_SCHEMAS[resource_type]
+            async with self.open_event_repo() as repo:
+                events = await repo.get_window(resource_type, mission_id, start, end)
+                # Serialized before the session closes: closing it expires the loaded rows
+                return [schema.model_validate(event) for event in events]
+
+        # First, alone: reads that find no free session share the mission repository's
+        if not await self.mission_repo.get(mission_id):
+            raise NotFoundException(f"Resource with id {mission_id} not found")
+        windows = await asyncio.gather(*(read(resource_type) for resource_type in resource_types))
+        return dict(zip(resource_types, windows))
+
+    async def get_active_assignments(
+            self,
+            resource_types: List[ResourceType],
+            at: datetime | None = None
+    ) -> ActiveAssignments:
+        """
+        Which mission each resource of the given types is active in right now (or at `at`).
+        """
+        at = at or datetime.now(timezone.utc)
+
+        async def read(resource_type: ResourceType) -> dict:
+            async with self.open_event_repo() as repo:
+                return await repo.get_active_assignments(resource_type, at)
+
+        snapshots = await asyncio.gather(*(read(resource_type) for resource_type in resource_types))
+        return ActiveAssignments(at=at, assignments=dict(zip(resource_types, snapshots)))
+
+    async def find_available(
+            self,
+            resource_type: ResourceType,
+            start: datetime,
+            end: datetime,
+            filters: ResourceFilter,
+            limit: int = 100,
+            cursor: str | None = None
+    ) -> Page:
+        """
+        Resources of the type that no mission uses during [start, end).
+        """
+        if start >= end:
+            raise InvalidQueryException("'from' must be before 'to'")
+        return await self.resource_repo.find_available(resource_type, start, end, filters, limit, cursor)
@@ -10,14 +10,18 @@ class OperatorService(BaseService[Operator, OperatorCreate, OperatorUpdate]):
     Service for managing Operators.
 
     Why is this needed?
-    Because 'OperatorCreate' contains 'role_ids' (List[int]), but the 'Operator'
-    DB model expects 'roles' (List[Role]).
+    Because 'OperatorCreate' contains 'roles' (List[int] of role ids), but the 'Operator'
+    DB model expects 'roles' (List[OperatorRole] link rows).
 
-    The BaseService logic would try to do Operator(**role_ids=[...]) which would fail.
+    The BaseService logic would try to do Operator.model_validate(roles=[...]) which would fail.
     The SQLOperatorRepository overrides create/update to handle this logic,
-    so we just need to type-hint the repository correctly here.
+    so create hands it the schema as-is.
     """
 
     def __init__(self, repository: SQLOperatorRepository):
         super().__init__(repository)
         self.repository = repository
+
+    async def create(self, obj_in: OperatorCreate) -> Operator:
+        # The repository builds the Operator and its role links from the schema itself
+        return await self.repository.create(obj_in)
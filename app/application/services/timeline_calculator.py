@@ -2,7 +2,12 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import List, Any, Callable, Optional, Protocol
 
-from app.domain.exceptions.domain_exception import TimelineConflictException, NotFoundException
+from app.domain.exceptions.domain_exception import (
+    InvalidTimeRangeException,
+    NotFoundException,
+    TimelineConflictException
+)
+from app.domain.schemas.events import ends_after_start
 
 
 class TimelineEventProtocol(Protocol):
@@ -69,6 +74,9 @@ class TimelineCalculator:
                 if hasattr(target, k):
                     setattr(target, k, v)
 
+            if not ends_after_start(target.start_time, target.end_time):
+                raise InvalidTimeRangeException(f"Event {update.id}: end_time must be after start_time")
+
             if target not in plan.to_update:
                 plan.to_update.append(target)
 
@@ -0,0 +1,282 @@
+import codecs
+import csv
+import json
+import logging
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, List, Optional, Type
+
+from pydantic import ValidationError
+
+from app.domain.exceptions.domain_exception import IntegrityViolationException
+from app.domain.interfaces.repository import IEventRepository
+from app.domain.interfaces.resource_registry import ResourceRegistry
+from app.domain.schemas.enums import ResourceType
+from app.domain.schemas.imports import (
+    ImportFormat, ImportProgress, ImportReport, ImportRowError, event_import_schema
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5_000
+
+# Rejected rows listed in the report; the counts keep going past this
+MAX_REPORTED_ERRORS = 1_000
+
+_OPEN_END = datetime.max.replace(tzinfo=timezone.utc)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Legacy exports often carry naive timestamps; they are taken as UTC like the rest of the app
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class _Busy:
+    """
+    One resource's intervals sorted by start, with the running maximum of their ends.
+    Stored intervals may overlap each other (legacy rows, same-mission events), so an
+    interval ending late can hide behind neighbours that end early.
+    """
+    __slots__ = ("intervals", "max_ends")
+
+    def __init__(self, intervals: List[tuple[datetime, datetime]]):
+        self.intervals = sorted(intervals)
+        self.max_ends = []
+        self._refresh_from(0)
+
+    def _refresh_from(self, i: int) -> None:
+        del self.max_ends[i:]
+        reach = self.max_ends[-1] if self.max_ends else None
+        for _, end in self.intervals[i:]:
+            reach = end if reach is None or end > reach else reach
+            self.max_ends.append(reach)
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        # Intervals before i start no later than `start`: one overlaps iff the latest end among
+        # them is after it. From i on they start at or after `start`: the first starts earliest.
+        i = bisect_left(self.intervals, (start, end))
+        return (i > 0 and self.max_ends[i - 1] > start) or (i < len(self.intervals) and self.intervals[i][0] < end)
+
+    def add(self, start: datetime, end: datetime) -> None:
+        i = bisect_left(self.intervals, (start, end))
+        self.intervals.insert(i, (start, end))
+        self._refresh_from(i)
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def read_rows(chunks: AsyncIterator[bytes], fmt: ImportFormat) -> AsyncIterator[dict | Exception]:
+    """
+    Parses an NDJSON or CSV (with header) byte stream into one dict per data row.
+    A row that cannot be parsed is yielded as the exception, so it is rejected on its own.
+    Empty CSV cells become None.
+    """
+    if fmt is ImportFormat.NDJSON:
+        async for line in _lines(chunks):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+                yield row if isinstance(row, dict) else ValueError("Row is not a JSON object")
+            except ValueError as e:
+                yield e
+        return
+
+    header: Optional[List[str]] = None
+    async for line in _lines(chunks):
+        if not line.strip():
+            continue
+        # Quoted CSV values containing newlines are not supported
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [h.strip() for h in values]
+            continue
+        if len(values) != len(header):
+            yield ValueError(f"Expected {len(header)} columns, got {len(values)}")
+            continue
+        yield {key: (value if value != "" else None) for key, value in zip(header, values)}
+
+
+class TimelineImportService:
+    """
+    Backfills event tables from large NDJSON/CSV inputs.
+
+    Rows are processed in chunks. Each chunk runs in its own transaction:
+    validation, reference and overlap checks with one query per foreign key / chunk,
+    then a single batched insert (COPY on PostgreSQL). A failing row only rejects itself;
+    committed chunks stay committed if a later one fails.
+    """
+
+    def __init__(
+            self,
+            open_unit: Callable[[], AsyncContextManager[IEventRepository]],
+            resource_registry: Type[ResourceRegistry],
+            chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        # open_unit yields an event repository whose transaction commits on exit
+        self.open_unit = open_unit
+        self.resource_registry = resource_registry
+        self.chunk_size = chunk_size
+
+    async def import_events(
+            self,
+            resource_type: ResourceType,
+            rows: AsyncIterator[dict | Exception],
+            on_progress: Callable[[ImportProgress], None] | None = None
+    ) -> ImportReport:
+        report = ImportReport()
+        chunk: List[tuple[int, Any]] = []
+
+        async for raw in rows:
+            report.rows += 1
+            chunk.append((report.rows, raw))
+            if len(chunk) >= self.chunk_size:
+                await self._import_chunk(resource_type, chunk, report, on_progress)
+                chunk = []
+        if chunk:
+            await self._import_chunk(resource_type, chunk, report, on_progress)
+
+        logger.info(
+            "event import finished",
+            extra={"resource_type": resource_type.value, "rows": report.rows,
+                   "inserted": report.inserted, "rejected": report.rejected}
+        )
+        return report
+
+    async def _import_chunk(
+            self,
+            resource_type: ResourceType,
+            chunk: List[tuple[int, Any]],
+            report: ImportReport,
+            on_progress: Callable[[ImportProgress], None] | None
+    ) -> None:
+        meta = self.resource_registry.get(resource_type)
+        schema = event_import_schema(resource_type)
+        errors: List[ImportRowError] = []
+
+        # 1. Validation (no database access)
+        valid: List[tuple[int, dict]] = []
+        for row_num, raw in chunk:
+            if isinstance(raw, Exception):
+                errors.append(ImportRowError(row=row_num, detail=f"Unreadable row: {raw}"))
+                continue
+            try:
+                row = schema.model_validate(raw).model_dump()
+                row["start_time"], row["end_time"] = _as_utc(row["start_time"]), _as_utc(row["end_time"])
+                valid.append((row_num, row))
+            except ValidationError as e:
+                detail = "; ".join(f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}" for err in e.errors())
+                errors.append(ImportRowError(row=row_num, detail=detail))
+
+        inserted = 0
+        if valid:
+            try:
+                async with self.open_unit() as repo:
+                    # 2. Unknown missions/resources, one query per foreign key
+                    missing = await repo.missing_references(resource_type, [row for _, row in valid])
+                    if missing:
+                        kept = []
+                        for row_num, row in valid:
+                            bad = [key for key, values in missing.items() if row.get(key) in values]
+                            if bad:
+                                errors.append(ImportRowError(row=row_num, detail=f"Unknown {', '.join(bad)}"))
+                            else:
+                                kept.append((row_num, row))
+                        valid = kept
+
+                    # 3. Overlaps with stored events and within the chunk, one query per chunk
+                    valid = await self._reject_overlaps(repo, resource_type, meta.fk_field, valid, errors)
+
+                    # 4. One batched insert, committed with the chunk
+                    inserted = await repo.insert_many(resource_type, [row for _, row in valid])
+                    await repo.bump_mission_versions(sorted({row["mission_id"] for _, row in valid}))
+                valid = []
+            except IntegrityViolationException:
+                # The chunk was rolled back (e.g. a concurrent writer); redo its rows one by one
+                pass
+
+            if valid:
+                async with self.open_unit() as repo:
+                    outcome = await repo.insert_each(resource_type, list(enumerate(row for _, row in valid)))
+                    failed = {e.index for e in outcome.errors}
+                    await repo.bump_mission_versions(
+                        sorted({row["mission_id"] for i, (_, row) in enumerate(valid) if i not in failed})
+                    )
+                inserted = len(outcome.succeeded)
+                errors.extend(ImportRowError(row=valid[e.index][0], detail=e.detail) for e in outcome.errors)
+
+        report.chunks += 1
+        report.inserted += inserted
+        report.rejected += len(errors)
+        room = MAX_REPORTED_ERRORS - len(report.errors)
+        report.errors.extend(sorted(errors, key=lambda e: e.row)[:max(room, 0)])
+        report.errors_truncated = report.errors_truncated or len(errors) > room
+
+        progress = ImportProgress(chunk=report.chunks, rows=report.rows, inserted=report.inserted,
+                                  rejected=report.rejected)
+        logger.info("event import chunk committed", extra=progress.model_dump())
+        if on_progress:
+            on_progress(progress)
+
+    @staticmethod
+    async def _reject_overlaps(
+            repo: IEventRepository,
+            resource_type: ResourceType,
+            fk_field: str,
+            rows: List[tuple[int, dict]],
+            errors: List[ImportRowError]
+    ) -> List[tuple[int, dict]]:
+        """
+        Drops rows overlapping an event of the same resource in another mission, either already
+        stored or earlier in the input (earlier rows win); a mission may overlap its own events,
+        as on the API write path. Stored intervals for every resource in the chunk are fetched
+        at once; each row is then checked with a binary search against the running maximum end
+        of every other mission's intervals on the resource.
+        """
+        if not rows:
+            return rows
+
+        starts = [row["start_time"] for _, row in rows]
+        ends = [row["end_time"] for _, row in rows]
+        window_end = None if any(end is None for end in ends) else max(ends)
+        stored = await repo.get_intervals(
+            resource_type, list({row[fk_field] for _, row in rows}), min(starts), window_end
+        )
+
+        # Per resource, then per mission; rows accepted from this chunk are added as we go
+        timelines = defaultdict(lambda: defaultdict(lambda: _Busy([])))
+        for resource_id, intervals in stored.items():
+            by_mission = defaultdict(list)
+            for start, end, mission_id in intervals:
+                by_mission[mission_id].append((start, end or _OPEN_END))
+            for mission_id, busy in by_mission.items():
+                timelines[resource_id][mission_id] = _Busy(busy)
+
+        accepted = []
+        for row_num, row in rows:
+            start, end = row["start_time"], row["end_time"] or _OPEN_END
+            missions = timelines[row[fk_field]]
+            if any(m != row["mission_id"] and busy.overlaps(start, end) for m, busy in missions.items()):
+                errors.append(ImportRowError(
+                    row=row_num,
+                    detail=f"{resource_type.value} {row[fk_field]} is busy between {start.isoformat()} and "
+                           f"{'open end' if end is _OPEN_END else end.isoformat()}"
+                ))
+                continue
+            missions[row["mission_id"]].add(start, end)
+            accepted.append((row_num, row))
+        return accepted
@@ -0,0 +1,43 @@
+"""
+Installs or drops the availability_versions triggers of the event tables.
+
+    python -m app.cli.availability_triggers drop
+    python -m app.cli.availability_triggers install
+
+Workers with DB_AVAILABILITY_INDEX on install the triggers at startup; drop them once every
+worker runs with the index off, so event writes stop queueing on the version rows. Writes
+committed while the triggers are missing are not seen by running indexes: restart the workers
+after installing them by hand.
+"""
+import argparse
+import asyncio
+
+from app.core.config import get_settings
+from app.db.sql.manager import SQLAlchemyManager
+from app.infrastructure.availability.triggers import drop_version_triggers, install_version_triggers
+
+ACTIONS = {"install": install_version_triggers, "drop": drop_version_triggers}
+
+
+async def run(action: str) -> None:
+    db_manager = SQLAlchemyManager(get_settings().database)
+    try:
+        async with db_manager.get_connection() as session:
+            async with db_manager.transaction(session) as tx_session:
+                names = await ACTIONS[action](tx_session)
+    finally:
+        await db_manager.close()
+
+    done = "Installed" if action == "install" else "Dropped"
+    print(f"{done}: {', '.join(names)}" if names else "Nothing to do")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Install or drop the availability version triggers.")
+    parser.add_argument("action", choices=list(ACTIONS))
+    args = parser.parse_args()
+    asyncio.run(run(args.action))
+
+
+if __name__ == "__main__":
+    main()
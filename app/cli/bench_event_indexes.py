@@ -0,0 +1,169 @@
+"""
+Query plans of the hot event-table lookups before and after the composite/partial indexes (migrations 0002, 0005).
+
+    python -m app.cli.bench_event_indexes
+    python -m app.cli.bench_event_indexes --rows 1000000 --resources 500 --keep
+
+PostgreSQL only. Seeds a scratch copy of mission_stations (schema bench_event_indexes, dropped at
+the end unless --keep) with back-to-back events per station, the latest ones still open, then runs
+EXPLAIN (ANALYZE, BUFFERS) of each lookup on the old single-column indexes and on the current ones.
+"""
+import argparse
+import asyncio
+import re
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, Table, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.schema import CreateIndex, CreateSchema, CreateTable, DropIndex, DropSchema
+
+from app.core.config import get_settings
+from app.db.sql.models.indexes import open_events_index, resource_period_index
+
+SCHEMA = "bench_event_indexes"
+TABLE = "mission_stations"
+# Seeded events: 90 minutes every 2 hours per station
+SLOT = timedelta(hours=2)
+
+# The predicates of SQLMissionRepository.check_resource_availability and
+# SQLEventRepository.get_last_active_event
+QUERIES = {
+    "availability from now on (switch_resource)": f"""
+        SELECT * FROM {SCHEMA}.{TABLE}
+        WHERE station_id = :resource_id AND start_time < :end AND (end_time > :start OR end_time IS NULL)
+    """,
+    "availability of a past hour (create_event)": f"""
+        SELECT * FROM {SCHEMA}.{TABLE}
+        WHERE station_id = :resource_id AND start_time < :past_end AND (end_time > :past_start OR end_time IS NULL)
+    """,
+    "last active event of a mission": f"""
+        SELECT * FROM {SCHEMA}.{TABLE}
+        WHERE mission_id = :mission_id AND end_time IS NULL
+        ORDER BY start_time DESC LIMIT 1
+    """,
+}
+
+
+def build_table() -> tuple[Table, list[Index], list[Index]]:
+    """The event table without foreign keys, its baseline indexes (0001) and the current ones."""
+    table = Table(
+        TABLE,
+        MetaData(schema=SCHEMA),
+        Column("id", Integer, primary_key=True),
+        Column("mission_id", Integer, nullable=False),
+        Column("station_id", Integer, nullable=False),
+        Column("start_time", DateTime(timezone=True), nullable=False),
+        Column("end_time", DateTime(timezone=True)),
+    )
+    baseline = [
+        Index(f"ix_{TABLE}_mission_id", table.c.mission_id),
+        Index(f"ix_{TABLE}_station_id", table.c.station_id),
+        Index(f"ix_{TABLE}_start_time", table.c.start_time),
+    ]
+    current = [open_events_index(TABLE, "station_id"), resource_period_index(TABLE, "station_id")]
+    for index in current:
+        table.append_constraint(index)
+    return table, baseline, current
+
+
+async def seed(conn: AsyncConnection, rows: int, resources: int, missions: int, epoch: datetime) -> None:
+    # Row g is slot g / resources of station g % resources; the last slot is still running
+    slots = rows // resources
+    await conn.execute(text(f"""
+        INSERT INTO {SCHEMA}.{TABLE} (id, mission_id, station_id, start_time, end_time)
+        SELECT g + 1,
+               1 + (g * 7919) % CAST(:missions AS integer),
+               1 + g % CAST(:resources AS integer),
+               CAST(:epoch AS timestamptz) + (g / CAST(:resources AS integer)) * interval '2 hours',
+               CASE WHEN g / CAST(:resources AS integer) >= CAST(:slots AS integer) - 1 THEN NULL
+                    ELSE CAST(:epoch AS timestamptz) + (g / CAST(:resources AS integer)) * interval '2 hours'
+                         + interval '90 minutes' END
+        FROM generate_series(0, CAST(:rows AS integer) - 1) AS g
+    """), {"rows": slots * resources, "resources": resources, "missions": missions, "slots": slots, "epoch": epoch})
+
+
+async def refresh_statistics(conn: AsyncConnection) -> None:
+    await conn.execute(text(f"VACUUM ANALYZE {SCHEMA}.{TABLE}"))
+
+
+async def explain(conn: AsyncConnection, sql: str, params: dict) -> tuple[str, float]:
+    statement = text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}")
+    await conn.execute(statement, params)  # Warm the cache; the second run is reported
+    plan = "\n".join(row[0] for row in (await conn.execute(statement, params)).all())
+    match = re.search(r"Execution Time: ([\d.]+) ms", plan)
+    return plan, float(match.group(1)) if match else float("nan")
+
+
+async def explain_all(conn: AsyncConnection, params: dict) -> dict[str, tuple[str, float]]:
+    return {name: await explain(conn, sql, params) for name, sql in QUERIES.items()}
+
+
+async def run(url: str, rows: int, resources: int, missions: int, keep: bool) -> None:
+    engine = create_async_engine(url, isolation_level="AUTOCOMMIT")
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("This benchmark needs PostgreSQL")
+
+    table, baseline, current = build_table()
+    now = datetime.now(timezone.utc)
+    slots = rows // resources
+    epoch = now - slots * SLOT
+    past_start = epoch + (slots // 2) * SLOT + timedelta(minutes=30)
+    params = {
+        "resource_id": 1,
+        "start": now,
+        "end": datetime.max.replace(tzinfo=timezone.utc),
+        "past_start": past_start,
+        "past_end": past_start + timedelta(hours=1),
+        # A mission holding one of the open events of the last slot
+        "mission_id": 1 + ((slots * resources - 1) * 7919) % missions,
+    }
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(DropSchema(SCHEMA, cascade=True, if_exists=True))
+            await conn.execute(CreateSchema(SCHEMA))
+            await conn.execute(CreateTable(table))
+            print(f"Seeding {slots * resources:,} events ({resources} stations, {missions} missions)...")
+            await seed(conn, rows, resources, missions, epoch)
+
+            for index in baseline:
+                await conn.execute(CreateIndex(index))
+            await refresh_statistics(conn)
+            before = await explain_all(conn, params)
+
+            # What migration 0005 does: the resource index becomes a prefix of the period index
+            await conn.execute(DropIndex(baseline[1]))
+            for index in current:
+                await conn.execute(CreateIndex(index))
+            await refresh_statistics(conn)
+            after = await explain_all(conn, params)
+
+            for name in QUERIES:
+                print(f"\n=== {name} ===")
+                print(f"--- before ({before[name][1]:.3f} ms)\n{before[name][0]}")
+                print(f"--- after ({after[name][1]:.3f} ms)\n{after[name][0]}")
+
+            print("\nExecution time (ms)")
+            for name in QUERIES:
+                print(f"  {name:<45} {before[name][1]:>10.3f} -> {after[name][1]:>8.3f}")
+
+            if not keep:
+                await conn.execute(DropSchema(SCHEMA, cascade=True))
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="EXPLAIN the event-table lookups before and after the indexes.")
+    parser.add_argument("--url", default=None, help="Defaults to DATABASE_URL")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--resources", type=int, default=2_000, help="Stations the events are spread over")
+    parser.add_argument("--missions", type=int, default=50_000)
+    parser.add_argument("--keep", action="store_true", help=f"Leave the {SCHEMA} schema behind")
+    args = parser.parse_args()
+    url = args.url or get_settings().database.url
+    asyncio.run(run(url, args.rows, args.resources, args.missions, args.keep))
+
+
+if __name__ == "__main__":
+    main()
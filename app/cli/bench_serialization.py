@@ -0,0 +1,125 @@
+"""
+Micro-benchmark of GET /missions/{id} serialization, without a database.
+
+    python -m app.cli.bench_serialization
+    python -m app.cli.bench_serialization --events 10000 --repeat 10
+
+Builds an in-memory mission graph with N events per timeline and times FastAPI's
+response_model path against SchemaResponse (one validation, dump_json to bytes).
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from statistics import median
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.serialization import SchemaResponse
+# Every table must be registered for the relationships to resolve outside the API process
+from app.db.sql.models import operator, role  # noqa: F401
+from app.db.sql.models.black import Black
+from app.db.sql.models.crawler import Crawler, MissionCrawler
+from app.db.sql.models.mission import Mission
+from app.db.sql.models.platform import Platform, MissionPlatform, MissionPlatformRt
+from app.db.sql.models.rt import Rt
+from app.db.sql.models.station import Station, MissionStation
+from app.domain.schemas.enums import (
+    Sites, Sections, MissionTypes, MissionStatuses, MissionOrigins, PlatformTypes, RtLocations
+)
+from app.domain.schemas.mission import MissionRead
+
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def build_mission(events: int) -> Mission:
+    """A mission with `events` back-to-back events on each of its station, crawler, platform and RT timelines."""
+    black = Black(num=1, name="black-1", site=Sites.NORTH)
+    stations = [Station(num=n, name=f"station-{n}", site=Sites.NORTH, black_num=1, black=black) for n in range(1, 21)]
+    crawlers = [Crawler(id=n, name=f"DirtyDance{n}", site=Sites.NORTH, black_num=1, black=black) for n in range(1, 21)]
+    platforms = [Platform(tail_num=n, type=PlatformTypes.TYPE_A) for n in range(100, 120)]
+    rts = [Rt(num=n, location=RtLocations.LOC_1, is_main=n % 2 == 0) for n in range(1, 21)]
+
+    def span(i: int) -> dict:
+        return {"start_time": EPOCH + timedelta(minutes=10 * i), "end_time": EPOCH + timedelta(minutes=10 * i + 10)}
+
+    mission = Mission(
+        id=1, name="bench", section=Sections.SECTION_A, type=MissionTypes.OPERATIONAL,
+        status=MissionStatuses.ACTIVE, origin=MissionOrigins.INTERNAL,
+        scheduled_start_time=EPOCH, scheduled_end_time=EPOCH + timedelta(days=30), version=1
+    )
+    mission.mission_stations = [
+        MissionStation(id=i, mission_id=1, station_id=stations[i % 20].num, station=stations[i % 20], **span(i))
+        for i in range(events)
+    ]
+    mission.mission_crawlers = [
+        MissionCrawler(id=i, mission_id=1, crawler_id=crawlers[i % 20].id, crawler=crawlers[i % 20], **span(i))
+        for i in range(events)
+    ]
+    mission.mission_platforms = [
+        MissionPlatform(
+            id=i, mission_id=1, platform_id=platforms[i % 20].tail_num, platform=platforms[i % 20],
+            main_rt_num=rts[i % 20].num, planned_main_rt=rts[i % 20], **span(i)
+        )
+        for i in range(events)
+    ]
+    mission.links = [
+        MissionPlatformRt(
+            id=i, mission_id=1, platform_id=platforms[i % 20].tail_num, rt_num=rts[i % 20].num,
+            platform=platforms[i % 20], linked_rt=rts[i % 20],
+            is_active=True, up_channel=i % 10, down_channel=i % 10, **span(i)
+        )
+        for i in range(events)
+    ]
+    mission.mission_operators = []
+    return mission
+
+
+async def response_model_path(mission: Mission) -> bytes:
+    # What FastAPI does with a returned object and response_model=MissionRead
+    field = create_model_field(name="Response_get_mission", type_=MissionRead, mode="serialization")
+    content = await serialize_response(field=field, response_content=mission)
+    return JSONResponse(content).body
+
+
+async def schema_response_path(mission: Mission) -> bytes:
+    return SchemaResponse(mission, MissionRead).body
+
+
+async def timed(run: Callable[[Mission], Awaitable[bytes]], mission: Mission, repeat: int) -> tuple[float, bytes]:
+    body = await run(mission)  # Warm-up (schema and adapter construction)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = await run(mission)
+        samples.append(time.perf_counter() - started)
+    return median(samples), body
+
+
+async def run(events: int, repeat: int) -> None:
+    mission = build_mission(events)
+    baseline, baseline_body = await timed(response_model_path, mission, repeat)
+    fast, fast_body = await timed(schema_response_path, mission, repeat)
+
+    if json.loads(baseline_body) != json.loads(fast_body):
+        raise SystemExit("SchemaResponse output differs from the response_model output")
+
+    print(f"{4 * events} events, {len(fast_body) / 1024:.0f} KiB, median of {repeat} runs")
+    print(f"  response_model: {baseline * 1000:8.1f} ms")
+    print(f"  SchemaResponse: {fast * 1000:8.1f} ms  ({baseline / fast:.1f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark mission response serialization.")
+    parser.add_argument("--events", type=int, default=2_500, help="Events per timeline (four timelines)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.events, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Scans the event tables for double bookings: events of a resource overlapping an event of the
+same resource in another mission. One windowed pass per table.
+
+    python -m app.cli.conflict_report
+    python -m app.cli.conflict_report station crawler --output conflicts.ndjson
+
+Each conflicting event is written to --output as an NDJSON line (with its resource_type);
+the per-resource summary is printed to stdout as JSON. Exits 1 when conflicts were found.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from typing import List, Optional, TextIO
+
+from app.application.services.conflict_report_service import ConflictReportService
+from app.core.config import get_settings
+# Every table must be registered for foreign keys to resolve outside the API process
+from app.db.sql.models import black, mission, role  # noqa: F401
+from app.db.sql.manager import SQLAlchemyManager
+from app.domain.schemas.conflicts import EventConflict
+from app.domain.schemas.enums import ResourceType
+from app.infrastructure.repositories.sql.event_repository import SQLEventRepository
+
+
+async def run(resource_types: List[ResourceType], output: Optional[TextIO]) -> int:
+    db_manager = SQLAlchemyManager(get_settings().database)
+
+    def write(resource_type: ResourceType, conflict: EventConflict) -> None:
+        if output:
+            line = {"resource_type": resource_type.value, **conflict.model_dump(mode="json")}
+            output.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+    try:
+        async with db_manager.get_connection(read_only=True) as session:
+            async with db_manager.snapshot_transaction(session) as snapshot_session:
+                report = await ConflictReportService(SQLEventRepository(snapshot_session)).scan(resource_types, write)
+    finally:
+        await db_manager.close()
+
+    print(report.model_dump_json(indent=2))
+    return 1 if report.events else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report overlapping events of the same resource across missions.")
+    parser.add_argument("resource_types", type=ResourceType, nargs="*", choices=list(ResourceType),
+                        help="Event tables to scan; all when omitted")
+    parser.add_argument("--output", default=None, help="NDJSON file for the conflicting events")
+    args = parser.parse_args()
+
+    resource_types = list(dict.fromkeys(args.resource_types)) or list(ResourceType)
+    if args.output is None:
+        sys.exit(asyncio.run(run(resource_types, None)))
+    with open(args.output, "w") as output:
+        sys.exit(asyncio.run(run(resource_types, output)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Bulk-imports mission events from an NDJSON or CSV file (or stdin).
+
+    python -m app.cli.import_events station events.ndjson
+    python -m app.cli.import_events operator legacy.csv --format csv --chunk-size 20000
+
+Progress goes to stderr after every committed chunk; the final report is printed to stdout as JSON.
+"""
+import argparse
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, BinaryIO
+
+from app.application.services.timeline_import_service import TimelineImportService, read_rows, DEFAULT_CHUNK_SIZE
+from app.core.config import get_settings
+# Every table must be registered for foreign keys to resolve outside the API process
+from app.db.sql.models import black, mission, role  # noqa: F401
+from app.db.sql.manager import SQLAlchemyManager
+from app.domain.schemas.enums import ResourceType
+from app.domain.schemas.imports import ImportFormat, ImportProgress
+from app.infrastructure.repositories.sql.event_repository import SQLEventRepository
+from app.infrastructure.resource_registry.sql.resource_registry import SQLResourceRegistry
+
+READ_SIZE = 1 << 20
+
+
+async def _read_file(file: BinaryIO) -> AsyncIterator[bytes]:
+    while chunk := await asyncio.to_thread(file.read, READ_SIZE):
+        yield chunk
+
+
+def _print_progress(progress: ImportProgress) -> None:
+    print(
+        f"chunk {progress.chunk}: {progress.rows} rows read, "
+        f"{progress.inserted} inserted, {progress.rejected} rejected",
+        file=sys.stderr
+    )
+
+
+async def run(resource_type: ResourceType, path: str, fmt: ImportFormat, chunk_size: int) -> int:
+    db_manager = SQLAlchemyManager(get_settings().database)
+
+    @asynccontextmanager
+    async def open_unit():
+        async with db_manager.get_connection() as session:
+            async with db_manager.transaction(session) as tx_session:
+                yield SQLEventRepository(tx_session)
+
+    service = TimelineImportService(open_unit, SQLResourceRegistry, chunk_size)
+    try:
+        if path == "-":
+            report = await service.import_events(resource_type, read_rows(_read_file(sys.stdin.buffer), fmt),
+                                                 _print_progress)
+        else:
+            with open(path, "rb") as file:
+                report = await service.import_events(resource_type, read_rows(_read_file(file), fmt),
+                                                     _print_progress)
+    finally:
+        await db_manager.close()
+
+    print(report.model_dump_json(indent=2))
+    return 1 if report.rejected else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk-import mission events.")
+    parser.add_argument("resource_type", type=ResourceType, choices=list(ResourceType),
+                        help="Event table to import into")
+    parser.add_argument("path", help="Input file, or - for stdin")
+    parser.add_argument("--format", type=ImportFormat, choices=list(ImportFormat), default=None,
+                        help="Defaults to the file extension (.csv or .ndjson)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per transaction")
+    args = parser.parse_args()
+
+    fmt = args.format or (ImportFormat.CSV if args.path.lower().endswith(".csv") else ImportFormat.NDJSON)
+    sys.exit(asyncio.run(run(args.resource_type, args.path, fmt, args.chunk_size)))
+
+
+if __name__ == "__main__":
+    main()
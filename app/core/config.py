@@ -0,0 +1,104 @@
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """
+    Connection and pool configuration for the SQL engine.
+    Values are read from the environment (or a .env file) by `from_env`.
+    """
+    url: str
+    echo: bool = False
+
+    # Optional read replica. GET routes are served from it when set.
+    replica_url: str | None = None
+    # Seconds after a client's write during which its reads stay on the primary (0 disables).
+    read_your_writes_window: float = 0.0
+
+    # Pool sizing
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+
+    # Extra read sessions a worker may hold at once for routes that query several tables
+    # concurrently (timeline windows, active assignments). When none is free those queries run
+    # on the request's own session, one at a time. Keep it well below pool_size + max_overflow.
+    read_fanout_sessions: int = 4
+
+    # Slow statement log (0 disables it)
+    slow_query_threshold_ms: float = 500.0
+    slow_query_log_size: int = 200
+    slow_query_explain: bool = False
+
+    # In-memory availability index per worker (see app/infrastructure/availability).
+    # It holds events ending less than the lookback before it was loaded; older checks go to SQL.
+    # Turning it on installs version triggers that make writers of a resource type queue on one
+    # row; after turning it off, drop them with `python -m app.cli.availability_triggers drop`.
+    availability_index: bool = False
+    availability_index_lookback_hours: float = 168.0
+
+    # Check resource availability before writing events. On PostgreSQL the ex_*_no_overlap
+    # exclusion constraints (migration 0004) reject double bookings anyway, so the check can be
+    # turned off there; SQLite has no such constraints and always checks.
+    availability_precheck: bool = True
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        url = os.getenv("DATABASE_URL")
+        if not url:
+            raise RuntimeError("DATABASE_URL is not set")
+
+        return cls(
+            url=url,
+            echo=_env_bool("DB_ECHO", cls.echo),
+            replica_url=os.getenv("DATABASE_REPLICA_URL") or None,
+            read_your_writes_window=_env_float("DB_READ_YOUR_WRITES_WINDOW", cls.read_your_writes_window),
+            pool_size=_env_int("DB_POOL_SIZE", cls.pool_size),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", cls.max_overflow),
+            pool_timeout=_env_float("DB_POOL_TIMEOUT", cls.pool_timeout),
+            pool_recycle=_env_int("DB_POOL_RECYCLE", cls.pool_recycle),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", cls.pool_pre_ping),
+            read_fanout_sessions=_env_int("DB_READ_FANOUT_SESSIONS", cls.read_fanout_sessions),
+            slow_query_threshold_ms=_env_float("DB_SLOW_QUERY_MS", cls.slow_query_threshold_ms),
+            slow_query_log_size=_env_int("DB_SLOW_QUERY_LOG_SIZE", cls.slow_query_log_size),
+            slow_query_explain=_env_bool("DB_SLOW_QUERY_EXPLAIN", cls.slow_query_explain),
+            availability_index=_env_bool("DB_AVAILABILITY_INDEX", cls.availability_index),
+            availability_index_lookback_hours=_env_float(
+                "DB_AVAILABILITY_INDEX_LOOKBACK_HOURS", cls.availability_index_lookback_hours
+            ),
+            availability_precheck=_env_bool("DB_AVAILABILITY_PRECHECK", cls.availability_precheck),
+        )
+
+
+@dataclass(frozen=True)
+class Settings:
+    database: DatabaseSettings = field(default_factory=DatabaseSettings.from_env)
+
+
+@lru_cache
+def get_settings() -> Settings:
+    load_dotenv()
+    return Settings()
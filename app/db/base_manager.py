@@ -1,5 +1,36 @@
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Any
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AsyncGenerator, Any, List, Optional
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Snapshot of a connection pool.
+    Wait times are in milliseconds and cover the time spent acquiring a connection.
+    """
+    size: int
+    checked_out: int
+    overflow: int
+    waiters: int
+    checkouts: int
+    avg_checkout_ms: float
+    max_checkout_ms: float
+
+
+@dataclass
+class SlowQuery:
+    """
+    A statement that exceeded the slow query threshold.
+    Parameter values are redacted; `plan` is filled in asynchronously when EXPLAIN capture is on.
+    """
+    statement: str
+    parameters: Any
+    duration_ms: float
+    caller: Optional[str]
+    recorded_at: datetime
+    plan: Optional[List[str]] = field(default=None)
 
 
 class AbstractDBManager(ABC):
@@ -10,10 +41,18 @@ class AbstractDBManager(ABC):
     """
 
     @abstractmethod
-    async def get_connection(self) -> AsyncGenerator[Any, None]:
+    async def get_connection(
+            self,
+            read_only: bool = False,
+            last_write_at: float | None = None
+    ) -> AsyncGenerator[Any, None]:
         """
         Yield a database session, connection, or client reference.
 
+        read_only: the caller will not write, so a replica may serve it and the
+                   session runs without a transaction or autoflush.
+        last_write_at: epoch time of the caller's last write, used for read-your-writes routing.
+
         SQL example: AsyncSession
         Mongo example: Motor Database instance
         """
@@ -28,6 +67,23 @@ class AbstractDBManager(ABC):
         """
         pass
 
+    @abstractmethod
+    async def read_only_transaction(self, conn: Any) -> AsyncGenerator[Any, None]:
+        """
+        Context manager for read-only work.
+        Never commits; the connection is released untouched on exit.
+        """
+        pass
+
+    @abstractmethod
+    async def snapshot_transaction(self, conn: Any) -> AsyncGenerator[Any, None]:
+        """
+        Context manager for long read-only scans (exports).
+        Reads one consistent snapshot inside a real transaction, which server-side
+        cursors need; never commits.
+        """
+        pass
+
     @abstractmethod
     async def check_connection(self) -> bool:
         """
@@ -37,6 +93,29 @@ class AbstractDBManager(ABC):
         """
         pass
 
+    @property
+    @abstractmethod
+    def read_your_writes_window(self) -> float:
+        """
+        Seconds after a write during which the same client's reads go to the primary.
+        0 means reads are never pinned.
+        """
+        pass
+
+    @abstractmethod
+    def pool_stats(self) -> dict[str, PoolStats]:
+        """
+        Current state of every connection pool owned by the manager, keyed by pool name.
+        """
+        pass
+
+    @abstractmethod
+    def slow_queries(self) -> List[SlowQuery]:
+        """
+        Most recent slow statements, newest first.
+        """
+        pass
+
     @abstractmethod
     async def close(self):
         """
@@ -1,40 +1,189 @@
 import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, List
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy import text, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncEngine
+from sqlalchemy.orm import Session
 
-from app.db.base_manager import AbstractDBManager
+from app.core.config import DatabaseSettings, get_settings
+from app.db.base_manager import AbstractDBManager, PoolStats, SlowQuery
+from app.db.sql.pool import InstrumentedAsyncQueuePool
+from app.db.sql.slow_queries import SlowQueryRecorder
+
+
+@dataclass
+class QueryStats:
+    """
+    Statements issued and time spent in the database during one unit of work (usually a request).
+    """
+    count: int = 0
+    duration: float = 0.0  # seconds
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 3)
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_tracking() -> tuple[QueryStats, Token]:
+    """
+    Starts collecting statement counts/timings for the current context.
+    Pass the returned token to `stop_query_tracking` when the unit of work ends.
+    """
+    stats = QueryStats()
+    return stats, _query_stats.set(stats)
+
+
+def stop_query_tracking(token: Token) -> None:
+    _query_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # On the statement's execution context, so a failed statement leaves nothing behind
+    # on the (pooled) connection
+    if context is not None and _query_stats.get() is not None:
+        context._query_started_at = time.perf_counter()
+
+
+def _record(context) -> None:
+    stats = _query_stats.get()
+    started = getattr(context, "_query_started_at", None)
+    if stats is None or started is None:
+        return
+    del context._query_started_at
+    stats.count += 1
+    stats.duration += time.perf_counter() - started
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record(context)
+
+
+def _handle_error(exception_context) -> None:
+    # Failed statements took database time too
+    _record(exception_context.execution_context)
+
+
+def _instrument_engine(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    # SQLite ignores ON DELETE CASCADE unless foreign keys are switched on per connection
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_flush(session: Session, flush_context, instances):
+    if session.info.get("read_only"):
+        raise RuntimeError("Attempted to flush changes through a read-only session")
+
+
+def _read_only_session_maker(engine: AsyncEngine) -> async_sessionmaker:
+    """
+    Sessions for pure reads: AUTOCOMMIT skips the BEGIN/COMMIT round trip and
+    autoflush is off since nothing is ever written through them.
+    """
+    return async_sessionmaker(
+        engine.execution_options(isolation_level="AUTOCOMMIT"),
+        expire_on_commit=False,
+        autoflush=False,
+        class_=AsyncSession,
+        info={"read_only": True}
+    )
 
 
 class SQLAlchemyManager(AbstractDBManager):
     _instance = None
     _initialized = False
 
-    def __new__(cls):
+    def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, settings: DatabaseSettings | None = None):
         if not self._initialized:
-            self._engine = create_async_engine(
-                "DATA_BASE_URL",
-                echo=False,
-                future=True
-            )
+            self._settings = settings or get_settings().database
+            self._slow_query_recorder = None
+            if self._settings.slow_query_threshold_ms > 0:
+                self._slow_query_recorder = SlowQueryRecorder(
+                    threshold_ms=self._settings.slow_query_threshold_ms,
+                    capacity=self._settings.slow_query_log_size,
+                    explain=self._settings.slow_query_explain
+                )
+
+            self._engine = self._create_engine(self._settings.url)
             self._session_maker = async_sessionmaker(
                 self._engine,
                 expire_on_commit=False,
                 class_=AsyncSession
             )
+            self._read_only_session_maker = _read_only_session_maker(self._engine)
+
+            # Optional read replica; without one every session goes to the primary
+            self._replica_engine = None
+            self._replica_session_maker = None
+            if self._settings.replica_url:
+                self._replica_engine = self._create_engine(self._settings.replica_url)
+                self._replica_session_maker = _read_only_session_maker(self._replica_engine)
             self._initialized = True
 
+    def _create_engine(self, url: str) -> AsyncEngine:
+        engine = create_async_engine(
+            url,
+            echo=self._settings.echo,
+            future=True,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=self._settings.pool_size,
+            max_overflow=self._settings.max_overflow,
+            pool_timeout=self._settings.pool_timeout,
+            pool_recycle=self._settings.pool_recycle,
+            pool_pre_ping=self._settings.pool_pre_ping,
+        )
+        _instrument_engine(engine)
+        if engine.dialect.name == "sqlite":
+            event.listen(engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+        if self._slow_query_recorder is not None:
+            self._slow_query_recorder.attach(engine)
+        return engine
+
+    @property
+    def read_your_writes_window(self) -> float:
+        return self._settings.read_your_writes_window
+
+    def _use_replica(self, read_only: bool, last_write_at: float | None) -> bool:
+        if not read_only or self._replica_session_maker is None:
+            return False
+        if last_write_at is not None and self.read_your_writes_window > 0:
+            # The client wrote recently; the replica may not have caught up yet
+            return time.time() - last_write_at >= self.read_your_writes_window
+        return True
 
     @asynccontextmanager
-    async def get_connection(self) -> AsyncGenerator[AsyncSession, None]:
-        async with self._session_maker() as session:
+    async def get_connection(
+            self,
+            read_only: bool = False,
+            last_write_at: float | None = None
+    ) -> AsyncGenerator[AsyncSession, None]:
+        if self._use_replica(read_only, last_write_at):
+            session_maker = self._replica_session_maker
+        elif read_only:
+            session_maker = self._read_only_session_maker
+        else:
+            session_maker = self._session_maker
+
+        async with session_maker() as session:
             yield session
 
     @asynccontextmanager
@@ -46,6 +195,24 @@ class SQLAlchemyManager(AbstractDBManager):
             await session.rollback()
             raise
 
+    @asynccontextmanager
+    async def read_only_transaction(self, session: AsyncSession):
+        try:
+            yield session
+        finally:
+            # Nothing to commit; just hand the connection back to the pool
+            await session.rollback()
+
+    @asynccontextmanager
+    async def snapshot_transaction(self, session: AsyncSession):
+        # Read-only sessions run in AUTOCOMMIT, but server-side cursors need a transaction
+        level = "SERIALIZABLE" if session.bind.dialect.name == "sqlite" else "REPEATABLE READ"
+        await session.connection(execution_options={"isolation_level": level})
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
     async def check_connection(self, timeout: float = 3.0) -> bool:
         try:
             async def _check():
@@ -59,9 +226,37 @@ class SQLAlchemyManager(AbstractDBManager):
         except Exception as e:
             return False
 
+    def pool_stats(self) -> dict[str, PoolStats]:
+        stats = {"primary": self._engine_pool_stats(self._engine)}
+        if self._replica_engine is not None:
+            stats["replica"] = self._engine_pool_stats(self._replica_engine)
+        return stats
+
+    @staticmethod
+    def _engine_pool_stats(engine: AsyncEngine) -> PoolStats:
+        pool = engine.pool
+        metrics = getattr(pool, "metrics", None)
+
+        return PoolStats(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            waiters=metrics.waiters if metrics else 0,
+            checkouts=metrics.checkouts if metrics else 0,
+            avg_checkout_ms=round(metrics.avg_wait * 1000, 3) if metrics else 0.0,
+            max_checkout_ms=round(metrics.max_wait * 1000, 3) if metrics else 0.0,
+        )
+
+    def slow_queries(self) -> List[SlowQuery]:
+        if self._slow_query_recorder is None:
+            return []
+        return self._slow_query_recorder.entries()
+
     @property
     def raw(self) -> Any:
         return self._engine
 
     async def close(self):
         await self._engine.dispose()
+        if self._replica_engine is not None:
+            await self._replica_engine.dispose()
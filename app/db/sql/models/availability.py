@@ -0,0 +1,48 @@
+from sqlalchemy import DDL, Table, event
+from sqlmodel import SQLModel, Field
+
+from app.domain.schemas.enums import ResourceType
+
+
+class AvailabilityVersion(SQLModel, table=True):
+    """
+    One row per resource type, bumped by triggers on every write to that type's event table
+    (cascades and COPY included). Workers compare it with the version their in-memory
+    availability index was built at. The triggers exist only while the index is enabled;
+    see app/infrastructure/availability/triggers.py.
+    """
+    __tablename__ = 'availability_versions'
+
+    resource_type: str = Field(primary_key=True)
+    version: int = Field(default=0, nullable=False, sa_column_kwargs={"server_default": "0"})
+
+
+event.listen(
+    AvailabilityVersion.__table__,
+    "after_create",
+    DDL(
+        "INSERT INTO availability_versions (resource_type, version) VALUES "
+        + ", ".join(f"('{resource_type.value}', 0)" for resource_type in ResourceType)
+    )
+)
+
+
+_PG_NO_OVERLAP = """
+ALTER TABLE {table} ADD CONSTRAINT ex_{table}_no_overlap
+EXCLUDE USING gist ({resource_column} WITH =, mission_id WITH <>, tstzrange(start_time, end_time, '[)') WITH &&)
+"""
+
+
+def no_overlap_constraint(table: Table, resource_column: str) -> None:
+    """
+    PostgreSQL only: an exclusion constraint rejecting overlapping events of one resource in
+    different missions, the rule check_resource_availability enforces (an open end_time is an
+    unbounded range). Created with `table` (create_all); migration 0004 adds it to existing tables.
+    SQLite has no equivalent and relies on the application-side check.
+    """
+    event.listen(table, "after_create", DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"))
+    event.listen(
+        table,
+        "after_create",
+        DDL(_PG_NO_OVERLAP.format(table=table.name, resource_column=resource_column)).execute_if(dialect="postgresql")
+    )
@@ -14,14 +14,14 @@ class Black(SQLModel, table=True):
 
     num: Optional[int] = Field(default=None, primary_key=True, index=True)
     name: str = Field(unique=True, nullable=False)
-    site: Sites = Field(nullable=False)
+    site: Sites = Field(nullable=False, index=True)
 
     # Relationships
     station: Optional["Station"] = Relationship(
         back_populates="black",
-        sa_relationship_kwargs={"cascade": "all, delete"}
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True}
     )
     crawlers: List["Crawler"] = Relationship(
         back_populates="black",
-        sa_relationship_kwargs={"cascade": "all, delete"}
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True}
     )
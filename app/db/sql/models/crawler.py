@@ -3,6 +3,8 @@ from typing import Optional, List, TYPE_CHECKING
 
 from sqlmodel import SQLModel, Field, Relationship
 
+from app.db.sql.models.availability import no_overlap_constraint
+from app.db.sql.models.indexes import open_events_index, resource_period_index
 from app.domain.schemas.enums import Sites
 
 if TYPE_CHECKING:
@@ -20,12 +22,13 @@ class Crawler(SQLModel, table=True):
         nullable=False,
         regex=r"^DirtyDance.*"  # Regex from your screenshot
     )
-    site: Sites = Field(nullable=False)
+    site: Sites = Field(nullable=False, index=True)
     black_num: Optional[int] = Field(
         default=None,
         foreign_key="blacks.num",
         nullable=False,
-        ondelete="CASCADE"
+        ondelete="CASCADE",
+        index=True
     )
 
     # Relationships
@@ -35,16 +38,20 @@ class Crawler(SQLModel, table=True):
     )
     missions: List["MissionCrawler"] = Relationship(
         back_populates="crawler",
-        sa_relationship_kwargs={"cascade": "all, delete"}
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True}
     )
 
 
 class MissionCrawler(SQLModel, table=True):
     __tablename__ = 'mission_crawlers'
+    __table_args__ = (
+        open_events_index('mission_crawlers', 'crawler_id'),
+        resource_period_index('mission_crawlers', 'crawler_id'),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     mission_id: int = Field(foreign_key="missions.id", ondelete="CASCADE", index=True)
-    crawler_id: int = Field(foreign_key="crawlers.id", ondelete="CASCADE", index=True)
+    crawler_id: int = Field(foreign_key="crawlers.id", ondelete="CASCADE")
     start_time: datetime = Field(index=True, nullable=False)
     end_time: Optional[datetime] = Field(default=None, nullable=True)
 
@@ -52,5 +59,8 @@ class MissionCrawler(SQLModel, table=True):
     mission: "Mission" = Relationship(back_populates="mission_crawlers")
     crawler: "Crawler" = Relationship(
         back_populates="missions",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
+
+
+no_overlap_constraint(MissionCrawler.__table__, 'crawler_id')
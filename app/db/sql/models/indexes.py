@@ -0,0 +1,28 @@
+from sqlalchemy import Index, text
+
+# Events still running have no end_time
+OPEN_EVENT = "end_time IS NULL"
+
+
+def open_events_index(table_name: str, resource_column: str) -> Index:
+    """
+    Partial index over the open events of an event table only, which stay few however long the history grows.
+    (mission_id, start_time) serves the last active event of a mission; with the resource column
+    the fleet-wide active snapshot is an index-only scan.
+    """
+    return Index(
+        f"ix_{table_name}_open",
+        "mission_id", "start_time", resource_column,
+        postgresql_where=text(OPEN_EVENT),
+        sqlite_where=text(OPEN_EVENT),
+    )
+
+
+def resource_period_index(table_name: str, resource_column: str) -> Index:
+    """
+    Serves the availability predicate `resource = ? AND start_time < ? AND (end_time > ? OR end_time IS NULL)`:
+    both arms of the OR are ranges of the same index (NULLs are indexed) and start_time is checked in it.
+    end_time leads start_time because checks look at the present and future, and only the latest
+    events of a resource end after them. It also covers the resource's foreign key (ON DELETE CASCADE).
+    """
+    return Index(f"ix_{table_name}_{resource_column}_period", resource_column, "end_time", "start_time")
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 
 from app.domain.schemas.enums import Sections, MissionTypes, MissionStatuses, MissionOrigins
@@ -14,6 +15,10 @@ if TYPE_CHECKING:
 
 class Mission(SQLModel, table=True):
     __tablename__ = 'missions'
+    __table_args__ = (
+        # Mission list: status filter + keyset on (scheduled_start_time, id)
+        Index("ix_missions_status_start_time", "status", "scheduled_start_time", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(unique=True, nullable=False)
@@ -22,28 +27,32 @@ class Mission(SQLModel, table=True):
     status: MissionStatuses = Field(nullable=False)
     origin: MissionOrigins = Field(nullable=False)
 
-    scheduled_start_time: datetime = Field(nullable=False)
+    scheduled_start_time: datetime = Field(nullable=False, index=True)
     scheduled_end_time: Optional[datetime] = Field(default=None, nullable=False)
     actual_end_time: Optional[datetime] = Field(default=None, nullable=True)
 
+    # Bumped on every timeline write; exposed as the ETag of GET /missions/{id}
+    version: int = Field(default=1, nullable=False, sa_column_kwargs={"server_default": "1"})
+
     # Relationships
+    # lazy="raise": load them per query through the repository's load profiles
     mission_operators: List["MissionOperators"] = Relationship(
         back_populates="mission",
-        sa_relationship_kwargs={"lazy": "selectin", "cascade": "all, delete"}
+        sa_relationship_kwargs={"lazy": "raise", "cascade": "all, delete", "passive_deletes": True}
     )
     mission_stations: List["MissionStation"] = Relationship(
         back_populates="mission",
-        sa_relationship_kwargs={"lazy": "selectin", "cascade": "all, delete"}
+        sa_relationship_kwargs={"lazy": "raise", "cascade": "all, delete", "passive_deletes": True}
     )
     mission_crawlers: List["MissionCrawler"] = Relationship(
         back_populates="mission",
-        sa_relationship_kwargs={"lazy": "selectin", "cascade": "all, delete"}
+        sa_relationship_kwargs={"lazy": "raise", "cascade": "all, delete", "passive_deletes": True}
     )
     mission_platforms: List["MissionPlatform"] = Relationship(
         back_populates="mission",
-        sa_relationship_kwargs={"lazy": "selectin", "cascade": "all, delete"}
+        sa_relationship_kwargs={"lazy": "raise", "cascade": "all, delete", "passive_deletes": True}
     )
     links: List["MissionPlatformRt"] = Relationship(
         back_populates="mission",
-        sa_relationship_kwargs={"lazy": "selectin", "cascade": "all, delete"}
+        sa_relationship_kwargs={"lazy": "raise", "cascade": "all, delete", "passive_deletes": True}
     )
@@ -3,6 +3,9 @@ from typing import Optional, List, TYPE_CHECKING
 
 from sqlmodel import SQLModel, Field, Relationship
 
+from app.db.sql.models.availability import no_overlap_constraint
+from app.db.sql.models.indexes import open_events_index, resource_period_index
+
 if TYPE_CHECKING:
     from app.db.sql.models.role import Role
     from app.db.sql.models.mission import Mission
@@ -22,7 +25,7 @@ class Operator(SQLModel, table=True):
     )
     missions: List["MissionOperators"] = Relationship(
         back_populates="operator",
-        sa_relationship_kwargs={"cascade": "all, delete"}
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True}
     )
 
 
@@ -46,10 +49,14 @@ class OperatorRole(SQLModel, table=True):
 
 class MissionOperators(SQLModel, table=True):
     __tablename__ = 'mission_operators'
+    __table_args__ = (
+        open_events_index('mission_operators', 'operator_id'),
+        resource_period_index('mission_operators', 'operator_id'),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     mission_id: int = Field(foreign_key="missions.id", ondelete="CASCADE", index=True)
-    operator_id: int = Field(foreign_key="operators.id", ondelete="CASCADE", index=True)
+    operator_id: int = Field(foreign_key="operators.id", ondelete="CASCADE")
     role_id: int = Field(foreign_key="roles.id", ondelete="CASCADE", index=True)
 
     start_time: Optional[datetime] = Field(index=True, nullable=False)
@@ -59,9 +66,12 @@ class MissionOperators(SQLModel, table=True):
     mission: "Mission" = Relationship(back_populates="mission_operators")
     operator: "Operator" = Relationship(
         back_populates="missions",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
     role: "Role" = Relationship(
         back_populates="mission_roles",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
+
+
+no_overlap_constraint(MissionOperators.__table__, 'operator_id')
@@ -3,6 +3,8 @@ from typing import Optional, List, TYPE_CHECKING
 
 from sqlmodel import SQLModel, Field, Relationship
 
+from app.db.sql.models.availability import no_overlap_constraint
+from app.db.sql.models.indexes import open_events_index, resource_period_index
 from app.domain.schemas.enums import PlatformTypes
 
 if TYPE_CHECKING:
@@ -14,7 +16,7 @@ class Platform(SQLModel, table=True):
     __tablename__ = 'platforms'
 
     tail_num: int = Field(primary_key=True, ge=100, le=999)
-    type: PlatformTypes = Field(nullable=False)
+    type: PlatformTypes = Field(nullable=False, index=True)
 
     # Relationships
     missions: List["MissionPlatform"] = Relationship(back_populates="platform")
@@ -23,10 +25,14 @@ class Platform(SQLModel, table=True):
 
 class MissionPlatform(SQLModel, table=True):
     __tablename__ = 'mission_platforms'
+    __table_args__ = (
+        open_events_index('mission_platforms', 'platform_id'),
+        resource_period_index('mission_platforms', 'platform_id'),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     mission_id: int = Field(foreign_key="missions.id", ondelete="CASCADE", index=True)
-    platform_id: int = Field(foreign_key="platforms.tail_num", ondelete="CASCADE", index=True)
+    platform_id: int = Field(foreign_key="platforms.tail_num", ondelete="CASCADE")
     start_time: Optional[datetime] = Field(default=None, nullable=False, index=True)
     end_time: Optional[datetime] = Field(default=None, nullable=True)
 
@@ -41,20 +47,20 @@ class MissionPlatform(SQLModel, table=True):
     mission: "Mission" = Relationship(back_populates="mission_platforms")
     platform: "Platform" = Relationship(
         back_populates="missions",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
 
     planned_main_rt: Optional["Rt"] = Relationship(
         back_populates="planned_main_rt_mission_platforms",
         sa_relationship_kwargs={
-            "lazy": "selectin",
+            "lazy": "raise",
             "foreign_keys": "[MissionPlatform.main_rt_num]"
         }
     )
     planned_backup_rt: Optional["Rt"] = Relationship(
         back_populates="planned_backup_rt_mission_platforms",
         sa_relationship_kwargs={
-            "lazy": "selectin",
+            "lazy": "raise",
             "foreign_keys": "[MissionPlatform.backup_rt_num]"
         }
     )
@@ -62,11 +68,15 @@ class MissionPlatform(SQLModel, table=True):
 
 class MissionPlatformRt(SQLModel, table=True):
     __tablename__ = 'mission_platform_rts'
+    __table_args__ = (
+        open_events_index('mission_platform_rts', 'rt_num'),
+        resource_period_index('mission_platform_rts', 'rt_num'),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     mission_id: int = Field(foreign_key="missions.id", ondelete="CASCADE", index=True)
     platform_id: int = Field(foreign_key="platforms.tail_num", ondelete="CASCADE", index=True)
-    rt_num: int = Field(foreign_key="rts.num", ondelete="CASCADE", index=True)
+    rt_num: int = Field(foreign_key="rts.num", ondelete="CASCADE")
 
     start_time: Optional[datetime] = Field(default=None, nullable=False, index=True)
     end_time: Optional[datetime] = Field(default=None, nullable=True)
@@ -79,9 +89,13 @@ class MissionPlatformRt(SQLModel, table=True):
     mission: "Mission" = Relationship(back_populates="links")
     platform: "Platform" = Relationship(
         back_populates="mission_platforms_rts",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
     linked_rt: "Rt" = Relationship(
         back_populates="mission_rts",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
+
+
+no_overlap_constraint(MissionPlatform.__table__, 'platform_id')
+no_overlap_constraint(MissionPlatformRt.__table__, 'rt_num')
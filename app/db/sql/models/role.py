@@ -17,9 +17,9 @@ class Role(SQLModel, table=True):
     # Relationships
     operators: List["OperatorRole"] = Relationship(
         back_populates="role",
-        sa_relationship_kwargs={"cascade": "all, delete"}
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True}
     )
     mission_roles: List["MissionOperators"] = Relationship(
         back_populates="role",
-        sa_relationship_kwargs={"cascade": "all, delete"}
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True}
     )
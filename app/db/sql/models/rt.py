@@ -12,7 +12,7 @@ class Rt(SQLModel, table=True):
     __tablename__ = 'rts'
 
     num: int = Field(primary_key=True)  # Assuming config constraints are handled in validation
-    location: RtLocations = Field(nullable=False)
+    location: RtLocations = Field(nullable=False, index=True)
     is_main: bool = Field(nullable=False)
 
     # Relationships
@@ -30,5 +30,5 @@ class Rt(SQLModel, table=True):
     )
     mission_rts: List["MissionPlatformRt"] = Relationship(
         back_populates="linked_rt",
-        sa_relationship_kwargs={"cascade": "all, delete"}
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True}
     )
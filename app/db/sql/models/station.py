@@ -3,6 +3,8 @@ from typing import Optional, List, TYPE_CHECKING
 
 from sqlmodel import SQLModel, Field, Relationship
 
+from app.db.sql.models.availability import no_overlap_constraint
+from app.db.sql.models.indexes import open_events_index, resource_period_index
 from app.domain.schemas.enums import Sites
 
 if TYPE_CHECKING:
@@ -15,12 +17,13 @@ class Station(SQLModel, table=True):
 
     num: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(nullable=False)
-    site: Sites = Field(nullable=False)
+    site: Sites = Field(nullable=False, index=True)
     black_num: Optional[int] = Field(
         default=None,
         foreign_key="blacks.num",
         nullable=False,
-        ondelete="CASCADE"
+        ondelete="CASCADE",
+        index=True
     )
 
     # Relationships
@@ -30,16 +33,20 @@ class Station(SQLModel, table=True):
     )
     missions: List["MissionStation"] = Relationship(
         back_populates="station",
-        sa_relationship_kwargs={"cascade": "all, delete"}
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True}
     )
 
 
 class MissionStation(SQLModel, table=True):
     __tablename__ = 'mission_stations'
+    __table_args__ = (
+        open_events_index('mission_stations', 'station_id'),
+        resource_period_index('mission_stations', 'station_id'),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     mission_id: int = Field(foreign_key="missions.id", ondelete="CASCADE", index=True)
-    station_id: int = Field(foreign_key="stations.num", ondelete="CASCADE", index=True)
+    station_id: int = Field(foreign_key="stations.num", ondelete="CASCADE")
     start_time: datetime = Field(index=True, nullable=False)
     end_time: Optional[datetime] = Field(default=None, nullable=True)
 
@@ -47,5 +54,8 @@ class MissionStation(SQLModel, table=True):
     mission: "Mission" = Relationship(back_populates="mission_stations")
     station: "Station" = Relationship(
         back_populates="missions",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
+
+
+no_overlap_constraint(MissionStation.__table__, 'station_id')
@@ -0,0 +1,47 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolMetrics:
+    """
+    Running counters for connection checkouts on a single pool.
+    """
+
+    def __init__(self):
+        self.waiters = 0
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+    @property
+    def avg_wait(self) -> float:
+        return self.total_wait / self.checkouts if self.checkouts else 0.0
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that measures how long each checkout waits for a connection.
+
+    `_do_get` blocks while the pool is exhausted, so the number of calls currently
+    inside it is the number of requests queuing on the pool rather than on SQL.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        self.metrics.waiters += 1
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.metrics.waiters -= 1
+            self.metrics.record(time.perf_counter() - started)
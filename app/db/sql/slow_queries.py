@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import sys
+import time
+from collections import deque
+from datetime import datetime, timezone, date
+from decimal import Decimal
+from enum import Enum
+from typing import Any, List, Optional
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.base_manager import SlowQuery
+
+logger = logging.getLogger(__name__)
+
+# Frames from these modules are reported as the caller of a slow statement
+REPOSITORY_MODULES = ("app/infrastructure/repositories/",)
+
+# Execution option used to keep the recorder's own EXPLAIN statements out of the log
+SKIP_OPTION = "skip_slow_query_log"
+
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+
+def _redact_value(value: Any) -> Any:
+    # Keys and shapes help when reading a plan; values may contain user data
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (Decimal, datetime, date, Enum)):
+        return str(value)
+    return f"<{type(value).__name__}>"
+
+
+def redact_parameters(parameters: Any) -> Any:
+    if isinstance(parameters, dict):
+        return {k: _redact_value(v) for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            # executemany: the first row is representative, the count is what matters
+            return {"rows": len(parameters), "first": redact_parameters(parameters[0])}
+        return [_redact_value(v) for v in parameters]
+    return _redact_value(parameters)
+
+
+def _stack_frames():
+    """
+    Yields frames innermost first, continuing into the suspended parent greenlets.
+
+    Engine events run inside SQLAlchemy's worker greenlet, whose own stack stops at
+    the greenlet boundary; the awaiting repository coroutines live on the parent's stack.
+    """
+    frame = sys._getframe(1)
+    current = greenlet.getcurrent()
+    while True:
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+        current = current.parent
+        if current is None:
+            return
+        frame = current.gr_frame
+
+
+def _repository_caller() -> Optional[str]:
+    """
+    Repository methods on the call stack (outermost first), e.g.
+    "SQLEventRepository.get_by_id > SQLAlchemyRepository.get".
+    """
+    callers = [
+        frame.f_code.co_qualname
+        for frame in _stack_frames()
+        if any(m in frame.f_code.co_filename.replace("\\", "/") for m in REPOSITORY_MODULES)
+    ]
+    return " > ".join(reversed(callers)) if callers else None
+
+
+class SlowQueryRecorder:
+    """
+    Records statements slower than `threshold_ms` into a bounded ring buffer.
+
+    Optionally runs EXPLAIN for the same statement and parameters on a separate
+    connection, so the plan is captured without delaying the original request.
+    """
+
+    def __init__(self, threshold_ms: float, capacity: int = 200, explain: bool = False):
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self._entries: deque[SlowQuery] = deque(maxlen=capacity)
+        self._pending: set[asyncio.Task] = set()
+
+    def attach(self, engine: AsyncEngine) -> None:
+        sync_engine = engine.sync_engine
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            # On the execution context: a failed statement never reaches after_cursor_execute,
+            # and must leave nothing behind on the pooled connection
+            if context is not None:
+                context._slow_query_started_at = time.perf_counter()
+
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            started = getattr(context, "_slow_query_started_at", None)
+            if started is None:
+                return
+            elapsed = time.perf_counter() - started
+            if elapsed < self.threshold:
+                return
+            if context.execution_options.get(SKIP_OPTION):
+                return
+            self._record(engine, statement, parameters, elapsed)
+
+        event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+
+    def _record(self, engine: AsyncEngine, statement: str, parameters: Any, elapsed: float) -> None:
+        entry = SlowQuery(
+            statement=statement,
+            parameters=redact_parameters(parameters),
+            duration_ms=round(elapsed * 1000, 3),
+            caller=_repository_caller(),
+            recorded_at=datetime.now(timezone.utc),
+        )
+        self._entries.append(entry)
+        logger.warning(
+            "slow query",
+            extra={"duration_ms": entry.duration_ms, "caller": entry.caller, "statement": statement}
+        )
+
+        if self.explain and statement.lstrip().upper().startswith(_EXPLAINABLE):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            task = loop.create_task(self._capture_plan(engine, entry, statement, parameters))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    @staticmethod
+    async def _capture_plan(engine: AsyncEngine, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+        try:
+            async with engine.connect() as conn:
+                result = await conn.exec_driver_sql(
+                    prefix + statement,
+                    parameters,
+                    execution_options={SKIP_OPTION: True}
+                )
+                entry.plan = [" ".join(str(col) for col in row) for row in result.fetchall()]
+        except Exception as e:
+            entry.plan = [f"EXPLAIN failed: {e}"]
+
+    def entries(self) -> List[SlowQuery]:
+        return list(reversed(self._entries))
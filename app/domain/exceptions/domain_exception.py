@@ -8,6 +8,11 @@ class DomainException(Exception):
             self.message = message
         super().__init__(self.message)
 
+    @property
+    def details(self) -> dict:
+        """Extra fields returned to the client next to the message."""
+        return {}
+
 
 class RepositoryException(DomainException):
     status_code = 500
@@ -24,6 +29,12 @@ class NotFoundException(RepositoryException):
     message = "Resource not found"
 
 
+class InvalidQueryException(DomainException):
+    """Raised when list/query parameters (cursor, filters, sorting) are malformed or not allowed."""
+    status_code = 400
+    message = "Invalid query parameters"
+
+
 class TimelineConflictException(DomainException):
     """
     Raised when events overlap and auto_fix is False.
@@ -35,8 +46,46 @@ class TimelineConflictException(DomainException):
         super().__init__(message)
         self.conflicting_events = conflicting_events or []
 
+    @property
+    def details(self) -> dict:
+        return {"conflicting_events": self.conflicting_events}
+
+
+class InvalidTimeRangeException(DomainException):
+    """Raised when a write would leave an event ending at or before its start."""
+    status_code = 422
+    message = "Event end_time must be after start_time"
+
 
 class ResourceUnavailableException(DomainException):
-    """Raised when a specific resource is locked by another Mission."""
+    """
+    Raised when a specific resource is locked by another Mission.
+    `conflicts` optionally lists every clash found, so a batch can be fixed in one go.
+    """
     status_code = 409
     message = "Resource is used by another Mission."
+
+    def __init__(self, message: str | None = None, conflicts: list[dict] | None = None):
+        super().__init__(message)
+        self.conflicts = conflicts or []
+
+    @property
+    def details(self) -> dict:
+        return {"conflicts": self.conflicts} if self.conflicts else {}
+
+
+class BulkOperationException(DomainException):
+    """
+    Raised when an atomic bulk operation rejects one or more items.
+    `errors` holds {"index": ..., "detail": ...} entries pointing into the submitted list.
+    """
+    status_code = 422
+    message = "Bulk operation rejected"
+
+    def __init__(self, message: str | None = None, errors: list[dict] = None):
+        super().__init__(message)
+        self.errors = errors or []
+
+    @property
+    def details(self) -> dict:
+        return {"errors": self.errors}
@@ -1,10 +1,72 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Any, Optional
+from enum import Enum
+from typing import List, Any, Optional, AsyncIterator
 
+from app.domain.schemas.bulk import BulkResult
 from app.domain.schemas.enums import ResourceType
 
 
+@dataclass
+class Page[T]:
+    """
+    One page of a keyset-paginated listing.
+    next_cursor is opaque to callers and None on the last page.
+    """
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class ListQuery:
+    """
+    Server-side filtering, sorting and projection for list endpoints.
+
+    filters: field -> accepted values (several values mean IN).
+    sort: (field, descending) pairs, applied in order.
+    fields: columns to return; None returns whole rows.
+    """
+    filters: dict[str, List[Any]] = field(default_factory=dict)
+    sort: List[tuple[str, bool]] = field(default_factory=list)
+    fields: Optional[List[str]] = None
+
+
+@dataclass
+class MissionFilter:
+    """
+    Mission list filters. Empty lists don't filter; several values mean any of them.
+    The scheduled_start_time range is [start_from, start_to).
+    """
+    statuses: List[Any] = field(default_factory=list)
+    sections: List[Any] = field(default_factory=list)
+    types: List[Any] = field(default_factory=list)
+    origins: List[Any] = field(default_factory=list)
+    start_from: Optional[datetime] = None
+    start_to: Optional[datetime] = None
+
+
+@dataclass
+class ResourceFilter:
+    """
+    Resource list filters, for the resource types that have the column. Empty lists don't filter.
+    """
+    sites: List[Any] = field(default_factory=list)
+    black_nums: List[int] = field(default_factory=list)
+
+
+class MissionLoadProfile(str, Enum):
+    """
+    How much of a mission's graph to load with it.
+    SUMMARY: mission columns only.
+    TIMELINE: one resource type's events (their own columns only).
+    FULL: every timeline with the nested resources MissionRead serializes.
+    """
+    SUMMARY = "summary"
+    TIMELINE = "timeline"
+    FULL = "full"
+
+
 class IRepository[T](ABC):
 
     @property
@@ -18,7 +80,28 @@ class IRepository[T](ABC):
         pass
 
     @abstractmethod
-    async def get_multi(self, skip: int = 0, limit: int = 100) -> List[T]:
+    async def get_multi(self, skip: int = 0, limit: int = 100, query: ListQuery | None = None) -> List[T]:
+        pass
+
+    @abstractmethod
+    async def get_page(
+            self,
+            limit: int = 100,
+            cursor: str | None = None,
+            query: ListQuery | None = None
+    ) -> Page[T]:
+        """
+        Keyset pagination ordered by the query's sort fields, then primary key.
+        Pass the previous page's next_cursor (with the same query) to continue after it.
+        """
+        pass
+
+    @abstractmethod
+    def stream(self, query: ListQuery | None = None, batch_size: int = 1000) -> AsyncIterator[T]:
+        """
+        Iterates over every matching row without loading them all at once
+        (server-side cursor, `batch_size` rows per fetch). Relationships are not loaded.
+        """
         pass
 
     @abstractmethod
@@ -29,10 +112,39 @@ class IRepository[T](ABC):
     async def update(self, obj_current: T, obj_in: Any) -> T:
         pass
 
+    @abstractmethod
+    async def update_by_id(self, id: Any, data: dict) -> T | None:
+        """
+        Applies `data` to the row with this id in a single statement. Returns None if there is no such row.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, id: Any) -> bool:
         pass
 
+    @abstractmethod
+    async def bulk_create(self, items: List[tuple[int, T]], atomic: bool = False) -> BulkResult:
+        """
+        Inserts many rows in one statement. Items are (index in request, object) pairs.
+        Unless atomic, rows rejected by the database are reported instead of failing the batch.
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_update(self, items: List[tuple[int, Any, dict]], atomic: bool = False) -> BulkResult:
+        """
+        Updates many rows by primary key. Items are (index in request, id, changed fields).
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_delete(self, items: List[tuple[int, Any]], atomic: bool = False) -> BulkResult:
+        """
+        Deletes many rows by primary key. Items are (index in request, id).
+        """
+        pass
+
 
 class IEventRepository(ABC):
     """
@@ -50,6 +162,15 @@ class IEventRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def stream(
+            self,
+            resource_type: ResourceType,
+            query: ListQuery | None = None,
+            batch_size: int = 1000
+    ) -> AsyncIterator[Any]:
+        pass
+
     @abstractmethod
     async def create(self, resource_type: ResourceType, event_obj: Any) -> Any:
         pass
@@ -58,10 +179,21 @@ class IEventRepository(ABC):
     async def update(self, resource_type: ResourceType, event_obj: Any, update_data: dict) -> Any:
         pass
 
+    @abstractmethod
+    async def update_by_id(self, resource_type: ResourceType, event_id: int, update_data: dict) -> Optional[Any]:
+        pass
+
     @abstractmethod
     async def delete(self, resource_type: ResourceType, event_id: int) -> bool:
         pass
 
+    @abstractmethod
+    async def delete_returning_mission(self, resource_type: ResourceType, event_id: int) -> Optional[int]:
+        """
+        Deletes the event and returns the id of its mission; None when it did not exist.
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(
             self,
@@ -70,12 +202,151 @@ class IEventRepository(ABC):
     ) -> Optional[Any]:
         pass
 
+    @abstractmethod
+    async def missing_references(self, resource_type: ResourceType, rows: List[dict]) -> dict[str, set]:
+        """
+        For each foreign key column of the event table, the values used in `rows`
+        that reference no existing row. One query per column.
+        """
+        pass
+
+    @abstractmethod
+    async def get_intervals(
+            self,
+            resource_type: ResourceType,
+            resource_ids: List[Any],
+            start: datetime,
+            end: datetime | None
+    ) -> dict[Any, List[tuple[datetime, Optional[datetime], int]]]:
+        """
+        Existing (start_time, end_time, mission_id) of the given resources' events overlapping
+        [start, end), keyed by resource id. end=None means unbounded.
+        """
+        pass
+
+    @abstractmethod
+    async def get_window(
+            self,
+            resource_type: ResourceType,
+            mission_id: int,
+            start: datetime,
+            end: datetime
+    ) -> List[Any]:
+        """
+        The mission's events intersecting [start, end) (open-ended events included),
+        ordered by start_time, with the relationships their read schema shows.
+        """
+        pass
+
+    @abstractmethod
+    async def get_active_assignments(self, resource_type: ResourceType, at: datetime) -> dict[Any, int]:
+        """
+        Mission of every resource with an open event (end_time IS NULL) that has started by `at`,
+        across all missions, keyed by resource id.
+        """
+        pass
+
+    @abstractmethod
+    async def get_conflict_page(
+            self,
+            resource_type: ResourceType,
+            limit: int = 100,
+            cursor: str | None = None
+    ) -> Page[Any]:
+        """
+        Events overlapping an event of the same resource in another mission, found in one
+        windowed pass over the event table; ordered by resource, start_time and id.
+        Rows carry the EventConflict fields.
+        """
+        pass
+
+    @abstractmethod
+    async def get_conflict_summary_page(
+            self,
+            resource_type: ResourceType,
+            limit: int = 100,
+            cursor: str | None = None
+    ) -> Page[Any]:
+        """
+        The conflicts of get_conflict_page aggregated per resource (ResourceConflictSummary fields),
+        ordered by resource.
+        """
+        pass
+
+    @abstractmethod
+    def stream_conflicts(self, resource_type: ResourceType, batch_size: int = 1000) -> AsyncIterator[Any]:
+        """
+        Every row of get_conflict_page, in the same order, from one server-side cursor.
+        """
+        pass
+
+    @abstractmethod
+    async def bump_mission_versions(self, mission_ids: List[int]) -> None:
+        """
+        Increments the version of every given mission with one UPDATE (see IMissionRepository.bump_version).
+        """
+        pass
+
+    @abstractmethod
+    async def insert_many(self, resource_type: ResourceType, rows: List[dict]) -> int:
+        """
+        Inserts all rows in as few round trips as possible (COPY where supported).
+        All or nothing: raises IntegrityViolationException if any row is rejected.
+        """
+        pass
+
+    @abstractmethod
+    async def insert_each(self, resource_type: ResourceType, items: List[tuple[int, dict]]) -> BulkResult:
+        """
+        Slow path for batches insert_many rejected: items are (index, row) pairs and
+        rows the database rejects are reported instead of failing the batch.
+        """
+        pass
+
 
 class IMissionRepository[T](IRepository[T], ABC):
     @abstractmethod
     async def get_mission_full_timeline(self, mission_id: int) -> T | None:
         pass
 
+    @abstractmethod
+    async def get_with_profile(
+            self,
+            mission_id: int,
+            profile: MissionLoadProfile,
+            resource_type: ResourceType | None = None
+    ) -> T | None:
+        """
+        Fetches a mission with the relationships of `profile` loaded.
+        resource_type selects the timeline for MissionLoadProfile.TIMELINE.
+        Relationships outside the profile raise when accessed.
+        """
+        pass
+
+    @abstractmethod
+    async def get_summary_page(
+            self,
+            filters: MissionFilter,
+            limit: int = 100,
+            cursor: str | None = None,
+            descending: bool = False
+    ) -> Page[T]:
+        """
+        Missions without relationships, keyset-paginated by (scheduled_start_time, id).
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def enforces_availability(self) -> bool:
+        """
+        True when the database itself rejects a resource booked by overlapping events of different
+        missions (PostgreSQL exclusion constraints, raised as ResourceUnavailableException on write)
+        and services may skip check_resource_availability / find_conflicts before writing.
+        False on SQLite: the application-side check is the only guard there.
+        """
+        pass
+
     @abstractmethod
     async def check_resource_availability(
             self,
@@ -87,9 +358,37 @@ class IMissionRepository[T](IRepository[T], ABC):
     ) -> List[Any]:
         pass
 
+    @abstractmethod
+    async def find_conflicts(
+            self,
+            resource_type: ResourceType,
+            candidates: List[tuple[Any, datetime, datetime]],
+            exclude_mission_id: int | None = None
+    ) -> List[tuple[int, Any]]:
+        """
+        Set-based check_resource_availability: candidates are (resource_id, start, end) intervals,
+        all checked in one query. Returns (candidate index, overlapping event) for every clash.
+        """
+        pass
+
+    @abstractmethod
+    async def get_version(self, mission_id: int) -> int | None:
+        """
+        The mission's version alone (a primary key lookup); None when it does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def bump_version(self, mission_id: int) -> int | None:
+        """
+        Increments the mission's version after a change to it or its timelines; returns the new one.
+        """
+        pass
+
     @abstractmethod
     async def bulk_update_timeline(
             self,
+            mission_id: int,
             events_to_create: List[Any],
             events_to_update: List[Any],
             events_to_delete_ids: List[int],
@@ -100,3 +399,25 @@ class IMissionRepository[T](IRepository[T], ABC):
 
 class IOperatorRepository[T](IRepository[T], ABC):
     pass
+
+
+class IResourceRepository(ABC):
+    """
+    Reads over the resources of any registered type (stations, crawlers, ...).
+    """
+
+    @abstractmethod
+    async def find_available(
+            self,
+            resource_type: ResourceType,
+            start: datetime,
+            end: datetime,
+            filters: ResourceFilter,
+            limit: int = 100,
+            cursor: str | None = None
+    ) -> Page[Any]:
+        """
+        Resources of the type with no event overlapping [start, end) in any mission (one anti-join),
+        keyset-paginated by primary key.
+        """
+        pass
@@ -0,0 +1,21 @@
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+
+class BulkItemError(BaseModel):
+    index: int  # Position in the submitted list
+    detail: str
+
+
+class BulkUpdateItem(BaseModel):
+    id: Any  # Primary key of the row to update
+    data: Dict[str, Any]
+
+
+class BulkResult(BaseModel):
+    """
+    Outcome of a bulk operation: primary keys of the affected rows and the rejected items.
+    """
+    succeeded: List[Any] = []
+    errors: List[BulkItemError] = []
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from app.domain.schemas.enums import ResourceType
+
+
+class EventConflict(BaseModel):
+    """
+    An event overlapping at least one event of the same resource in another mission.
+    previous_* / next_* describe its neighbours in the resource's start_time order
+    (LAG / LEAD); the event it overlaps may lie further back when a long one spans several.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    resource_id: int
+    event_id: int
+    mission_id: int
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    previous_event_id: Optional[int] = None
+    previous_mission_id: Optional[int] = None
+    previous_end_time: Optional[datetime] = None
+    next_event_id: Optional[int] = None
+    next_mission_id: Optional[int] = None
+    next_start_time: Optional[datetime] = None
+
+
+class ResourceConflictSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    resource_id: int
+    events: int  # Events of the resource overlapping another one
+    missions: int  # Distinct missions those events belong to
+    first_start: datetime
+    last_start: datetime
+
+
+class ConflictReport(BaseModel):
+    """
+    Outcome of a full scan: the double-booked resources of each scanned type.
+    """
+    events: int = 0
+    resources: Dict[ResourceType, List[ResourceConflictSummary]] = {}
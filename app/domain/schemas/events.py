@@ -1,14 +1,26 @@
-from datetime import datetime
-from typing import Optional, List
+from datetime import datetime, timezone
+from typing import Optional, List, Type, Dict
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from app.domain.schemas.enums import ResourceType
 from app.domain.schemas.resources import (
     StationRead, CrawlerRead, PlatformRead,
     OperatorRead, RoleRead, RtRead
 )
 
 
+def ends_after_start(start_time: datetime, end_time: Optional[datetime]) -> bool:
+    """
+    Whether [start_time, end_time) is a valid event period; an open end always is.
+    Naive values (as stored without a zone) are taken as UTC.
+    """
+    if end_time is None:
+        return True
+    start_time, end_time = (v if v.tzinfo else v.replace(tzinfo=timezone.utc) for v in (start_time, end_time))
+    return start_time < end_time
+
+
 class BaseEventSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -17,7 +29,7 @@ class BaseEventSchema(BaseModel):
 
     @model_validator(mode='after')
     def validate_times(self) -> 'BaseEventSchema':
-        if self.end_time and self.start_time >= self.end_time:
+        if not ends_after_start(self.start_time, self.end_time):
             raise ValueError('Event end_time must be after start_time')
         return self
 
@@ -162,6 +174,25 @@ class MissionPlatformRtRead(MissionPlatformRtBase):
     platform: Optional[PlatformRead] = None
 
 
+# Read schema of each resource type's events
+EVENT_READ_SCHEMAS: dict[ResourceType, Type[BaseModel]] = {
+    ResourceType.STATION: MissionStationRead,
+    ResourceType.CRAWLER: MissionCrawlerRead,
+    ResourceType.PLATFORM: MissionPlatformRead,
+    ResourceType.RT: MissionPlatformRtRead,
+    ResourceType.OPERATOR: MissionOperatorRead,
+}
+
+
+class ActiveAssignments(BaseModel):
+    """
+    The mission each resource is active in at `at`, per resource type,
+    e.g. {"station": {"5": 12}}. Idle resources are absent.
+    """
+    at: datetime
+    assignments: Dict[ResourceType, Dict[int, int]] = {}
+
+
 class BatchEventUpdate[CreateT, UpdateT](BaseModel):
     mission_id: int
     creates: List[CreateT] = []
@@ -0,0 +1,53 @@
+from enum import Enum
+from functools import lru_cache
+from typing import List, Type
+
+from pydantic import BaseModel, create_model
+
+from app.domain.schemas import events as event_schemas
+from app.domain.schemas.enums import ResourceType
+
+
+class ImportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+_EVENT_CREATE_SCHEMAS: dict[ResourceType, Type[BaseModel]] = {
+    ResourceType.STATION: event_schemas.MissionStationCreate,
+    ResourceType.CRAWLER: event_schemas.MissionCrawlerCreate,
+    ResourceType.PLATFORM: event_schemas.MissionPlatformCreate,
+    ResourceType.RT: event_schemas.MissionPlatformRtCreate,
+    ResourceType.OPERATOR: event_schemas.MissionOperatorCreate,
+}
+
+
+@lru_cache
+def event_import_schema(resource_type: ResourceType) -> Type[BaseModel]:
+    """
+    The create schema of the resource's events plus mission_id: imported rows span many missions.
+    """
+    create_schema = _EVENT_CREATE_SCHEMAS[resource_type]
+    return create_model(f"{create_schema.__name__}Import", __base__=create_schema, mission_id=(int, ...))
+
+
+class ImportRowError(BaseModel):
+    row: int  # 1-based position in the input (data rows, excluding a CSV header)
+    detail: str
+
+
+class ImportProgress(BaseModel):
+    """Emitted after each committed chunk."""
+    chunk: int
+    rows: int  # Rows read so far
+    inserted: int
+    rejected: int
+
+
+class ImportReport(BaseModel):
+    rows: int = 0
+    inserted: int = 0
+    rejected: int = 0
+    chunks: int = 0
+    errors: List[ImportRowError] = []
+    errors_truncated: bool = False  # More rows were rejected than are listed in errors
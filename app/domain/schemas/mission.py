@@ -3,7 +3,7 @@ from typing import Optional, List
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from app.domain.schemas.enums import Sections, MissionTypes, MissionStatuses, MissionOrigins
+from app.domain.schemas.enums import Sections, MissionTypes, MissionStatuses, MissionOrigins, ResourceType
 from app.domain.schemas.events import (
     MissionStationRead,
     MissionCrawlerRead,
@@ -41,6 +41,11 @@ class MissionUpdate(BaseModel):
     actual_end_time: Optional[datetime] = None
 
 
+class MissionSummary(MissionBase):
+    """A mission without its timelines, for listings."""
+    id: int
+
+
 class MissionRead(MissionBase):
     id: int
 
@@ -52,3 +57,31 @@ class MissionRead(MissionBase):
 
     class Config:
         populate_by_name = True
+
+
+# MissionRead / MissionTimelineWindow field holding each resource type's events
+TIMELINE_FIELDS = {
+    ResourceType.STATION: "stations",
+    ResourceType.CRAWLER: "crawlers",
+    ResourceType.PLATFORM: "platforms",
+    ResourceType.OPERATOR: "operators",
+    ResourceType.RT: "links",
+}
+
+
+class MissionTimelineWindow(BaseModel):
+    """
+    The mission's events intersecting [window_start, window_end), for the requested resource types.
+    Same timeline keys as MissionRead; types that were not requested stay empty.
+    """
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    mission_id: int
+    window_start: datetime
+    window_end: datetime
+
+    stations: List[MissionStationRead] = Field(default_factory=list, alias="mission_stations")
+    crawlers: List[MissionCrawlerRead] = Field(default_factory=list, alias="mission_crawlers")
+    platforms: List[MissionPlatformRead] = Field(default_factory=list, alias="mission_platforms")
+    operators: List[MissionOperatorRead] = Field(default_factory=list, alias="mission_operators")
+    links: List[MissionPlatformRtRead] = Field(default_factory=list)
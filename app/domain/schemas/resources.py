@@ -1,8 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Type
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from app.domain.schemas.enums import Sites, PlatformTypes, RtLocations, OperatorRolesEnum
+from app.domain.schemas.enums import Sites, PlatformTypes, RtLocations, OperatorRolesEnum, ResourceType
 
 
 # --- Base Configuration ---
@@ -159,3 +159,13 @@ class OperatorUpdate(BaseSchema):
 class OperatorRead(OperatorBase):
     id: int
     roles: List[RoleRead] = None
+
+
+# Read schema of each resource type
+RESOURCE_READ_SCHEMAS: dict[ResourceType, Type[BaseModel]] = {
+    ResourceType.STATION: StationRead,
+    ResourceType.CRAWLER: CrawlerRead,
+    ResourceType.PLATFORM: PlatformRead,
+    ResourceType.RT: RtRead,
+    ResourceType.OPERATOR: OperatorRead,
+}
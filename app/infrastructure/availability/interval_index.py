@@ -0,0 +1,361 @@
+import asyncio
+import logging
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, List, Optional
+
+from sqlalchemy import event, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.base_manager import AbstractDBManager
+from app.db.sql.models.availability import AvailabilityVersion
+from app.domain.schemas.enums import ResourceType
+from app.infrastructure.availability.triggers import install_version_triggers
+from app.infrastructure.resource_registry.sql.resource_registry import SQLResourceRegistry
+
+logger = logging.getLogger(__name__)
+
+# Open events (end_time IS NULL) run until the end of time
+OPEN_END = datetime.max.replace(tzinfo=timezone.utc)
+
+# Touched resources re-read after a commit; larger writes reload the whole type
+REFRESH_MAX_RESOURCES = 1_000
+
+# session.info key: (index, {resource type: _PendingWrite}) of the transaction's tracked writes
+_PENDING_WRITES = "availability_writes"
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; the index compares everything as UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedEvent:
+    """The columns of an event that availability checks read."""
+    id: int
+    mission_id: int
+    resource_id: Any
+    start_time: datetime
+    end_time: Optional[datetime]
+
+
+class _Timeline:
+    """One resource's events sorted by start, with the running maximum of their ends."""
+    __slots__ = ("events", "starts", "max_ends")
+
+    def __init__(self, events: Iterable[IndexedEvent]):
+        self.events = sorted(events, key=lambda e: (e.start_time, e.id))
+        self.starts = [e.start_time for e in self.events]
+        self.max_ends = []
+        reach = None
+        for e in self.events:
+            end = e.end_time or OPEN_END
+            reach = end if reach is None or end > reach else reach
+            self.max_ends.append(reach)
+
+    def overlapping(self, start: datetime, end: datetime) -> List[IndexedEvent]:
+        # Events starting before `end` are a prefix; walking it backwards stops at the first
+        # position whose running max end is <= start, as nothing before it reaches `start`.
+        # A resource's events do not overlap, so that is O(log n + k).
+        hits = []
+        i = bisect_left(self.starts, end) - 1
+        while i >= 0 and self.max_ends[i] > start:
+            e = self.events[i]
+            if (e.end_time or OPEN_END) > start:
+                hits.append(e)
+            i -= 1
+        hits.reverse()
+        return hits
+
+
+@dataclass
+class _TypeIndex:
+    version: int
+    # Events ending before this were not loaded; earlier checks go to SQL
+    covered_from: datetime
+    timelines: dict[Any, _Timeline]
+
+
+@dataclass
+class _PendingWrite:
+    # Version when the transaction first locked the type's row
+    before: Optional[int]
+    # None when the written resources are not known: the type is reloaded after commit
+    resource_ids: Optional[set] = field(default_factory=set)
+    # Version read just before commit, this transaction's bumps included
+    after: Optional[int] = None
+
+
+class AvailabilityIndex:
+    """
+    Per-worker copy of the event intervals of every resource type, answering availability and
+    conflict checks from memory instead of an overlap query per check.
+
+    Each resource type carries the version of availability_versions it was loaded at. Triggers
+    (installed by `warm`) bump that row on every write to the type's event table, from any worker
+    or path, so a check first reads the row (one primary-key lookup in the caller's transaction)
+    and only answers from memory when it matches. Otherwise, or while the type is cold, the
+    caller falls back to SQL and the type is reloaded in the background.
+
+    Writes tracked with `track_write` keep the index warm in the worker that made them: after
+    commit the touched resources are re-read, provided the version moved by that commit only.
+    """
+
+    def __init__(self, db_manager: AbstractDBManager, lookback: timedelta):
+        self.db_manager = db_manager
+        self.lookback = lookback
+        self._types: dict[ResourceType, _TypeIndex] = {}
+        self._reloads: dict[ResourceType, asyncio.Task] = {}
+        # Strong references to the post-commit refreshes in flight, and their count per type
+        self._tasks: set[asyncio.Task] = set()
+        self._refreshing: dict[ResourceType, int] = defaultdict(int)
+
+    async def warm(self) -> None:
+        """
+        Installs the version triggers if missing (they exist only while the index is in use),
+        then loads every type.
+        """
+        async with self.db_manager.get_connection() as session:
+            async with self.db_manager.transaction(session) as tx_session:
+                installed = await install_version_triggers(tx_session)
+        if installed:
+            logger.info("Installed availability version triggers: %s", ", ".join(installed))
+
+        results = await asyncio.gather(
+            *(self._reload(resource_type) for resource_type in ResourceType),
+            return_exceptions=True
+        )
+        for resource_type, result in zip(ResourceType, results):
+            if isinstance(result, Exception):
+                logger.error("Availability index for %s stays cold: %s", resource_type.value, result)
+
+    async def close(self) -> None:
+        tasks = [*self._reloads.values(), *self._tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def overlapping(
+            self,
+            session: AsyncSession,
+            resource_type: ResourceType,
+            resource_id: Any,
+            start: datetime,
+            end: datetime,
+            exclude_mission_id: int | None = None
+    ) -> Optional[List[IndexedEvent]]:
+        conflicts = await self.conflicts(session, resource_type, [(resource_id, start, end)], exclude_mission_id)
+        return None if conflicts is None else [e for _, e in conflicts]
+
+    async def conflicts(
+            self,
+            session: AsyncSession,
+            resource_type: ResourceType,
+            candidates: List[tuple[Any, datetime, datetime]],
+            exclude_mission_id: int | None = None
+    ) -> Optional[List[tuple[int, IndexedEvent]]]:
+        """
+        (candidate index, event) for every event overlapping a candidate interval, like
+        IMissionRepository.find_conflicts. None when the index cannot answer.
+        """
+        if not candidates:
+            return []
+        index = self._types.get(resource_type)
+        if index is None or any(_utc(start) < index.covered_from for _, start, _ in candidates):
+            return None
+        index = await self._current(session, resource_type)
+        if index is None:
+            return None
+
+        conflicts = []
+        for i, (resource_id, start, end) in enumerate(candidates):
+            timeline = index.timelines.get(resource_id)
+            if timeline is None:
+                continue
+            conflicts.extend(
+                (i, e) for e in timeline.overlapping(_utc(start), _utc(end))
+                if not exclude_mission_id or e.mission_id != exclude_mission_id
+            )
+        return conflicts
+
+    async def track_write(
+            self,
+            session: AsyncSession,
+            resource_type: ResourceType,
+            resource_ids: Optional[Iterable[Any]] = ()
+    ) -> None:
+        """
+        Call before writing events of `resource_type` in the session's transaction, and again
+        with the resource ids written if they are only known afterwards (None: not known).
+        """
+        _, writes = session.info.setdefault(_PENDING_WRITES, (self, {}))
+        write = writes.get(resource_type)
+        if write is None:
+            # A no-op UPDATE locks the row until commit (the database write lock on SQLite):
+            # writers of the type queue here, so the version read before commit counts only
+            # this transaction's bumps
+            statement = (
+                update(AvailabilityVersion)
+                .where(AvailabilityVersion.resource_type == resource_type.value)
+                .values(version=AvailabilityVersion.version)
+                .returning(AvailabilityVersion.version)
+            )
+            with session.no_autoflush:
+                # Flushing pending events first would bump the version ahead of the lock
+                before = (await session.execute(statement)).scalar_one_or_none()
+            write = writes[resource_type] = _PendingWrite(before=before)
+
+        if resource_ids is None:
+            write.resource_ids = None
+        elif write.resource_ids is not None:
+            write.resource_ids.update(resource_ids)
+
+    async def _current(self, session: AsyncSession, resource_type: ResourceType) -> Optional[_TypeIndex]:
+        pending = session.info.get(_PENDING_WRITES)
+        if pending and resource_type in pending[1]:
+            # Only SQL sees this transaction's own uncommitted writes
+            return None
+        version = await self._read_version(session, resource_type)
+        index = self._types.get(resource_type)
+        if index is None or version != index.version:
+            # A refresh of this worker's own commit catches up without a full reload
+            if not self._refreshing[resource_type]:
+                self._schedule_reload(resource_type)
+            return None
+        return index
+
+    @staticmethod
+    async def _read_version(session: AsyncSession, resource_type: ResourceType) -> Optional[int]:
+        statement = select(AvailabilityVersion.version).where(
+            AvailabilityVersion.resource_type == resource_type.value
+        )
+        return (await session.execute(statement)).scalar_one_or_none()
+
+    def _schedule_reload(self, resource_type: ResourceType) -> None:
+        running = self._reloads.get(resource_type)
+        if running is not None and not running.done():
+            return
+        task = asyncio.get_running_loop().create_task(self._reload(resource_type))
+        task.add_done_callback(lambda t: self._log_failure(t, resource_type))
+        self._reloads[resource_type] = task
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task, resource_type: ResourceType) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Availability index refresh for %s failed: %s", resource_type.value, task.exception())
+
+    async def _read_events(
+            self,
+            resource_type: ResourceType,
+            covered_from: datetime,
+            resource_ids: Optional[set] = None
+    ) -> tuple[Optional[int], dict[Any, List[IndexedEvent]]]:
+        """The type's version and its events ending after `covered_from`, from one snapshot."""
+        meta = SQLResourceRegistry.get(resource_type)
+        event_model = meta.event_model
+        fk = getattr(event_model, meta.fk_field)
+
+        statement = select(
+            event_model.id, event_model.mission_id, fk, event_model.start_time, event_model.end_time
+        ).where(or_(event_model.end_time > covered_from, event_model.end_time.is_(None)))
+        if resource_ids is not None:
+            statement = statement.where(fk.in_(resource_ids))
+
+        events = defaultdict(list)
+        # The primary: a replica may lag behind the versions that checks read
+        async with self.db_manager.get_connection() as session:
+            async with self.db_manager.snapshot_transaction(session):
+                version = await self._read_version(session, resource_type)
+                result = await session.execute(statement)
+                for event_id, mission_id, resource_id, start_time, end_time in result.all():
+                    events[resource_id].append(IndexedEvent(
+                        id=event_id,
+                        mission_id=mission_id,
+                        resource_id=resource_id,
+                        start_time=_utc(start_time),
+                        end_time=_utc(end_time) if end_time is not None else None
+                    ))
+        return version, events
+
+    async def _reload(self, resource_type: ResourceType) -> None:
+        covered_from = datetime.now(timezone.utc) - self.lookback
+        version, events = await self._read_events(resource_type, covered_from)
+        self._types[resource_type] = _TypeIndex(
+            version=version or 0,
+            covered_from=covered_from,
+            timelines={resource_id: _Timeline(rows) for resource_id, rows in events.items()}
+        )
+
+    def _after_commit(self, writes: dict[ResourceType, _PendingWrite]) -> None:
+        loop = asyncio.get_running_loop()
+        for resource_type, write in writes.items():
+            self._refreshing[resource_type] += 1
+            task = loop.create_task(self._refresh(resource_type, write))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(lambda t, rt=resource_type: self._log_failure(t, rt))
+
+    async def _refresh(self, resource_type: ResourceType, write: _PendingWrite) -> None:
+        try:
+            await self._apply_write(resource_type, write)
+        finally:
+            self._refreshing[resource_type] -= 1
+
+    async def _apply_write(self, resource_type: ResourceType, write: _PendingWrite) -> None:
+        index = self._types.get(resource_type)
+        if (
+                index is None
+                or write.before is None
+                or write.resource_ids is None
+                or len(write.resource_ids) > REFRESH_MAX_RESOURCES
+                or index.version != write.before
+        ):
+            self._schedule_reload(resource_type)
+            return
+        if not write.resource_ids:
+            return
+
+        version, events = await self._read_events(resource_type, index.covered_from, write.resource_ids)
+        if version != write.after:
+            # Another transaction committed in between; only a full read catches up
+            self._schedule_reload(resource_type)
+            return
+        if self._types.get(resource_type) is not index or index.version != write.before:
+            # A reload or another refresh got there first
+            return
+
+        for resource_id in write.resource_ids:
+            if events.get(resource_id):
+                index.timelines[resource_id] = _Timeline(events[resource_id])
+            else:
+                index.timelines.pop(resource_id, None)
+        index.version = version
+
+
+@event.listens_for(Session, "before_commit")
+def _read_written_versions(session: Session) -> None:
+    pending = session.info.get(_PENDING_WRITES)
+    if not pending:
+        return
+    # Runs inside the AsyncSession's greenlet, so synchronous execution is allowed here
+    for resource_type, write in pending[1].items():
+        write.after = session.execute(
+            select(AvailabilityVersion.version).where(AvailabilityVersion.resource_type == resource_type.value)
+        ).scalar_one_or_none()
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_WRITES, None)
+    if pending:
+        index, writes = pending
+        index._after_commit(writes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_writes(session: Session) -> None:
+    session.info.pop(_PENDING_WRITES, None)
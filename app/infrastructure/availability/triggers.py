@@ -0,0 +1,100 @@
+"""
+The triggers bumping availability_versions on every write to an event table.
+
+Each bump updates the type's single counter row and keeps it locked until commit, so the
+writers of a resource type queue behind each other while the triggers exist. They are
+therefore installed only when the availability index is enabled (AvailabilityIndex.warm),
+and are removed with `python -m app.cli.availability_triggers drop` after turning it off.
+"""
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.schemas.enums import ResourceType
+from app.infrastructure.resource_registry.sql.resource_registry import SQLResourceRegistry
+
+_PG_BUMP_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_availability_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO availability_versions (resource_type, version) VALUES (TG_ARGV[0], 1)
+    ON CONFLICT (resource_type) DO UPDATE SET version = availability_versions.version + 1;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+_PG_TRIGGER = """
+CREATE TRIGGER {name}
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+FOR EACH STATEMENT EXECUTE FUNCTION bump_availability_version('{resource_type}')
+"""
+
+_SQLITE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS {name}
+AFTER {operation} ON {table}
+BEGIN
+    INSERT INTO availability_versions (resource_type, version) VALUES ('{resource_type}', 1)
+    ON CONFLICT (resource_type) DO UPDATE SET version = version + 1;
+END
+"""
+
+# SQLite has no statement-level triggers; one per operation, firing per row
+_SQLITE_OPERATIONS = ("INSERT", "UPDATE", "DELETE")
+
+
+def _triggers(dialect: str) -> dict[str, tuple[str, str]]:
+    """Trigger name -> (event table, CREATE TRIGGER statement)."""
+    triggers = {}
+    for resource_type in ResourceType:
+        table = SQLResourceRegistry.get(resource_type).event_model.__tablename__
+        values = {"table": table, "resource_type": resource_type.value}
+        if dialect == "postgresql":
+            name = f"{table}_availability"
+            triggers[name] = (table, _PG_TRIGGER.format(name=name, **values))
+        else:
+            for operation in _SQLITE_OPERATIONS:
+                name = f"{table}_availability_{operation}"
+                triggers[name] = (table, _SQLITE_TRIGGER.format(name=name, operation=operation, **values))
+    return triggers
+
+
+async def _existing(session: AsyncSession, dialect: str, names: List[str]) -> set[str]:
+    if dialect == "postgresql":
+        statement = text("SELECT tgname FROM pg_trigger WHERE tgname = ANY(:names)")
+        return set((await session.execute(statement, {"names": names})).scalars())
+    statement = text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    return set((await session.execute(statement)).scalars()) & set(names)
+
+
+async def install_version_triggers(session: AsyncSession) -> List[str]:
+    """
+    Creates the missing triggers in the session's transaction; returns their names.
+    Nothing is locked when all exist, so every worker can call this at startup.
+    """
+    dialect = session.bind.dialect.name
+    if dialect == "postgresql":
+        # Workers starting together would otherwise race to create the same trigger
+        await session.execute(text("SELECT pg_advisory_xact_lock(hashtext('availability_triggers'))"))
+    triggers = _triggers(dialect)
+    missing = [name for name in triggers if name not in await _existing(session, dialect, list(triggers))]
+    if missing and dialect == "postgresql":
+        await session.execute(text(_PG_BUMP_FUNCTION))
+    for name in missing:
+        await session.execute(text(triggers[name][1]))
+    return missing
+
+
+async def drop_version_triggers(session: AsyncSession) -> List[str]:
+    """Drops the installed triggers in the session's transaction; returns their names."""
+    dialect = session.bind.dialect.name
+    triggers = _triggers(dialect)
+    existing = [name for name in triggers if name in await _existing(session, dialect, list(triggers))]
+    for name in existing:
+        if dialect == "postgresql":
+            await session.execute(text(f"DROP TRIGGER IF EXISTS {name} ON {triggers[name][0]}"))
+        else:
+            await session.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+    if dialect == "postgresql":
+        await session.execute(text("DROP FUNCTION IF EXISTS bump_availability_version()"))
+    return existing
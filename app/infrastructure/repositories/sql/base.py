@@ -1,21 +1,60 @@
-from typing import Any, List
+import logging
+from typing import Any, List, Callable, Awaitable, Optional, Type, AsyncIterator
 
+from pydantic import BaseModel
+from sqlalchemy import inspect as sa_inspect, insert, update, delete
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 from sqlmodel import select, SQLModel
 
 from app.domain.exceptions.domain_exception import (
+    BulkOperationException,
     IntegrityViolationException,
-    RepositoryException
+    RepositoryException,
+    ResourceUnavailableException
 )
-from app.domain.interfaces.repository import IRepository
+from app.domain.interfaces.repository import IRepository, Page, ListQuery
+from app.domain.schemas.bulk import BulkResult, BulkItemError
+from app.infrastructure.repositories.sql.loading import (
+    expire_changed_relationships,
+    load_response_relationships,
+    mark_new_collections_loaded
+)
+from app.infrastructure.repositories.sql.mission_versions import bump_referencing_missions
+from app.infrastructure.repositories.sql.pagination import keyset_page
+from app.infrastructure.repositories.sql.query import (
+    apply_filters,
+    apply_order,
+    apply_projection,
+    order_keys
+)
+
+logger = logging.getLogger(__name__)
+
+# SQLSTATE of a PostgreSQL exclusion constraint violation (the ex_*_no_overlap constraints)
+EXCLUSION_VIOLATION = "23P01"
+
+
+def is_exclusion_violation(error: IntegrityError) -> bool:
+    # asyncpg and psycopg expose the SQLSTATE as `sqlstate`, psycopg2 as `pgcode`
+    code = getattr(error.orig, "sqlstate", None) or getattr(error.orig, "pgcode", None)
+    return code == EXCLUSION_VIOLATION
+
+
+def overlap_error(error: IntegrityError) -> ResourceUnavailableException:
+    # The driver message names constraints and key values; it goes to the log, not the client
+    logger.info("Exclusion constraint rejected a booking: %s", error.orig)
+    return ResourceUnavailableException("Resource is busy in another mission during the requested time.")
 
 
 class SQLAlchemyRepository[T: SQLModel](IRepository[T]):
 
-    def __init__(self, session: AsyncSession, model: type[T]):
+    def __init__(self, session: AsyncSession, model: type[T], response_schema: Optional[Type[BaseModel]] = None):
         self.session = session
         self._model = model
+        # The schema written objects are serialized with; only its relationships are loaded after a write
+        self.response_schema = response_schema
 
     @property
     def model(self) -> type[T]:
@@ -25,29 +64,80 @@ class SQLAlchemyRepository[T: SQLModel](IRepository[T]):
     def model(self, value):
         self._model = value
 
+    @property
+    def pk(self):
+        """
+        The model's primary key attribute (`id`, `num` or `tail_num`, depending on the model).
+        """
+        return getattr(self.model, sa_inspect(self.model).primary_key[0].key)
+
     async def get(self, id: Any) -> T | None:
         try:
-            statement = select(self.model).where(self.model.id == id)
+            statement = select(self.model).where(self.pk == id)
             result = await self.session.execute(statement)
             return result.scalar_one_or_none()
         except SQLAlchemyError as e:
             raise RepositoryException(f"Database error retrieving {self.model.__name__}") from e
 
-    async def get_multi(self, skip: int = 0, limit: int = 100) -> List[T]:
+    async def get_multi(self, skip: int = 0, limit: int = 100, query: ListQuery | None = None) -> List[T]:
+        query = query or ListQuery()
+        statement = self._list_statement(query)
+        if query.sort:
+            statement = apply_order(statement, order_keys(self.model, self.pk, query))
+
         try:
-            statement = select(self.model).offset(skip).limit(limit)
-            result = await self.session.execute(statement)
+            result = await self.session.execute(statement.offset(skip).limit(limit))
             return [t for t in result.scalars().all()]
         except SQLAlchemyError as e:
             raise RepositoryException(f"Database error retrieving list of {self.model.__name__}") from e
 
+    async def get_page(
+            self,
+            limit: int = 100,
+            cursor: str | None = None,
+            query: ListQuery | None = None
+    ) -> Page[T]:
+        query = query or ListQuery()
+        keys = order_keys(self.model, self.pk, query)
+        return await self._keyset_page(self._list_statement(query), keys, limit, cursor)
+
+    async def _keyset_page(
+            self,
+            statement,
+            keys: List[tuple[Any, bool]],
+            limit: int,
+            cursor: str | None
+    ) -> Page[T]:
+        return await keyset_page(self.session, self.model, statement, keys, limit, cursor)
+
+    async def stream(self, query: ListQuery | None = None, batch_size: int = 1000) -> AsyncIterator[T]:
+        query = query or ListQuery()
+        statement = apply_order(self._list_statement(query), order_keys(self.model, self.pk, query))
+        # Only columns are exported; per-batch relationship loads would defeat the point
+        statement = statement.options(noload("*")).execution_options(yield_per=batch_size)
+
+        try:
+            result = await self.session.stream_scalars(statement)
+            async for obj in result:
+                yield obj
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error streaming {self.model.__name__}") from e
+
+    def _list_statement(self, query: ListQuery):
+        statement = apply_filters(select(self.model), self.model, query)
+        return apply_projection(statement, self.model, query)
+
     async def create(self, obj_in: T) -> T:
         try:
             self.session.add(obj_in)
             await self.session.flush()  # This is where constraints are checked
-            await self.session.refresh(obj_in)
+            # No refresh: the pk comes back from the INSERT and there are no server-side defaults
+            mark_new_collections_loaded(obj_in)
+            await self._load_for_response(obj_in)
             return obj_in
         except IntegrityError as e:
+            if is_exclusion_violation(e):
+                raise overlap_error(e) from e
             # TODO: Change this to a unique exception based on the error
             raise IntegrityViolationException(
                 f"Could not create {self.model.__name__}: Duplicate entry or invalid reference.") from e
@@ -66,25 +156,199 @@ class SQLAlchemyRepository[T: SQLModel](IRepository[T]):
             for field, value in update_data.items():
                 setattr(obj_current, field, value)
 
+            await self._bump_referencing_missions([getattr(obj_current, self.pk.key)])
             self.session.add(obj_current)
             await self.session.flush()
-            await self.session.refresh(obj_current)
+            expire_changed_relationships(self.session.sync_session, obj_current, update_data)
+            await self._load_for_response(obj_current)
             return obj_current
         except IntegrityError as e:
+            if is_exclusion_violation(e):
+                raise overlap_error(e) from e
             raise IntegrityViolationException(f"Could not update {self.model.__name__}: Conflict detected.") from e
         except SQLAlchemyError as e:
             raise RepositoryException(f"Database error updating {self.model.__name__}") from e
 
+    async def update_by_id(self, id: Any, data: dict) -> T | None:
+        """
+        One UPDATE ... WHERE pk = :id RETURNING *, instead of SELECT + flush + refresh.
+        """
+        data = {k: v for k, v in data.items() if k != self.pk.key}
+        if not data:
+            obj = await self.get(id)
+        else:
+            try:
+                await self._bump_referencing_missions([id])
+                statement = (
+                    update(self.model)
+                    .where(self.pk == id)
+                    .values(**data)
+                    .returning(self.model)
+                    # Overwrite an already-loaded instance, including relationships whose FK changed
+                    .execution_options(populate_existing=True)
+                )
+                result = await self.session.execute(statement)
+                obj = result.scalar_one_or_none()
+            except IntegrityError as e:
+                if is_exclusion_violation(e):
+                    raise overlap_error(e) from e
+                raise IntegrityViolationException(f"Could not update {self.model.__name__}: Conflict detected.") from e
+            except SQLAlchemyError as e:
+                raise RepositoryException(f"Database error updating {self.model.__name__}") from e
+
+        if obj is not None:
+            await self._load_for_response(obj)
+        return obj
+
+    async def _bump_referencing_missions(self, ids: List[Any]) -> None:
+        # Missions serialize the resources they book, so GET /missions/{id} must not answer 304 after
+        # a resource edit; deletes go first, before the cascade takes the events along
+        statement = bump_referencing_missions(self.model, ids)
+        if statement is not None:
+            await self.session.execute(statement)
+
+    async def _load_for_response(self, obj: T) -> None:
+        """
+        Loads the relationships the response schema reads, so serialization never lazy loads
+        outside the greenlet. Many-to-one targets are usually already in the identity map.
+        """
+        if self.response_schema is not None:
+            await self.session.run_sync(lambda _: load_response_relationships(obj, self.response_schema))
+
     async def delete(self, id: Any) -> bool:
+        """
+        One DELETE ... RETURNING; False if no row matched.
+        Dependent rows go through the foreign keys' ON DELETE CASCADE, so nothing is loaded first.
+        """
         try:
-            obj = await self.get(id)
-            if obj:
-                await self.session.delete(obj)
-                await self.session.flush()
-                return True
-            return False
+            await self._bump_referencing_missions([id])
+            statement = delete(self.model).where(self.pk == id).returning(self.pk)
+            result = await self.session.execute(statement)
+            return result.scalar_one_or_none() is not None
         except IntegrityError as e:
             raise IntegrityViolationException(
                 f"Cannot delete {self.model.__name__}: It is being used by another resource.") from e
         except SQLAlchemyError as e:
             raise RepositoryException(f"Database error deleting {self.model.__name__}") from e
+
+    async def bulk_create(self, items: List[tuple[int, T]], atomic: bool = False) -> BulkResult:
+        columns = [c.key for c in self.model.__table__.columns]
+        rows = []
+        for index, obj in items:
+            row = {key: getattr(obj, key) for key in columns}
+            if row.get(self.pk.key) is None:
+                row.pop(self.pk.key, None)  # Let the database generate it
+            rows.append((index, row))
+
+        async def run(batch: List[tuple[int, dict]]) -> List[Any]:
+            # One multi-row INSERT ... RETURNING (insertmanyvalues) for the whole batch
+            statement = insert(self.model).returning(self.pk, sort_by_parameter_order=True)
+            result = await self.session.execute(statement, [row for _, row in batch])
+            return list(result.scalars().all())
+
+        return await self._run_bulk(rows, run, atomic, "create")
+
+    async def bulk_update(self, items: List[tuple[int, Any, dict]], atomic: bool = False) -> BulkResult:
+        if not items:
+            return BulkResult()
+
+        try:
+            ids = [id for _, id, _ in items]
+            result = await self.session.execute(select(self.pk).where(self.pk.in_(ids)))
+            existing = set(result.scalars().all())
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error updating {self.model.__name__}") from e
+
+        missing = [
+            BulkItemError(index=index, detail=f"{self.model.__name__} {id} not found")
+            for index, id, _ in items if id not in existing
+        ]
+        if atomic and missing:
+            raise BulkOperationException(f"Bulk update of {self.model.__name__} rejected",
+                                         errors=[e.model_dump() for e in missing])
+
+        rows = [
+            (index, {**data, self.pk.key: id})
+            for index, id, data in items if id in existing
+        ]
+
+        async def run(batch: List[tuple[int, dict]]) -> List[Any]:
+            # ORM bulk UPDATE by primary key: executemany of a single UPDATE statement
+            changed = [row for _, row in batch if len(row) > 1]
+            if changed:
+                await self._bump_referencing_missions([row[self.pk.key] for row in changed])
+                await self.session.execute(update(self.model), changed)
+            return [row[self.pk.key] for _, row in batch]
+
+        outcome = await self._run_bulk(rows, run, atomic, "update")
+        outcome.errors = sorted(outcome.errors + missing, key=lambda e: e.index)
+        return outcome
+
+    async def bulk_delete(self, items: List[tuple[int, Any]], atomic: bool = False) -> BulkResult:
+        async def run(batch: List[tuple[int, Any]]) -> List[Any]:
+            await self._bump_referencing_missions([id for _, id in batch])
+            statement = delete(self.model).where(self.pk.in_([id for _, id in batch])).returning(self.pk)
+            result = await self.session.execute(statement)
+            return list(result.scalars().all())
+
+        outcome = await self._run_bulk(items, run, atomic, "delete")
+
+        deleted = set(outcome.succeeded)
+        failed = {e.index for e in outcome.errors}
+        missing = [
+            BulkItemError(index=index, detail=f"{self.model.__name__} {id} not found")
+            for index, id in items if id not in deleted and index not in failed
+        ]
+        if atomic and missing:
+            # Raising rolls back the deletes that did happen
+            raise BulkOperationException(f"Bulk delete of {self.model.__name__} rejected",
+                                         errors=[e.model_dump() for e in missing])
+        outcome.errors = sorted(outcome.errors + missing, key=lambda e: e.index)
+        return outcome
+
+    async def _run_bulk(
+            self,
+            items: List[tuple],
+            run: Callable[[List[tuple]], Awaitable[List[Any]]],
+            atomic: bool,
+            action: str
+    ) -> BulkResult:
+        """
+        Runs the whole batch as one statement.
+        Non-atomic batches run inside a SAVEPOINT; if the database rejects the batch,
+        it is replayed row by row (each in its own SAVEPOINT) so only the offending
+        rows are reported and the rest still go through.
+        """
+        if not items:
+            return BulkResult()
+
+        try:
+            if atomic:
+                return BulkResult(succeeded=await run(items))
+
+            try:
+                async with self.session.begin_nested():
+                    return BulkResult(succeeded=await run(items))
+            except IntegrityError:
+                pass
+
+            outcome = BulkResult()
+            for item in items:
+                try:
+                    async with self.session.begin_nested():
+                        outcome.succeeded.extend(await run([item]))
+                except IntegrityError as e:
+                    if is_exclusion_violation(e):
+                        detail = overlap_error(e).message
+                    else:
+                        # The driver message names constraints and key values; it goes to the log only
+                        logger.info("Bulk %s of %s item %s rejected: %s", action, self.model.__name__, item[0], e.orig)
+                        detail = f"Could not {action} {self.model.__name__}: constraint violated."
+                    outcome.errors.append(BulkItemError(index=item[0], detail=detail))
+            return outcome
+
+        except IntegrityError as e:
+            raise IntegrityViolationException(
+                f"Bulk {action} of {self.model.__name__} failed: constraint violated.") from e
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error during bulk {action} of {self.model.__name__}") from e
@@ -1,17 +1,117 @@
-from typing import Any, Optional, Type
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional, Type, AsyncIterator, List
 
+from sqlalchemy import Select, and_, case, func, insert, update, delete, or_
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, raiseload
 from sqlmodel import select, SQLModel
 
-from app.domain.interfaces.repository import IEventRepository
+from app.db.sql.models.mission import Mission
+from app.domain.exceptions.domain_exception import (
+    IntegrityViolationException,
+    InvalidQueryException,
+    RepositoryException
+)
+from app.domain.interfaces.repository import IEventRepository, ListQuery, Page
+from app.domain.schemas.bulk import BulkResult
 from app.domain.schemas.enums import ResourceType
+from app.domain.schemas.events import EVENT_READ_SCHEMAS
+from app.infrastructure.availability.interval_index import AvailabilityIndex
 from app.infrastructure.repositories.sql.base import SQLAlchemyRepository
+from app.infrastructure.repositories.sql.loading import schema_load_options
+from app.infrastructure.repositories.sql.pagination import encode_cursor, decode_cursor
+from app.infrastructure.repositories.sql.query import apply_order, coerce_value, cursor_value, keyset_predicate
 from app.infrastructure.resource_registry.sql.resource_registry import SQLResourceRegistry
 
 
+@lru_cache
+def _window_options(resource_type: ResourceType) -> tuple:
+    # Built on first use: the mappers must be configured before relationships are inspected
+    event_model = SQLResourceRegistry.get(resource_type).event_model
+    return (*schema_load_options(event_model, EVENT_READ_SCHEMAS[resource_type]), raiseload("*"))
+
+
+def _conflicts_statement(resource_type: ResourceType, from_resource: Any = None) -> Select:
+    """
+    Events overlapping an event of the same resource in another mission (a mission may overlap
+    its own events, as the booking checks and exclusion constraints allow).
+
+    One pass over the event table finds the candidates: a sort by (resource, start_time) and
+    window aggregates over it, O(n log n) in the database. An event overlaps an earlier one when
+    it starts before the latest end_time preceding it (or after an open event), and a later one
+    when the next start (LEAD) comes before its own end. LAG(end_time) alone would miss events
+    nested inside a long one, hence the running MAX. The windows can't tell whose events they
+    compare, so each candidate, usually a small share of the rows, is confirmed by probing
+    ix_<table>_<fk>_period for an overlapping event of another mission.
+    Partitions are whole resources, so `from_resource` can prune rows before the window.
+    """
+    meta = SQLResourceRegistry.get(resource_type)
+    event_model = meta.event_model
+    fk = getattr(event_model, meta.fk_field)
+
+    partition = {"partition_by": fk, "order_by": (event_model.start_time, event_model.id)}
+    earlier = {**partition, "rows": (None, -1)}
+    scan = select(
+        fk.label("resource_id"),
+        event_model.id.label("event_id"),
+        event_model.mission_id,
+        event_model.start_time,
+        event_model.end_time,
+        func.lag(event_model.id).over(**partition).label("previous_event_id"),
+        func.lag(event_model.mission_id).over(**partition).label("previous_mission_id"),
+        func.lag(event_model.end_time, type_=event_model.end_time.type).over(**partition).label("previous_end_time"),
+        func.lead(event_model.id).over(**partition).label("next_event_id"),
+        func.lead(event_model.mission_id).over(**partition).label("next_mission_id"),
+        func.lead(event_model.start_time, type_=event_model.start_time.type).over(**partition).label("next_start_time"),
+        func.max(event_model.end_time).over(**earlier).label("earlier_end"),
+        func.max(case((event_model.end_time.is_(None), 1), else_=0)).over(**earlier).label("earlier_open"),
+    )
+    if from_resource is not None:
+        scan = scan.where(fk >= from_resource)
+    scan = scan.subquery("scan")
+
+    other = aliased(event_model)
+    other_mission = select(other.id).where(
+        getattr(other, meta.fk_field) == scan.c.resource_id,
+        other.mission_id != scan.c.mission_id,
+        or_(scan.c.end_time.is_(None), other.start_time < scan.c.end_time),
+        or_(other.end_time.is_(None), other.end_time > scan.c.start_time)
+    )
+
+    columns = (c for c in scan.c if c.key not in ("earlier_end", "earlier_open"))
+    return select(*columns).where(
+        or_(
+            scan.c.earlier_open == 1,
+            scan.c.start_time < scan.c.earlier_end,
+            and_(
+                scan.c.next_start_time.is_not(None),
+                or_(scan.c.end_time.is_(None), scan.c.next_start_time < scan.c.end_time)
+            )
+        ),
+        other_mission.exists()
+    )
+
+
 class SQLEventRepository(IEventRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, availability_index: AvailabilityIndex | None = None):
         self.session = session
+        # Kept warm with the resources this repository writes; see AvailabilityIndex.track_write
+        self.availability_index = availability_index
+
+    async def _track_write(self, resource_type: ResourceType, resource_ids: Optional[List[Any]] = ()) -> None:
+        if not self.availability_index:
+            return
+        try:
+            await self.availability_index.track_write(self.session, resource_type, resource_ids)
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error locking the {resource_type.value} availability version") from e
+
+    @staticmethod
+    def _resource_id(resource_type: ResourceType, event_obj: Any) -> Any:
+        return getattr(event_obj, SQLResourceRegistry.get(resource_type).fk_field)
 
     def _get_repo_for_type(self, resource_type: ResourceType) -> SQLAlchemyRepository:
         """
@@ -44,13 +144,22 @@ class SQLEventRepository(IEventRepository):
         # Delegate to generic repo
         return await self._get_repo_for_type(resource_type).get(event_id)
 
+    def stream(
+            self,
+            resource_type: ResourceType,
+            query: ListQuery | None = None,
+            batch_size: int = 1000
+    ) -> AsyncIterator[Any]:
+        return self._get_repo_for_type(resource_type).stream(query, batch_size)
+
     async def create(self, resource_type: ResourceType, event_obj: Any) -> Any:
         # self.session.add(event_obj)
         # await self.session.flush()
         # await self.session.refresh(event_obj)
         # return event_obj
 
-        # Delegate to generic repo (Handles Flush, Refresh, IntegrityErrors)
+        await self._track_write(resource_type, [self._resource_id(resource_type, event_obj)])
+        # Delegate to generic repo (Handles Flush, IntegrityErrors)
         return await self._get_repo_for_type(resource_type).create(event_obj)
 
     async def update(self, resource_type: ResourceType, event_obj: Any, update_data: dict) -> Any:
@@ -63,7 +172,19 @@ class SQLEventRepository(IEventRepository):
         # return event_obj
 
         # Delegate to generic repo
-        return await self._get_repo_for_type(resource_type).update(event_obj, update_data)
+        await self._track_write(resource_type, [self._resource_id(resource_type, event_obj)])
+        event = await self._get_repo_for_type(resource_type).update(event_obj, update_data)
+        await self._track_write(resource_type, [self._resource_id(resource_type, event)])
+        return event
+
+    async def update_by_id(self, resource_type: ResourceType, event_id: int, update_data: dict) -> Optional[Any]:
+        # Moving an event to another resource leaves the previous one unknown here
+        fk_field = SQLResourceRegistry.get(resource_type).fk_field
+        await self._track_write(resource_type, None if fk_field in update_data else ())
+        event = await self._get_repo_for_type(resource_type).update_by_id(event_id, update_data)
+        if event is not None:
+            await self._track_write(resource_type, [self._resource_id(resource_type, event)])
+        return event
 
     async def delete(self, resource_type: ResourceType, event_id: int) -> bool:
         # event = await self.get_by_id(resource_type, event_id)
@@ -74,4 +195,256 @@ class SQLEventRepository(IEventRepository):
         # return False
 
         # Delegate to generic repo
+        await self._track_write(resource_type, None)
         return await self._get_repo_for_type(resource_type).delete(event_id)
+
+    async def delete_returning_mission(self, resource_type: ResourceType, event_id: int) -> Optional[int]:
+        meta = SQLResourceRegistry.get(resource_type)
+        event_model = meta.event_model
+        statement = (
+            delete(event_model)
+            .where(event_model.id == event_id)
+            .returning(event_model.mission_id, getattr(event_model, meta.fk_field))
+        )
+        try:
+            await self._track_write(resource_type)
+            row = (await self.session.execute(statement)).one_or_none()
+            if row is None:
+                return None
+            mission_id, resource_id = row
+            await self._track_write(resource_type, [resource_id])
+            return mission_id
+        except IntegrityError as e:
+            raise IntegrityViolationException(
+                f"Cannot delete {event_model.__name__}: It is being used by another resource.") from e
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error deleting {event_model.__name__}") from e
+
+    async def missing_references(self, resource_type: ResourceType, rows: List[dict]) -> dict[str, set]:
+        table = SQLResourceRegistry.get(resource_type).event_model.__table__
+        missing = {}
+        try:
+            for fk in table.foreign_keys:
+                values = {row[fk.parent.key] for row in rows if row.get(fk.parent.key) is not None}
+                if not values:
+                    continue
+                result = await self.session.execute(select(fk.column).where(fk.column.in_(values)))
+                absent = values - set(result.scalars().all())
+                if absent:
+                    missing[fk.parent.key] = absent
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error checking references of {table.name}") from e
+        return missing
+
+    async def get_intervals(
+            self,
+            resource_type: ResourceType,
+            resource_ids: List[Any],
+            start: datetime,
+            end: datetime | None
+    ) -> dict[Any, List[tuple[datetime, Optional[datetime], int]]]:
+        meta = SQLResourceRegistry.get(resource_type)
+        event_model = meta.event_model
+        fk = getattr(event_model, meta.fk_field)
+
+        statement = select(fk, event_model.start_time, event_model.end_time, event_model.mission_id).where(
+            fk.in_(resource_ids),
+            or_(event_model.end_time > start, event_model.end_time.is_(None))
+        )
+        if end is not None:
+            statement = statement.where(event_model.start_time < end)
+
+        try:
+            result = await self.session.execute(statement)
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error reading {resource_type.value} intervals") from e
+
+        intervals = defaultdict(list)
+        for resource_id, start_time, end_time, mission_id in result.all():
+            intervals[resource_id].append((start_time, end_time, mission_id))
+        return intervals
+
+    async def get_window(
+            self,
+            resource_type: ResourceType,
+            mission_id: int,
+            start: datetime,
+            end: datetime
+    ) -> List[Any]:
+        event_model = SQLResourceRegistry.get(resource_type).event_model
+        statement = (
+            select(event_model)
+            .where(
+                event_model.mission_id == mission_id,
+                event_model.start_time < end,
+                or_(event_model.end_time > start, event_model.end_time.is_(None))
+            )
+            .order_by(event_model.start_time, event_model.id)
+            .options(*_window_options(resource_type))
+        )
+        try:
+            result = await self.session.execute(statement)
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error reading {resource_type.value} events") from e
+
+    async def get_active_assignments(self, resource_type: ResourceType, at: datetime) -> dict[Any, int]:
+        meta = SQLResourceRegistry.get(resource_type)
+        event_model = meta.event_model
+        fk = getattr(event_model, meta.fk_field)
+
+        # Index-only scan of the partial ix_<table>_open index
+        statement = (
+            select(fk, event_model.mission_id)
+            .where(event_model.end_time.is_(None), event_model.start_time <= at)
+            .order_by(event_model.start_time)
+        )
+        try:
+            result = await self.session.execute(statement)
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error reading active {resource_type.value} assignments") from e
+        # Later starts win should a resource have several open events
+        return {resource_id: mission_id for resource_id, mission_id in result.all()}
+
+    async def get_conflict_page(
+            self,
+            resource_type: ResourceType,
+            limit: int = 100,
+            cursor: str | None = None
+    ) -> Page[Any]:
+        meta = SQLResourceRegistry.get(resource_type)
+        values = self._conflict_cursor(resource_type, cursor, [meta.fk_field, "start_time", "id"])
+        statement = _conflicts_statement(resource_type, values[0] if values else None)
+        columns = statement.selected_columns
+        keys = [(columns.resource_id, False), (columns.start_time, False), (columns.event_id, False)]
+        if values:
+            statement = statement.where(keyset_predicate(keys, values))
+        return await self._row_page(resource_type, apply_order(statement, keys), keys, limit)
+
+    async def get_conflict_summary_page(
+            self,
+            resource_type: ResourceType,
+            limit: int = 100,
+            cursor: str | None = None
+    ) -> Page[Any]:
+        meta = SQLResourceRegistry.get(resource_type)
+        values = self._conflict_cursor(resource_type, cursor, [meta.fk_field])
+        conflicts = _conflicts_statement(resource_type, values[0] if values else None).subquery("conflicts")
+        statement = (
+            select(
+                conflicts.c.resource_id,
+                func.count().label("events"),
+                func.count(conflicts.c.mission_id.distinct()).label("missions"),
+                func.min(conflicts.c.start_time).label("first_start"),
+                func.max(conflicts.c.start_time).label("last_start"),
+            )
+            .group_by(conflicts.c.resource_id)
+            .order_by(conflicts.c.resource_id)
+        )
+        if values:
+            statement = statement.where(conflicts.c.resource_id > values[0])
+        return await self._row_page(resource_type, statement, [(conflicts.c.resource_id, False)], limit)
+
+    async def stream_conflicts(self, resource_type: ResourceType, batch_size: int = 1000) -> AsyncIterator[Any]:
+        statement = _conflicts_statement(resource_type)
+        columns = statement.selected_columns
+        statement = statement.order_by(columns.resource_id, columns.start_time, columns.event_id)
+        try:
+            result = await self.session.stream(statement.execution_options(yield_per=batch_size))
+            async for row in result:
+                yield row
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error scanning {resource_type.value} conflicts") from e
+
+    @staticmethod
+    def _conflict_cursor(resource_type: ResourceType, cursor: str | None, fields: List[str]) -> List[Any]:
+        # Cursor values are typed by the event table columns behind the conflict rows
+        if not cursor:
+            return []
+        values = decode_cursor(cursor)
+        if len(values) != len(fields):
+            raise InvalidQueryException("Pagination cursor does not match the requested listing")
+        event_model = SQLResourceRegistry.get(resource_type).event_model
+        return [coerce_value(event_model, f, v) for f, v in zip(fields, values)]
+
+    async def _row_page(
+            self,
+            resource_type: ResourceType,
+            statement,
+            keys: List[tuple[Any, bool]],
+            limit: int
+    ) -> Page[Any]:
+        try:
+            result = await self.session.execute(statement.limit(limit + 1))
+            rows = list(result.all())
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error scanning {resource_type.value} conflicts") from e
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor([cursor_value(getattr(rows[-1], k.key)) for k, _ in keys])
+        return Page(items=rows, next_cursor=next_cursor)
+
+    async def bump_mission_versions(self, mission_ids: List[int]) -> None:
+        if not mission_ids:
+            return
+        statement = (
+            update(Mission)
+            .where(Mission.id.in_(mission_ids))
+            .values(version=Mission.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            await self.session.execute(statement)
+        except SQLAlchemyError as e:
+            raise RepositoryException("Database error updating mission versions") from e
+
+    async def insert_many(self, resource_type: ResourceType, rows: List[dict]) -> int:
+        meta = SQLResourceRegistry.get(resource_type)
+        event_model = meta.event_model
+        if not rows:
+            return 0
+        await self._track_write(resource_type, {row.get(meta.fk_field) for row in rows})
+
+        dialect = self.session.bind.dialect
+        try:
+            if dialect.name == "postgresql" and dialect.driver == "asyncpg":
+                await self._copy_rows(event_model.__table__, rows)
+            else:
+                # executemany of one INSERT; batched into multi-row VALUES by the dialect
+                await self.session.execute(insert(event_model), rows)
+            return len(rows)
+        except IntegrityError as e:
+            raise IntegrityViolationException(f"Could not import {event_model.__name__} rows: constraint violated.") from e
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error importing {event_model.__name__}") from e
+
+    async def _copy_rows(self, table, rows: List[dict]) -> None:
+        """
+        COPY ... FROM STDIN through asyncpg, inside the session's transaction.
+        Columns absent from every row (the serial id) are left to their defaults.
+        """
+        columns = [c.key for c in table.columns if any(c.key in row for row in rows)]
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        try:
+            await raw.driver_connection.copy_records_to_table(
+                table.name,
+                schema_name=table.schema,
+                columns=columns,
+                records=[tuple(row.get(c) for c in columns) for row in rows]
+            )
+        except Exception as e:
+            # asyncpg errors bypass SQLAlchemy's wrapping; class 23 is integrity_constraint_violation
+            if str(getattr(e, "sqlstate", "")).startswith("23"):
+                raise IntegrityViolationException(f"Could not import {table.name} rows: {e}") from e
+            raise RepositoryException(f"Database error importing {table.name}") from e
+
+    async def insert_each(self, resource_type: ResourceType, items: List[tuple[int, dict]]) -> BulkResult:
+        meta = SQLResourceRegistry.get(resource_type)
+        event_model = meta.event_model
+        # Rows that fail only cause their resource to be re-read needlessly
+        await self._track_write(resource_type, {row.get(meta.fk_field) for _, row in items})
+        objs = [(index, event_model(**row)) for index, row in items]
+        return await self._get_repo_for_type(resource_type).bulk_create(objs, atomic=False)
@@ -0,0 +1,92 @@
+import typing
+from typing import Any, Iterable, List, Optional, Type
+
+from pydantic import BaseModel
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import MANYTOONE
+
+
+def mark_new_collections_loaded(obj: Any) -> None:
+    """
+    A row that was just INSERTed cannot be referenced by rows that existed before
+    it, so its untouched collections are empty. Marking them loaded means serializing
+    them needs no SELECT (this is what the post-flush refresh used to pay for).
+    """
+    state = sa_inspect(obj)
+    for rel in state.mapper.relationships:
+        if rel.uselist and rel.key in state.unloaded:
+            set_committed_value(obj, rel.key, [])
+
+
+def expire_changed_relationships(session: Session, obj: Any, changed: Iterable[str]) -> None:
+    """
+    Expires many-to-one relationships whose foreign key columns were just changed,
+    so they reload (lazily) with the new target instead of returning the old one.
+    """
+    changed = set(changed)
+    stale = [
+        rel.key
+        for rel in sa_inspect(obj).mapper.relationships
+        if rel.direction is MANYTOONE and any(c.key in changed for c in rel.local_columns)
+    ]
+    if stale:
+        session.expire(obj, stale)
+
+
+def _schema_of(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Finds the pydantic model inside Optional[...] / List[...] annotations."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in typing.get_args(annotation):
+        schema = _schema_of(arg)
+        if schema is not None:
+            return schema
+    return None
+
+
+def load_response_relationships(obj: Any, schema: Type[BaseModel]) -> None:
+    """
+    Touches exactly the relationships `schema` will read from `obj` (recursively),
+    so they are loaded now instead of during serialization.
+    Must run in a sync context (AsyncSession.run_sync) because it may lazy load.
+    """
+    mapper = sa_inspect(type(obj), raiseerr=False)
+    if mapper is None:
+        return
+
+    relationships = mapper.relationships
+    for name, field in schema.model_fields.items():
+        key = field.alias or name
+        if key not in relationships:
+            continue
+
+        value = getattr(obj, key)
+        nested = _schema_of(field.annotation)
+        if nested is None or value is None:
+            continue
+        for item in (value if isinstance(value, list) else [value]):
+            load_response_relationships(item, nested)
+
+
+def schema_load_options(model: type, schema: Type[BaseModel]) -> List[Any]:
+    """
+    selectinload chains for exactly the relationships `schema` reads from `model` (recursively),
+    e.g. selectinload(Mission.mission_stations).options(selectinload(MissionStation.station)...).
+    """
+    relationships = sa_inspect(model).relationships
+    options = []
+    for name, field in schema.model_fields.items():
+        key = field.alias or name
+        if key not in relationships:
+            continue
+
+        loader = selectinload(getattr(model, key))
+        nested = _schema_of(field.annotation)
+        if nested is not None:
+            nested_options = schema_load_options(relationships[key].mapper.class_, nested)
+            if nested_options:
+                loader = loader.options(*nested_options)
+        options.append(loader)
+    return options
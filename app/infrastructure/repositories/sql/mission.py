@@ -1,9 +1,12 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Any
 
+from sqlalchemy import Integer, and_, column, values
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, col, or_, delete
+from sqlalchemy.orm import raiseload, selectinload, load_only, attributes
+from sqlmodel import select, col, or_, delete, update
 
 from app.db.sql.models.mission import Mission
 from app.domain.exceptions.domain_exception import (
@@ -12,24 +15,116 @@ from app.domain.exceptions.domain_exception import (
     DomainException
 
 )
-from app.domain.interfaces.repository import IMissionRepository
+from app.domain.interfaces.repository import IMissionRepository, MissionLoadProfile, MissionFilter, Page
 from app.domain.schemas.enums import ResourceType
-from app.infrastructure.repositories.sql.base import SQLAlchemyRepository
+from app.domain.schemas.mission import MissionRead
+from app.infrastructure.availability.interval_index import AvailabilityIndex
+from app.infrastructure.repositories.sql.base import SQLAlchemyRepository, is_exclusion_violation, overlap_error
+from app.infrastructure.repositories.sql.loading import schema_load_options
 from app.infrastructure.resource_registry.sql.resource_registry import SQLResourceRegistry
 
 
+# Candidate intervals per availability query (4 bound parameters each)
+CONFLICT_CHECK_CHUNK = 1_000
+
+# Mission relationship holding each resource type's timeline
+TIMELINE_RELATIONSHIPS = {
+    ResourceType.STATION: "mission_stations",
+    ResourceType.CRAWLER: "mission_crawlers",
+    ResourceType.PLATFORM: "mission_platforms",
+    ResourceType.OPERATOR: "mission_operators",
+    ResourceType.RT: "links",
+}
+
+
+@lru_cache
+def _full_options() -> tuple:
+    # Built on first use: the mappers must be configured before relationships are inspected
+    return (*schema_load_options(Mission, MissionRead), raiseload("*"))
+
+
+def mission_load_options(profile: MissionLoadProfile, resource_type: ResourceType | None = None) -> tuple:
+    """
+    Loader options for a profile. Mission relationships default to lazy="raise",
+    so anything a profile does not load fails loudly instead of issuing hidden queries.
+    """
+    if profile is MissionLoadProfile.FULL:
+        return _full_options()
+    if profile is MissionLoadProfile.TIMELINE:
+        if resource_type is None:
+            raise ValueError("The timeline profile needs a resource type")
+        timeline = getattr(Mission, TIMELINE_RELATIONSHIPS[resource_type])
+        return selectinload(timeline).raiseload("*"), raiseload("*")
+    return (raiseload("*"),)
+
+
 class SQLMissionRepository(SQLAlchemyRepository[Mission], IMissionRepository[Mission]):
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+            self,
+            session: AsyncSession,
+            availability_index: AvailabilityIndex | None = None,
+            skip_availability_precheck: bool = False
+    ):
         super().__init__(session, Mission)
+        # Optional in-memory answer to availability checks; SQL whenever it cannot answer
+        self.availability_index = availability_index
+        self.skip_availability_precheck = skip_availability_precheck
+
+    @property
+    def enforces_availability(self) -> bool:
+        # The ex_*_no_overlap exclusion constraints exist on PostgreSQL only
+        return self.skip_availability_precheck and self.session.bind.dialect.name == "postgresql"
 
     async def get_mission_full_timeline(self, mission_id: int) -> Mission | None:
+        return await self.get_with_profile(mission_id, MissionLoadProfile.FULL)
+
+    async def get_with_profile(
+            self,
+            mission_id: int,
+            profile: MissionLoadProfile,
+            resource_type: ResourceType | None = None
+    ) -> Mission | None:
+        statement = (
+            select(Mission)
+            .where(Mission.id == mission_id)
+            .options(*mission_load_options(profile, resource_type))
+            # The identity map may hold the mission loaded under another profile
+            .execution_options(populate_existing=True)
+        )
         try:
-            return await self.get(mission_id)
-        except RepositoryException:
-            raise
-        except Exception as e:
-            raise RepositoryException(f"Unexpected error fetching mission {mission_id}") from e
+            result = await self.session.execute(statement)
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error fetching mission {mission_id}") from e
+
+    async def get_summary_page(
+            self,
+            filters: MissionFilter,
+            limit: int = 100,
+            cursor: str | None = None,
+            descending: bool = False
+    ) -> Page[Mission]:
+        # Served by ix_missions_status_start_time (status, scheduled_start_time, id)
+        statement = select(Mission).options(
+            load_only(*(getattr(Mission, c.key) for c in Mission.__table__.columns)),
+            *mission_load_options(MissionLoadProfile.SUMMARY)
+        )
+        for field, wanted in (
+                (Mission.status, filters.statuses),
+                (Mission.section, filters.sections),
+                (Mission.type, filters.types),
+                (Mission.origin, filters.origins),
+        ):
+            if wanted:
+                statement = statement.where(field.in_(wanted))
+        if filters.start_from is not None:
+            statement = statement.where(Mission.scheduled_start_time >= filters.start_from)
+        if filters.start_to is not None:
+            statement = statement.where(Mission.scheduled_start_time < filters.start_to)
+
+        keys = [(Mission.scheduled_start_time, descending), (Mission.id, descending)]
+        return await self._keyset_page(statement, keys, limit, cursor)
 
     async def check_resource_availability(
             self,
@@ -41,6 +136,13 @@ class SQLMissionRepository(SQLAlchemyRepository[Mission], IMissionRepository[Mis
     ) -> List[Any]:
 
         try:
+            if self.availability_index:
+                events = await self.availability_index.overlapping(
+                    self.session, resource_type, resource_id, start, end, exclude_mission_id
+                )
+                if events is not None:
+                    return events
+
             meta = SQLResourceRegistry.get(resource_type)
             event_model = meta.event_model
 
@@ -65,8 +167,89 @@ class SQLMissionRepository(SQLAlchemyRepository[Mission], IMissionRepository[Mis
         except SQLAlchemyError as e:
             raise RepositoryException(f"Database error checking availability for {resource_type}") from e
 
+    async def find_conflicts(
+            self,
+            resource_type: ResourceType,
+            candidates: List[tuple[Any, datetime, datetime]],
+            exclude_mission_id: int | None = None
+    ) -> List[tuple[int, Any]]:
+        meta = SQLResourceRegistry.get(resource_type)
+        event_model = meta.event_model
+        fk = getattr(event_model, meta.fk_field)
+
+        conflicts = []
+        try:
+            if self.availability_index:
+                indexed = await self.availability_index.conflicts(
+                    self.session, resource_type, candidates, exclude_mission_id
+                )
+                if indexed is not None:
+                    return indexed
+
+            for offset in range(0, len(candidates), CONFLICT_CHECK_CHUNK):
+                chunk = candidates[offset:offset + CONFLICT_CHECK_CHUNK]
+                # WITH candidates(idx, resource_id, start_time, end_time) AS (VALUES ...), joined on overlap
+                intervals = values(
+                    column("idx", Integer),
+                    column("resource_id", fk.type),
+                    column("start_time", event_model.start_time.type),
+                    column("end_time", event_model.end_time.type),
+                    name="candidates"
+                ).data([
+                    (offset + i, resource_id, start, end)
+                    for i, (resource_id, start, end) in enumerate(chunk)
+                ]).cte("candidates")
+
+                statement = (
+                    select(intervals.c.idx, event_model)
+                    .select_from(event_model)
+                    .join(intervals, and_(
+                        fk == intervals.c.resource_id,
+                        event_model.start_time < intervals.c.end_time,
+                        or_(event_model.end_time > intervals.c.start_time, event_model.end_time.is_(None))
+                    ))
+                    .order_by(intervals.c.idx, event_model.start_time)
+                )
+                if exclude_mission_id:
+                    statement = statement.where(event_model.mission_id != exclude_mission_id)
+
+                result = await self.session.execute(statement)
+                conflicts.extend((idx, event) for idx, event in result.all())
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error checking availability for {resource_type}") from e
+        return conflicts
+
+    async def get_version(self, mission_id: int) -> int | None:
+        try:
+            result = await self.session.execute(select(Mission.version).where(Mission.id == mission_id))
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error fetching the version of mission {mission_id}") from e
+
+    async def bump_version(self, mission_id: int) -> int | None:
+        statement = (
+            update(Mission)
+            .where(Mission.id == mission_id)
+            .values(version=Mission.version + 1)
+            .returning(Mission.version)
+        )
+        try:
+            result = await self.session.execute(statement)
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Database error updating the version of mission {mission_id}") from e
+
+    @staticmethod
+    def _event_type(event_model_type: type) -> tuple[ResourceType, str]:
+        for resource_type in ResourceType:
+            meta = SQLResourceRegistry.get(resource_type)
+            if meta.event_model is event_model_type:
+                return resource_type, meta.fk_field
+        raise DomainException(f"Configuration error: {event_model_type.__name__} is not a registered event model")
+
     async def bulk_update_timeline(
             self,
+            mission_id: int,
             events_to_create: List[Any],
             events_to_update: List[Any],
             events_to_delete_ids: List[int],
@@ -76,11 +259,24 @@ class SQLMissionRepository(SQLAlchemyRepository[Mission], IMissionRepository[Mis
         Executes a complex batch of operations.
         Critical failure point: Integrity Errors (Overlaps/Foreign Keys).
         """
+        resource_type, fk_field = self._event_type(event_model_type)
         try:
+            if self.availability_index:
+                # Every resource whose timeline changes: created, updated (before and after) and deleted
+                touched = {getattr(event, fk_field) for event in (*events_to_create, *events_to_update)}
+                for event in events_to_update:
+                    touched.update(attributes.get_history(event, fk_field).deleted)
+                await self.availability_index.track_write(self.session, resource_type, touched)
+
             # 1. Delete
             if events_to_delete_ids:
                 stmt = delete(event_model_type).where(event_model_type.id.in_(events_to_delete_ids))  # type: ignore
-                await self.session.execute(stmt)
+                if self.availability_index:
+                    stmt = stmt.returning(getattr(event_model_type, fk_field))
+                    deleted = await self.session.execute(stmt)
+                    await self.availability_index.track_write(self.session, resource_type, deleted.scalars().all())
+                else:
+                    await self.session.execute(stmt)
 
             # 2. Update
             for event in events_to_update:
@@ -93,7 +289,12 @@ class SQLMissionRepository(SQLAlchemyRepository[Mission], IMissionRepository[Mis
             # 4. Flush to DB (Checks Constraints)
             await self.session.flush()
 
+            # 5. New ETag for the mission, committed with the batch
+            await self.bump_version(mission_id)
+
         except IntegrityError as e:
+            if is_exclusion_violation(e):
+                raise overlap_error(e) from e
             raise IntegrityViolationException(
                 f"Timeline update failed due to data conflict. "
                 f"The resource might be in use or the times overlap."
@@ -0,0 +1,68 @@
+from typing import Any, List, Optional
+
+from sqlalchemy import Update, union, update
+from sqlmodel import select
+
+from app.db.sql.models.black import Black
+from app.db.sql.models.crawler import Crawler, MissionCrawler
+from app.db.sql.models.mission import Mission
+from app.db.sql.models.operator import Operator, OperatorRole, MissionOperators
+from app.db.sql.models.platform import Platform, MissionPlatform, MissionPlatformRt
+from app.db.sql.models.role import Role
+from app.db.sql.models.rt import Rt
+from app.db.sql.models.station import Station, MissionStation
+
+
+def _station_events(station_ids) -> List:
+    return [select(MissionStation.mission_id).where(MissionStation.station_id.in_(station_ids))]
+
+
+def _crawler_events(crawler_ids) -> List:
+    return [select(MissionCrawler.mission_id).where(MissionCrawler.crawler_id.in_(crawler_ids))]
+
+
+def _operator_events(operator_ids) -> List:
+    return [select(MissionOperators.mission_id).where(MissionOperators.operator_id.in_(operator_ids))]
+
+
+# Missions whose MissionRead serializes a row of the model, given the rows' primary keys.
+# Resolved before the write: a delete cascades to the events these queries go through.
+MISSION_REFERENCES = {
+    Station: _station_events,
+    Crawler: _crawler_events,
+    Operator: _operator_events,
+    Black: lambda ids: [
+        *_station_events(select(Station.num).where(Station.black_num.in_(ids))),
+        *_crawler_events(select(Crawler.id).where(Crawler.black_num.in_(ids))),
+    ],
+    Platform: lambda ids: [
+        select(MissionPlatform.mission_id).where(MissionPlatform.platform_id.in_(ids)),
+        select(MissionPlatformRt.mission_id).where(MissionPlatformRt.platform_id.in_(ids)),
+    ],
+    Rt: lambda ids: [
+        select(MissionPlatform.mission_id).where(MissionPlatform.main_rt_num.in_(ids)),
+        select(MissionPlatform.mission_id).where(MissionPlatform.backup_rt_num.in_(ids)),
+        select(MissionPlatformRt.mission_id).where(MissionPlatformRt.rt_num.in_(ids)),
+    ],
+    # Events name the role directly; operators list their roles too
+    Role: lambda ids: [
+        select(MissionOperators.mission_id).where(MissionOperators.role_id.in_(ids)),
+        *_operator_events(select(OperatorRole.operator_id).where(OperatorRole.role_id.in_(ids))),
+    ],
+}
+
+
+def bump_referencing_missions(model: type, ids: List[Any]) -> Optional[Update]:
+    """
+    One UPDATE incrementing the version (the ETag of GET /missions/{id}) of every mission
+    that serializes one of the given rows; None for models no mission response includes.
+    """
+    references = MISSION_REFERENCES.get(model)
+    if references is None or not ids:
+        return None
+    return (
+        update(Mission)
+        .where(Mission.id.in_(union(*references(ids))))
+        .values(version=Mission.version + 1)
+        .execution_options(synchronize_session=False)
+    )
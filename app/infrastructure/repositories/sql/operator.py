@@ -4,12 +4,13 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.db.sql.models.operator import Operator
+from app.db.sql.models.operator import Operator, OperatorRole
 from app.db.sql.models.role import Role
 from app.domain.exceptions.domain_exception import NotFoundException, IntegrityViolationException, RepositoryException
 from app.domain.interfaces.repository import IOperatorRepository
 from app.domain.schemas.resources import OperatorCreate, OperatorUpdate
 from app.infrastructure.repositories.sql.base import SQLAlchemyRepository
+from app.infrastructure.repositories.sql.loading import mark_new_collections_loaded
 
 
 class SQLOperatorRepository(SQLAlchemyRepository[Operator], IOperatorRepository):
@@ -18,24 +19,25 @@ class SQLOperatorRepository(SQLAlchemyRepository[Operator], IOperatorRepository)
 
     async def create(self, obj_in: OperatorCreate) -> Operator:
         try:
-            # 1. Create the Operator instance (excluding role_ids)
-            db_obj = Operator(**obj_in.model_dump(exclude={"role_ids"}))
+            # 1. Create the Operator instance (excluding the role ids)
+            db_obj = Operator(**obj_in.model_dump(exclude={"roles"}))
 
             # 2. Handle Many-to-Many Linking
-            if obj_in.role_ids:
+            if obj_in.roles:
                 # Fetch the actual Role objects from the DB
-                stmt = select(Role).where(Role.id.in_(obj_in.role_ids))  # type: ignore
+                stmt = select(Role).where(Role.id.in_(obj_in.roles))  # type: ignore
                 result = await self.session.execute(stmt)
                 roles = result.scalars().all()
 
-                if len(roles) != len(obj_in.role_ids):
+                if len(roles) != len(set(obj_in.roles)):
                     raise NotFoundException("One or more Role IDs not found")
 
-                db_obj.roles = list(roles)
+                # `Operator.roles` holds the operator_roles link rows
+                db_obj.roles = [OperatorRole(role=role) for role in roles]
 
             self.session.add(db_obj)
             await self.session.flush()
-            await self.session.refresh(db_obj)
+            mark_new_collections_loaded(db_obj)
             return db_obj
 
         except NotFoundException:
@@ -67,9 +69,9 @@ class SQLOperatorRepository(SQLAlchemyRepository[Operator], IOperatorRepository)
                 # Replacing the list handles deletions/insertions automatically
                 obj_current.roles = list(roles)
 
+            await self._bump_referencing_missions([obj_current.id])
             self.session.add(obj_current)
             await self.session.flush()
-            await self.session.refresh(obj_current)
             return obj_current
 
         except NotFoundException:
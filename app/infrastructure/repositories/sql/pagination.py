@@ -0,0 +1,65 @@
+import base64
+import binascii
+import json
+from typing import Any, List
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.exceptions.domain_exception import InvalidQueryException, RepositoryException
+from app.domain.interfaces.repository import Page
+from app.infrastructure.repositories.sql.query import apply_order, coerce_value, cursor_value, keyset_predicate
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Packs the sort-key values of the last row of a page into an opaque token.
+    """
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError) as e:
+        raise InvalidQueryException("Invalid pagination cursor") from e
+
+    if not isinstance(values, list):
+        raise InvalidQueryException("Invalid pagination cursor")
+    return values
+
+
+async def keyset_page(
+        session: AsyncSession,
+        model: type,
+        statement,
+        keys: List[tuple[Any, bool]],
+        limit: int,
+        cursor: str | None
+) -> Page:
+    """
+    Runs `statement` (selecting `model` rows) ordered by `keys`, starting after `cursor`.
+    """
+    statement = apply_order(statement, keys).limit(limit + 1)
+
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(keys):
+            raise InvalidQueryException("Pagination cursor does not match the requested sort")
+        values = [coerce_value(model, k.key, v) for (k, _), v in zip(keys, values)]
+        statement = statement.where(keyset_predicate(keys, values))
+
+    try:
+        result = await session.execute(statement)
+        items = list(result.scalars().all())
+    except SQLAlchemyError as e:
+        raise RepositoryException(f"Database error retrieving list of {model.__name__}") from e
+
+    # One extra row tells us whether another page exists without a COUNT
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor([cursor_value(getattr(items[-1], k.key)) for k, _ in keys])
+    return Page(items=items, next_cursor=next_cursor)
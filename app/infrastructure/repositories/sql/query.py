@@ -0,0 +1,132 @@
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, List
+
+from sqlalchemy import and_, or_, UniqueConstraint, TypeDecorator
+from sqlalchemy.orm import load_only, noload
+from sqlalchemy.sql import Select
+
+from app.domain.exceptions.domain_exception import InvalidQueryException
+from app.domain.interfaces.repository import ListQuery
+
+
+@lru_cache
+def indexed_columns(model: type) -> frozenset[str]:
+    """
+    Columns that lead a B-tree on the model's table (primary key, unique constraint or index).
+    Only these may be filtered or sorted on, so list queries never force a full scan.
+    """
+    table = model.__table__
+    keys = {c.key for c in table.primary_key.columns}
+    keys |= {c.key for c in table.columns if c.index or c.unique}
+    keys |= {next(iter(ix.columns)).key for ix in table.indexes if ix.columns}
+    keys |= {
+        next(iter(uc.columns)).key
+        for uc in table.constraints
+        if isinstance(uc, UniqueConstraint) and uc.columns
+    }
+    return frozenset(keys)
+
+
+def coerce_value(model: type, key: str, raw: Any) -> Any:
+    """
+    Converts a query-string (or cursor) value to the column's Python type.
+    """
+    column_type = model.__table__.c[key].type
+    if isinstance(column_type, TypeDecorator):
+        # e.g. sqlmodel's UTCDateTime reports `object`; the wrapped type knows better
+        column_type = column_type.impl_instance
+    try:
+        python_type = column_type.python_type
+    except NotImplementedError:
+        return raw
+
+    if raw is None or isinstance(raw, python_type):
+        return raw
+    try:
+        if python_type is bool:
+            if str(raw).lower() in ("true", "1"):
+                return True
+            if str(raw).lower() in ("false", "0"):
+                return False
+            raise ValueError(raw)
+        if python_type is datetime:
+            return datetime.fromisoformat(str(raw))
+        return python_type(raw)
+    except (TypeError, ValueError) as e:
+        raise InvalidQueryException(f"Invalid value {raw!r} for '{key}'") from e
+
+
+def cursor_value(value: Any) -> Any:
+    """
+    JSON-friendly form of a sort-key value, reversible through `coerce_value`.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _require_indexed(model: type, key: str, purpose: str) -> None:
+    if key not in model.__table__.c:
+        raise InvalidQueryException(f"Unknown field '{key}'")
+    if key not in indexed_columns(model):
+        allowed = ", ".join(sorted(indexed_columns(model)))
+        raise InvalidQueryException(f"Cannot {purpose} by unindexed field '{key}'. Allowed: {allowed}")
+
+
+def apply_filters(statement: Select, model: type, query: ListQuery) -> Select:
+    for key, raw_values in query.filters.items():
+        _require_indexed(model, key, "filter")
+        column = getattr(model, key)
+        values = [coerce_value(model, key, v) for v in raw_values]
+        statement = statement.where(column == values[0] if len(values) == 1 else column.in_(values))
+    return statement
+
+
+def apply_projection(statement: Select, model: type, query: ListQuery) -> Select:
+    if query.fields is None:
+        return statement
+
+    unknown = [f for f in query.fields if f not in model.__table__.c]
+    if unknown:
+        raise InvalidQueryException(f"Unknown field(s): {', '.join(unknown)}")
+    # The sort keys and primary key are loaded too: the page cursor is read from the last row,
+    # and an unloaded attribute would lazy-load outside the async context
+    keys = [c.key for c in model.__table__.primary_key.columns] + [key for key, _ in query.sort]
+    loaded = list(dict.fromkeys([*query.fields, *(k for k in keys if k in model.__table__.c)]))
+    # Projected rows are plain column sets; relationships are never loaded for them
+    return statement.options(load_only(*(getattr(model, f) for f in loaded)), noload("*"))
+
+
+def order_keys(model: type, pk, query: ListQuery) -> List[tuple[Any, bool]]:
+    """
+    The ORDER BY keys for a query: requested sort fields, then the primary key as tie-breaker.
+    """
+    keys = []
+    for key, descending in query.sort:
+        _require_indexed(model, key, "sort")
+        keys.append((getattr(model, key), descending))
+    if pk.key not in {k.key for k, _ in keys}:
+        keys.append((pk, keys[-1][1] if keys else False))
+    return keys
+
+
+def apply_order(statement: Select, keys: List[tuple[Any, bool]]) -> Select:
+    return statement.order_by(*(k.desc() if descending else k.asc() for k, descending in keys))
+
+
+def keyset_predicate(keys: List[tuple[Any, bool]], values: List[Any]):
+    """
+    Rows strictly after `values` in the given ordering, e.g. for (a ASC, b DESC):
+    a > :a OR (a = :a AND b < :b).
+    Expanded per key instead of a row-value comparison so mixed directions work.
+    """
+    clauses = []
+    for i, (key, descending) in enumerate(keys):
+        equal_prefix = [k == v for (k, _), v in zip(keys[:i], values[:i])]
+        after = key < values[i] if descending else key > values[i]
+        clauses.append(and_(*equal_prefix, after))
+    return or_(*clauses)
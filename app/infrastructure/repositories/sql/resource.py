@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select, or_
+
+from app.domain.exceptions.domain_exception import InvalidQueryException
+from app.domain.interfaces.repository import IResourceRepository, Page, ResourceFilter
+from app.domain.schemas.enums import ResourceType
+from app.infrastructure.repositories.sql.pagination import keyset_page
+from app.infrastructure.resource_registry.sql.resource_registry import SQLResourceRegistry
+
+
+class SQLResourceRepository(IResourceRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_available(
+            self,
+            resource_type: ResourceType,
+            start: datetime,
+            end: datetime,
+            filters: ResourceFilter,
+            limit: int = 100,
+            cursor: str | None = None
+    ) -> Page[Any]:
+        meta = SQLResourceRegistry.get(resource_type)
+        pk = sa_inspect(meta.model).primary_key[0]
+        event_model = meta.event_model
+        fk = getattr(event_model, meta.fk_field)
+
+        # NOT EXISTS per resource, probing ix_<table>_<fk>_period (fk, end_time, start_time)
+        busy = select(event_model.id).where(
+            fk == pk,
+            event_model.start_time < end,
+            or_(event_model.end_time > start, event_model.end_time.is_(None))
+        )
+        statement = select(meta.model).where(~busy.exists())
+        for field, wanted in (("site", filters.sites), ("black_num", filters.black_nums)):
+            if not wanted:
+                continue
+            if not hasattr(meta.model, field):
+                raise InvalidQueryException(f"{resource_type.value} resources have no '{field}' to filter on")
+            statement = statement.where(getattr(meta.model, field).in_(wanted))
+
+        return await keyset_page(self.session, meta.model, statement, [(pk, False)], limit, cursor)
@@ -0,0 +1,49 @@
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlmodel import SQLModel
+
+from app.api.app_factory import AppFactory
+from app.core.config import get_settings
+from app.db.sql.manager import SQLAlchemyManager
+# Every table must be registered before create_all
+from app.db.sql.models import black, crawler, mission, operator, platform, role, rt, station  # noqa: F401
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "test.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{path}")
+    get_settings.cache_clear()
+    # The manager is a process-wide singleton bound to the first URL it saw
+    monkeypatch.setattr(SQLAlchemyManager, "_instance", None)
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    engine.dispose()
+    yield path
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def client(db_path):
+    with TestClient(AppFactory.create_app()) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def indexed_client(db_path, monkeypatch):
+    """A client whose worker keeps the in-memory availability index (all history loaded)."""
+    monkeypatch.setenv("DB_AVAILABILITY_INDEX", "1")
+    monkeypatch.setenv("DB_AVAILABILITY_INDEX_LOOKBACK_HOURS", "1000000")
+    with TestClient(AppFactory.create_app()) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db(db_path):
+    """Raw connection for writes the API refuses (legacy rows, direct edits)."""
+    connection = sqlite3.connect(db_path)
+    yield connection
+    connection.close()
@@ -0,0 +1,59 @@
+import sqlite3
+
+from fastapi.testclient import TestClient
+
+from app.api.pagination import NEXT_CURSOR_HEADER
+
+MISSION = {
+    "section": "SECTION_A",
+    "type": "TRAINING",
+    "status": "PLANNED",
+    "origin": "INTERNAL",
+    "scheduled_start_time": "2026-01-01T00:00:00Z",
+    "scheduled_end_time": "2026-01-02T00:00:00Z",
+}
+
+
+def at(day: int, hour: int = 0) -> str:
+    return f"2026-01-{day:02d}T{hour:02d}:00:00Z"
+
+
+def create_stations(client: TestClient, *nums: int, site: str = "NORTH") -> None:
+    client.post("/api/v1/blacks", json={"num": 1, "name": "b1", "site": "NORTH"})
+    for num in nums:
+        response = client.post("/api/v1/stations", json={"num": num, "name": f"s{num}", "site": site, "black_num": 1})
+        assert response.status_code == 201, response.text
+
+
+def create_missions(client: TestClient, count: int) -> None:
+    for i in range(1, count + 1):
+        response = client.post("/api/v1/missions", json={"name": f"m{i}", **MISSION})
+        assert response.status_code == 201, response.text
+
+
+def insert_station_event(db: sqlite3.Connection, mission_id: int, station_id: int, start: str, end: str | None) -> int:
+    # Stored the way the ORM writes them: naive UTC with microseconds
+    stored = [None if v is None else v.replace("T", " ").replace("Z", ".000000") for v in (start, end)]
+    cursor = db.execute(
+        "INSERT INTO mission_stations (mission_id, station_id, start_time, end_time) VALUES (?, ?, ?, ?)",
+        (mission_id, station_id, *stored)
+    )
+    db.commit()
+    return cursor.lastrowid
+
+
+def walk_pages(client: TestClient, path: str, limit: int, **params) -> list[list[dict]]:
+    """Follows X-Next-Cursor from the first page to the last; returns the pages."""
+    pages, cursor = [], None
+    while True:
+        response = client.get(path, params={**params, "limit": limit, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        pages.append(response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return pages
+
+
+def query_count(response) -> int:
+    """SQL statements the request issued, from its Server-Timing header (db;dur=...;desc="N queries")."""
+    return int(response.headers["Server-Timing"].split('desc="')[1].split()[0])
@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.domain.schemas.enums import ResourceType
+from tests.factories import at, create_missions, create_stations, insert_station_event, query_count
+
+
+@pytest.fixture
+def bookings(client, db):
+    create_stations(client, 1, 2, 3, 4, 5)
+    create_missions(client, 3)
+    client.post("/api/v1/roles", json={"name": "COMMANDER"})
+    client.post("/api/v1/operators", json={"first_name": "Ada", "last_name": "L", "roles": []})
+
+    insert_station_event(db, 1, 1, at(1), at(2))  # Closed
+    insert_station_event(db, 2, 1, at(3), None)
+    insert_station_event(db, 3, 2, at(6), None)  # Not started on day 5
+    insert_station_event(db, 1, 3, at(4), at(6))  # Covers day 5, but closed
+    insert_station_event(db, 1, 4, at(1), None)
+    insert_station_event(db, 2, 4, at(2), None)  # The later open event wins
+    db.execute(
+        "INSERT INTO mission_operators (mission_id, operator_id, role_id, start_time, end_time) "
+        "VALUES (1, 1, 1, '2026-01-02 00:00:00.000000', NULL)"
+    )
+    db.commit()
+
+
+def _active(client, **params):
+    response = client.get("/api/v1/assignments/active", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_only_open_events_started_by_at_count(client, bookings):
+    assert _active(client, types="station", at=at(5))["assignments"] == {"station": {"1": 2, "4": 2}}
+    assert _active(client, types="station", at=at(7))["assignments"] == {"station": {"1": 2, "2": 3, "4": 2}}
+    # An open event is active from its start instant
+    assert _active(client, types="station", at=at(6))["assignments"]["station"]["2"] == 3
+
+
+def test_every_type_is_reported_when_none_is_given(client, bookings):
+    body = _active(client, at=at(5))
+
+    assert body["at"] == at(5)
+    assert body["assignments"] == {
+        "station": {"1": 2, "4": 2},
+        "crawler": {},
+        "platform": {},
+        "rt": {},
+        "operator": {"1": 1},
+    }
+    assert list(body["assignments"]) == [t.value for t in ResourceType]
+
+
+def test_repeated_types_are_read_once(client, bookings):
+    def queries(types):
+        response = client.get("/api/v1/assignments/active", params={"types": types, "at": at(5)})
+        assert list(response.json()["assignments"]) == ["operator", "station"]
+        return query_count(response)
+
+    assert queries(["operator", "station", "operator"]) == queries(["operator", "station"])
+
+
+def test_at_defaults_to_now(client, bookings):
+    before = datetime.now(timezone.utc)
+    body = _active(client, types="station")
+
+    assert datetime.fromisoformat(body["at"]) >= before
+    assert body["assignments"] == {"station": {"1": 2, "2": 3, "4": 2}}
@@ -0,0 +1,99 @@
+import json
+import time
+from datetime import datetime, timezone
+
+from app.domain.schemas.enums import ResourceType
+from app.infrastructure.availability.interval_index import IndexedEvent, _Timeline
+from tests.factories import at, create_missions, create_stations, insert_station_event
+
+
+def dt(day: int) -> datetime:
+    return datetime(2026, 1, day, tzinfo=timezone.utc)
+
+
+def event(event_id: int, start: int, end: int | None) -> IndexedEvent:
+    return IndexedEvent(event_id, event_id, 1, dt(start), dt(end) if end else None)
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    # Index refreshes run as tasks on the app's event loop, behind the test client's thread
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for the availability index"
+        time.sleep(0.02)
+
+
+def trigger_names(db) -> list[str]:
+    return [name for name, in db.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")]
+
+
+def test_timeline_finds_events_behind_shorter_ones():
+    timeline = _Timeline([event(1, 1, 30), event(2, 2, 3), event(3, 12, 13)])
+
+    assert [e.id for e in timeline.overlapping(dt(10), dt(11))] == [1]
+    assert [e.id for e in timeline.overlapping(dt(2), dt(12))] == [1, 2]
+    assert [e.id for e in timeline.overlapping(dt(12), dt(31))] == [1, 3]
+
+
+def test_timeline_bounds_are_half_open_and_open_events_never_end():
+    timeline = _Timeline([event(1, 1, 3), event(2, 5, None)])
+
+    assert timeline.overlapping(dt(3), dt(5)) == []
+    assert [e.id for e in timeline.overlapping(dt(2), dt(4))] == [1]
+    assert [e.id for e in timeline.overlapping(dt(28), dt(29))] == [2]
+
+
+def test_version_triggers_are_absent_while_the_index_is_off(client, db):
+    create_stations(client, 1)
+    create_missions(client, 1)
+    response = client.post(
+        "/api/v1/missions/1/stations", json={"station_id": 1, "start_time": at(1), "end_time": at(2)}
+    )
+    assert response.status_code == 201, response.text
+
+    assert trigger_names(db) == []
+    assert db.execute("SELECT version FROM availability_versions WHERE resource_type = 'station'").fetchone() == (0,)
+
+
+def test_index_sees_writes_made_outside_the_worker(indexed_client, db):
+    assert len(trigger_names(db)) == 15
+    create_stations(indexed_client, 1)
+    create_missions(indexed_client, 2)
+    index = indexed_client.app.state.availability_index
+
+    # Direct database edit: the trigger bumps the version, so the index stops answering and reloads
+    insert_station_event(db, 2, 1, at(10), at(20))
+    response = indexed_client.post(
+        "/api/v1/missions/1/stations", json={"station_id": 1, "start_time": at(12), "end_time": at(13)}
+    )
+    assert response.status_code == 409, response.text
+
+    version, = db.execute("SELECT version FROM availability_versions WHERE resource_type = 'station'").fetchone()
+    wait_for(lambda: index._types[ResourceType.STATION].version == version)
+    assert [e.mission_id for e in index._types[ResourceType.STATION].timelines[1].events] == [2]
+
+
+def test_imports_refresh_the_index_without_a_full_reload(indexed_client, monkeypatch):
+    create_stations(indexed_client, 1, 2)
+    create_missions(indexed_client, 2)
+    index = indexed_client.app.state.availability_index
+    wait_for(lambda: not index._tasks and all(t.done() for t in index._reloads.values()))
+
+    reloads = []
+    original = index._reload
+
+    async def counting_reload(resource_type):
+        reloads.append(resource_type)
+        await original(resource_type)
+
+    monkeypatch.setattr(index, "_reload", counting_reload)
+    body = "".join(json.dumps(row) + "\n" for row in (
+        {"mission_id": 1, "station_id": 1, "start_time": at(1), "end_time": at(2)},
+        {"mission_id": 2, "station_id": 2, "start_time": at(1), "end_time": at(2)},
+    ))
+    report = indexed_client.post("/api/v1/missions/stations/import", content=body).json()
+    assert report["inserted"] == 2
+
+    timelines = index._types[ResourceType.STATION].timelines
+    wait_for(lambda: 1 in timelines and 2 in timelines)
+    assert reloads == []
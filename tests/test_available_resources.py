@@ -0,0 +1,33 @@
+from tests.factories import at, create_missions, create_stations, insert_station_event
+
+
+def test_available_stations_exclude_overlapping_and_open_events(client, db):
+    create_stations(client, 1, 2, 3, 4, 5)
+    create_missions(client, 1)
+    insert_station_event(db, 1, 1, at(2), at(3))    # overlaps [2, 4)
+    insert_station_event(db, 1, 2, at(1), None)     # open: busy from day 1 on
+    insert_station_event(db, 1, 3, at(4), at(5))    # starts where the period ends
+    insert_station_event(db, 1, 4, at(1), at(2))    # ends where the period starts
+
+    pages, cursor = [], None
+    while True:
+        params = {"from": at(2), "to": at(4), "limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/v1/availability/station", params=params)
+        assert response.status_code == 200, response.text
+        pages.append([s["num"] for s in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert pages == [[3, 4], [5]]
+
+
+def test_available_resources_filters(client):
+    create_stations(client, 1)
+    create_stations(client, 2, site="SOUTH")
+
+    response = client.get("/api/v1/availability/station", params={"from": at(1), "to": at(2), "site": "SOUTH"})
+    assert [s["num"] for s in response.json()] == [2]
+
+    response = client.get("/api/v1/availability/operator", params={"from": at(1), "to": at(2), "site": "SOUTH"})
+    assert response.status_code == 400
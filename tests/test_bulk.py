@@ -0,0 +1,82 @@
+import logging
+
+from tests.factories import create_stations
+
+
+def _station(num, name=None):
+    return {"num": num, "name": name or f"s{num}", "site": "NORTH", "black_num": 1}
+
+
+def _blacks(client, *nums):
+    for num in nums:
+        assert client.post("/api/v1/blacks", json={"num": num, "name": f"b{num}", "site": "NORTH"}).status_code == 201
+
+
+def _station_nums(client):
+    return [s["num"] for s in client.get("/api/v1/stations").json()]
+
+
+def test_bulk_create_reports_failed_items_without_driver_text(client, caplog):
+    _blacks(client, 1)
+
+    payload = [_station(1), _station(1, "duplicate"), {"num": 2}, _station(3)]
+    with caplog.at_level(logging.INFO):
+        response = client.post("/api/v1/stations/bulk", json=payload)
+
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert sorted(result["succeeded"]) == [1, 3]
+    assert [e["index"] for e in result["errors"]] == [1, 2]
+    assert result["errors"][0]["detail"] == "Could not create Station: constraint violated."
+    assert "stations" in caplog.text  # The driver message is logged instead
+    assert _station_nums(client) == [1, 3]
+
+
+def test_atomic_bulk_create_rejects_the_whole_batch(client):
+    _blacks(client, 1)
+
+    response = client.post("/api/v1/stations/bulk", params={"atomic": True}, json=[_station(1), {"num": 2}])
+    assert response.status_code == 422
+    assert [e["index"] for e in response.json()["errors"]] == [1]
+
+    response = client.post("/api/v1/stations/bulk", params={"atomic": True}, json=[_station(1), _station(1)])
+    assert response.status_code == 400
+    assert "UNIQUE" not in response.text
+    assert _station_nums(client) == []
+
+
+def test_bulk_update(client):
+    _blacks(client, 1, 2, 3)
+
+    response = client.patch("/api/v1/blacks/bulk", json=[
+        {"id": 1, "data": {"name": "renamed"}},
+        {"id": 2, "data": {"name": "b3"}},  # Unique name taken
+        {"id": 99, "data": {"name": "nobody"}},
+    ])
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["succeeded"] == [1]
+    assert [(e["index"], e["detail"]) for e in result["errors"]] == [
+        (1, "Could not update Black: constraint violated."),
+        (2, "Black 99 not found"),
+    ]
+    assert [b["name"] for b in client.get("/api/v1/blacks").json()] == ["renamed", "b2", "b3"]
+
+    response = client.patch("/api/v1/blacks/bulk", params={"atomic": True}, json=[
+        {"id": 2, "data": {"name": "changed"}},
+        {"id": 99, "data": {"name": "nobody"}},
+    ])
+    assert response.status_code == 422
+    assert client.get("/api/v1/blacks/2").json()["name"] == "b2"
+
+
+def test_bulk_delete(client):
+    create_stations(client, 1, 2, 3)
+
+    response = client.request("DELETE", "/api/v1/stations/bulk", json=[1, 99])
+    assert response.status_code == 200, response.text
+    assert response.json() == {"succeeded": [1], "errors": [{"index": 1, "detail": "Station 99 not found"}]}
+
+    response = client.request("DELETE", "/api/v1/stations/bulk", params={"atomic": True}, json=[2, 98])
+    assert response.status_code == 422
+    assert _station_nums(client) == [2, 3]
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from tests.factories import at, create_missions, create_stations, insert_station_event
+
+
+@pytest.fixture
+def bookings(client, db):
+    """
+    Event ids by name; the expected conflicts are A, B, C (station 1) and F, G, H (station 3).
+    """
+    create_stations(client, 1, 2, 3, 4, 5)
+    create_missions(client, 2)
+    return {
+        # Station 1: B and C nested in A; C overlaps nothing but A (LAG(end_time) alone misses it)
+        "A": insert_station_event(db, 1, 1, at(1), at(10)),
+        "B": insert_station_event(db, 2, 1, at(2), at(3)),
+        "C": insert_station_event(db, 2, 1, at(4), at(5)),
+        # ... and later two events of one mission overlapping each other only
+        "P": insert_station_event(db, 2, 1, at(20), at(22)),
+        "Q": insert_station_event(db, 2, 1, at(21), at(23)),
+        # Station 2: back to back, half-open periods don't overlap
+        "D": insert_station_event(db, 1, 2, at(1), at(2)),
+        "E": insert_station_event(db, 2, 2, at(2), at(3)),
+        # Station 3: an open event overlaps everything after its start
+        "F": insert_station_event(db, 1, 3, at(1), None),
+        "G": insert_station_event(db, 2, 3, at(5), at(6)),
+        "H": insert_station_event(db, 2, 3, at(7), at(8)),
+        # Station 4: a single event
+        "I": insert_station_event(db, 1, 4, at(1), at(2)),
+        # Station 5: one mission booking it twice over, then another mission right after
+        "M": insert_station_event(db, 1, 5, at(1), at(3)),
+        "N": insert_station_event(db, 1, 5, at(2), at(4)),
+        "O": insert_station_event(db, 2, 5, at(4), at(5)),
+    }
+
+
+def _pages(client, path, limit):
+    pages, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get(path, params=params)
+        assert response.status_code == 200, response.text
+        pages.append(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+
+
+def test_conflicts_cover_nested_and_open_events_but_not_adjacent_ones(client, bookings):
+    conflicts = client.get("/api/v1/conflicts/station").json()
+
+    ids = {event_id: name for name, event_id in bookings.items()}
+    assert [(c["resource_id"], ids[c["event_id"]]) for c in conflicts] == [
+        (1, "A"), (1, "B"), (1, "C"), (3, "F"), (3, "G"), (3, "H")
+    ]
+    nested = conflicts[2]
+    assert (nested["previous_event_id"], nested["next_event_id"]) == (bookings["B"], bookings["P"])
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4])
+def test_conflict_pages_resume_across_resources(client, bookings, limit):
+    everything = client.get("/api/v1/conflicts/station").json()
+
+    pages = _pages(client, "/api/v1/conflicts/station", limit)
+
+    assert all(len(page) <= limit for page in pages)
+    assert [c for page in pages for c in page] == everything
+
+
+def test_conflict_summary_pages(client, bookings):
+    pages = _pages(client, "/api/v1/conflicts/station/summary", 1)
+
+    assert [[(s["resource_id"], s["events"], s["missions"]) for s in page] for page in pages] == [
+        [(1, 3, 2)], [(3, 3, 2)]
+    ]
+    assert pages[1][0]["first_start"].startswith("2026-01-01")
+    assert pages[1][0]["last_start"].startswith("2026-01-07")
+
+
+def test_conflict_export_matches_listing(client, bookings):
+    listing = client.get("/api/v1/conflicts/station").json()
+
+    response = client.get("/api/v1/conflicts/station/export")
+    assert response.status_code == 200, response.text
+    exported = [json.loads(line) for line in response.text.splitlines() if line]
+    assert [e["event_id"] for e in exported] == [c["event_id"] for c in listing]
+
+    response = client.get("/api/v1/conflicts/station/export", params={"format": "csv"})
+    lines = response.text.splitlines()
+    assert lines[0].split(",")[:3] == ["resource_id", "event_id", "mission_id"]
+    assert len(lines) == 1 + len(listing)
@@ -0,0 +1,90 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.sql.models.black import Black
+from app.db.sql.models.mission import Mission
+from app.db.sql.models.role import Role
+from app.db.sql.models.station import Station
+from app.domain.schemas.mission import MissionCreate, MissionRead
+from app.domain.schemas.resources import OperatorCreate, StationRead
+from app.infrastructure.repositories.sql.base import SQLAlchemyRepository
+from app.infrastructure.repositories.sql.mission import SQLMissionRepository
+from app.infrastructure.repositories.sql.operator import SQLOperatorRepository
+from tests.factories import MISSION, query_count
+
+
+def _in_session(db_path, scenario):
+    """Runs `scenario(session)` the way a request does: async session, no expiry on commit."""
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                return await scenario(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_created_mission_is_returned_from_the_insert_alone(client):
+    response = client.post("/api/v1/missions", json={"name": "m1", **MISSION})
+
+    assert response.status_code == 201, response.text
+    body = response.json()
+    assert body["id"] == 1
+    assert body["name"] == "m1"
+    assert all(body[key] == [] for key in ("mission_stations", "mission_crawlers", "mission_platforms",
+                                           "mission_operators", "links"))
+    # The INSERT; no refresh and no per-collection SELECTs
+    assert query_count(response) == 1
+
+
+def test_repository_create_leaves_nothing_to_lazy_load(db_path):
+    async def scenario(session):
+        mission = await SQLMissionRepository(session).create(
+            Mission.model_validate(MissionCreate(name="m", **MISSION))
+        )
+        session.add(Black(num=1, name="b1", site="NORTH"))
+        await session.flush()
+        station = await SQLAlchemyRepository(session, Station, StationRead).create(
+            Station(num=7, name="s7", site="NORTH", black_num=1)
+        )
+        # Plain attribute access: anything still unloaded would raise MissingGreenlet here
+        return (
+            mission.id, mission.version, MissionRead.model_validate(mission).model_dump(),
+            station.num, station.black.name, station.missions
+        )
+
+    mission_id, version, mission, station_num, black_name, station_missions = _in_session(db_path, scenario)
+
+    assert mission_id == 1
+    assert version == 1
+    assert mission["stations"] == mission["operators"] == mission["links"] == []
+    assert (station_num, black_name, station_missions) == (7, "b1", [])
+
+
+def test_operator_create_links_roles_without_a_refresh(db_path):
+    async def scenario(session):
+        session.add(Role(id=1, name="COMMANDER"))
+        await session.flush()
+        operator = await SQLOperatorRepository(session).create(
+            OperatorCreate(first_name="Ada", last_name="L", roles=[1])
+        )
+        return operator.id, [link.role.id for link in operator.roles], operator.missions
+
+    assert _in_session(db_path, scenario) == (1, [1], [])
+
+
+def test_operator_create_without_roles(client):
+    response = client.post("/api/v1/operators", json={"first_name": "Ada", "last_name": "L", "roles": []})
+
+    assert response.status_code == 201, response.text
+    assert response.json() == {"id": 1, "first_name": "Ada", "last_name": "L", "roles": []}
+
+
+def test_operator_create_with_an_unknown_role_is_not_found(client):
+    response = client.post("/api/v1/operators", json={"first_name": "Ada", "last_name": "L", "roles": [9]})
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "One or more Role IDs not found"
@@ -0,0 +1,62 @@
+import json
+
+from tests.factories import at, create_missions, create_stations, insert_station_event
+
+
+def ndjson(*rows: dict) -> str:
+    return "".join(json.dumps(row) + "\n" for row in rows)
+
+
+def test_import_rejects_overlap_hidden_behind_a_shorter_stored_event(client, db):
+    create_stations(client, 1, 3)
+    create_missions(client, 3)
+    # Stored events of station 3 overlap each other: the long one ends after the short one
+    insert_station_event(db, 3, 3, at(1), at(30))
+    insert_station_event(db, 2, 3, at(2), at(3))
+
+    body = ndjson(
+        {"mission_id": 1, "station_id": 1, "start_time": at(1), "end_time": at(2)},
+        {"mission_id": 1, "station_id": 3, "start_time": at(10), "end_time": at(11)},
+    )
+    response = client.post("/api/v1/missions/stations/import", content=body)
+
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert (report["inserted"], report["rejected"]) == (1, 1)
+    assert report["errors"][0]["row"] == 2
+
+
+def test_import_rejects_rows_overlapping_earlier_rows_of_the_chunk(client):
+    create_stations(client, 1)
+    create_missions(client, 2)
+
+    body = ndjson(
+        {"mission_id": 1, "station_id": 1, "start_time": at(1), "end_time": at(20)},
+        {"mission_id": 2, "station_id": 1, "start_time": at(5), "end_time": at(6)},
+        {"mission_id": 2, "station_id": 1, "start_time": at(20), "end_time": at(21)},
+    )
+    report = client.post("/api/v1/missions/stations/import", content=body).json()
+
+    assert (report["inserted"], report["rejected"]) == (2, 1)
+    assert report["errors"][0]["row"] == 2
+
+
+def test_import_accepts_overlaps_within_a_mission_like_the_api(client, db):
+    create_stations(client, 1)
+    create_missions(client, 2)
+    insert_station_event(db, 1, 1, at(1), at(10))
+
+    # The API write path lets mission 1 overlap its own event...
+    response = client.post("/api/v1/missions/1/stations", json={"station_id": 1, "start_time": at(2), "end_time": at(3)})
+    assert response.status_code == 201, response.text
+
+    # ...so the import does too, stored or earlier in the input; other missions are still refused
+    body = ndjson(
+        {"mission_id": 1, "station_id": 1, "start_time": at(4), "end_time": at(12)},
+        {"mission_id": 1, "station_id": 1, "start_time": at(11), "end_time": at(13)},
+        {"mission_id": 2, "station_id": 1, "start_time": at(12), "end_time": at(14)},
+    )
+    report = client.post("/api/v1/missions/stations/import", content=body).json()
+
+    assert (report["inserted"], report["rejected"]) == (2, 1)
+    assert report["errors"][0]["row"] == 3
@@ -0,0 +1,48 @@
+import logging
+
+from sqlalchemy.exc import IntegrityError
+
+from app.infrastructure.repositories.sql.base import overlap_error
+from tests.factories import at, create_missions, create_stations, insert_station_event
+
+
+def test_event_update_rejects_end_before_stored_start(client, db):
+    create_stations(client, 1)
+    create_missions(client, 1)
+    event_id = insert_station_event(db, 1, 1, at(2), at(3))
+
+    response = client.patch(f"/api/v1/missions/1/stations/{event_id}", json={"id": event_id, "end_time": at(1)})
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"] == "Event end_time must be after start_time"
+
+    response = client.patch(
+        f"/api/v1/missions/1/stations/{event_id}", json={"id": event_id, "start_time": at(4), "end_time": at(5)}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["end_time"].startswith("2026-01-05")
+
+
+def test_timeline_batch_rejects_inverted_update(client, db):
+    create_stations(client, 1)
+    create_missions(client, 1)
+    event_id = insert_station_event(db, 1, 1, at(2), at(3))
+
+    response = client.patch(
+        "/api/v1/missions/1/timeline/stations",
+        json={"mission_id": 1, "updates": [{"id": event_id, "start_time": at(4)}]}
+    )
+    assert response.status_code == 422, response.text
+    assert "end_time must be after start_time" in response.json()["detail"]
+    assert db.execute("SELECT start_time FROM mission_stations").fetchone()[0].startswith("2026-01-02")
+
+
+def test_overlap_error_keeps_driver_message_out_of_the_response(caplog):
+    class DriverError(Exception):
+        sqlstate = "23P01"
+
+    error = IntegrityError("INSERT ...", {}, DriverError('conflicting key value (station_id)=(7)'))
+    with caplog.at_level(logging.INFO):
+        exception = overlap_error(error)
+
+    assert "station_id" not in exception.message
+    assert "station_id" in caplog.text
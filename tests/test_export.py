@@ -0,0 +1,96 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.api import export
+from tests.factories import at, create_missions, create_stations, insert_station_event
+
+
+def _ndjson(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def _csv(response) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(response.text)))
+
+
+@pytest.fixture
+def stations(client):
+    create_stations(client, 1, 2, 3)
+    create_stations(client, 4, 5, site="SOUTH")
+
+
+def test_ndjson_export_streams_every_column_of_every_row(client, stations):
+    response = client.get("/api/v1/stations/export")
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="stations.ndjson"'
+    rows = _ndjson(response)
+    assert [row["num"] for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[3] == {"num": 4, "name": "s4", "site": "SOUTH", "black_num": 1}
+
+
+def test_csv_export_starts_with_a_header_row(client, stations):
+    response = client.get("/api/v1/stations/export", params={"format": "csv", "sort": "-num"})
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="stations.csv"'
+    assert _csv(response) == [
+        ["num", "name", "site", "black_num"],
+        *([str(n), f"s{n}", "SOUTH" if n > 3 else "NORTH", "1"] for n in (5, 4, 3, 2, 1)),
+    ]
+
+
+def test_fields_project_the_exported_columns(client, stations):
+    ndjson = client.get("/api/v1/stations/export", params={"fields": "name,num"})
+    csv_rows = _csv(client.get("/api/v1/stations/export", params={"fields": "name", "format": "csv"}))
+
+    assert _ndjson(ndjson)[0] == {"name": "s1", "num": 1}
+    assert csv_rows[:2] == [["name"], ["s1"]]
+
+
+def test_filters_pass_through_to_the_query(client, stations):
+    response = client.get("/api/v1/stations/export", params={"site": "SOUTH", "format": "csv", "fields": "num"})
+
+    assert _csv(response) == [["num"], ["4"], ["5"]]
+
+
+def test_invalid_queries_fail_before_the_stream_starts(client, stations):
+    for params in ({"colour": "red"}, {"fields": "num,colour"}):
+        response = client.get("/api/v1/stations/export", params=params)
+        assert response.status_code == 400, params
+        assert "colour" in response.json()["detail"]
+
+
+def test_an_empty_csv_export_is_only_the_header(client):
+    response = client.get("/api/v1/stations/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert _csv(response) == [["num", "name", "site", "black_num"]]
+
+
+def test_rows_are_sent_in_chunks_without_losing_any(client, stations, monkeypatch):
+    monkeypatch.setattr(export, "CHUNK_ROWS", 2)
+
+    response = client.get("/api/v1/stations/export", params={"format": "csv", "fields": "num"})
+
+    assert _csv(response) == [["num"], ["1"], ["2"], ["3"], ["4"], ["5"]]
+
+
+def test_event_export_filters_by_mission_and_plain_encodes_times(client, db):
+    create_stations(client, 1)
+    create_missions(client, 2)
+    insert_station_event(db, 1, 1, at(1), at(2))
+    insert_station_event(db, 2, 1, at(3), None)
+
+    response = client.get("/api/v1/missions/stations/export", params={"mission_id": 2})
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-disposition"] == 'attachment; filename="mission_stations.ndjson"'
+    [row] = _ndjson(response)
+    assert (row["mission_id"], row["station_id"], row["end_time"]) == (2, 1, None)
+    assert row["start_time"].startswith("2026-01-03T00:00:00")
@@ -0,0 +1,56 @@
+from tests.factories import at, create_missions, create_stations, insert_station_event
+
+
+def _etag(client, mission_id=1):
+    response = client.get(f"/api/v1/missions/{mission_id}")
+    assert response.status_code == 200, response.text
+    return response.headers["ETag"]
+
+
+def _revalidate(client, etag, mission_id=1):
+    return client.get(f"/api/v1/missions/{mission_id}", headers={"If-None-Match": etag})
+
+
+def test_etag_is_stable_until_the_mission_changes(client, db):
+    create_stations(client, 1, 2)
+    create_missions(client, 1)
+    insert_station_event(db, 1, 1, at(1), at(2))
+    etag = _etag(client)
+
+    assert _revalidate(client, etag).status_code == 304
+
+    # Station 2 appears in no mission
+    assert client.patch("/api/v1/stations/2", json={"name": "renamed"}).status_code == 200
+    assert _revalidate(client, etag).status_code == 304
+
+
+def test_resource_edits_change_the_etag_of_missions_serializing_them(client, db):
+    create_stations(client, 1)
+    create_missions(client, 2)
+    insert_station_event(db, 1, 1, at(1), at(2))
+    etag, other = _etag(client, 1), _etag(client, 2)
+
+    assert client.patch("/api/v1/stations/1", json={"name": "renamed"}).status_code == 200
+    response = _revalidate(client, etag)
+    assert response.status_code == 200
+    assert response.json()["mission_stations"][0]["station"]["name"] == "renamed"
+    assert _revalidate(client, other, 2).status_code == 304
+
+    # The station's black is serialized under it as well
+    etag = response.headers["ETag"]
+    assert client.patch("/api/v1/blacks/1", json={"name": "b-renamed"}).status_code == 200
+    response = _revalidate(client, etag)
+    assert response.status_code == 200
+    assert response.json()["mission_stations"][0]["station"]["black"]["name"] == "b-renamed"
+
+
+def test_cascading_resource_delete_changes_the_etag(client, db):
+    create_stations(client, 1)
+    create_missions(client, 1)
+    insert_station_event(db, 1, 1, at(1), at(2))
+    etag = _etag(client)
+
+    assert client.delete("/api/v1/stations/1").status_code == 204
+    response = _revalidate(client, etag)
+    assert response.status_code == 200
+    assert response.json()["mission_stations"] == []
@@ -0,0 +1,72 @@
+import pytest
+
+from app.domain.schemas.mission import MissionSummary
+from tests.factories import at, walk_pages
+
+# name: (start day, status, section, type, origin); m2, m3 and m6 share a start time
+MISSIONS = {
+    "m1": (1, "PLANNED", "SECTION_A", "TRAINING", "INTERNAL"),
+    "m2": (2, "ACTIVE", "SECTION_B", "OPERATIONAL", "EXTERNAL"),
+    "m3": (2, "PLANNED", "SECTION_B", "TRAINING", "EXTERNAL"),
+    "m4": (3, "COMPLETED", "SECTION_A", "OPERATIONAL", "INTERNAL"),
+    "m5": (4, "PLANNED", "SECTION_A", "TRAINING", "EXTERNAL"),
+    "m6": (2, "CANCELLED", "SECTION_A", "TRAINING", "INTERNAL"),
+}
+
+
+@pytest.fixture
+def missions(client):
+    for name, (day, status, section, type, origin) in MISSIONS.items():
+        response = client.post("/api/v1/missions", json={
+            "name": name, "status": status, "section": section, "type": type, "origin": origin,
+            "scheduled_start_time": at(day), "scheduled_end_time": at(day + 1),
+        })
+        assert response.status_code == 201, response.text
+
+
+def _names(pages) -> list[str]:
+    return [m["name"] for page in pages for m in page]
+
+
+@pytest.mark.parametrize("params, expected", [
+    ({}, ["m1", "m2", "m3", "m6", "m4", "m5"]),
+    ({"status": "PLANNED"}, ["m1", "m3", "m5"]),
+    ({"status": ["PLANNED", "ACTIVE"]}, ["m1", "m2", "m3", "m5"]),
+    ({"section": "SECTION_B"}, ["m2", "m3"]),
+    ({"type": "OPERATIONAL"}, ["m2", "m4"]),
+    ({"origin": "EXTERNAL"}, ["m2", "m3", "m5"]),
+    ({"status": "PLANNED", "origin": "EXTERNAL"}, ["m3", "m5"]),
+    # [scheduled_from, scheduled_to): the end is exclusive
+    ({"scheduled_from": at(2), "scheduled_to": at(3)}, ["m2", "m3", "m6"]),
+    ({"scheduled_from": at(3)}, ["m4", "m5"]),
+    ({"scheduled_to": at(2)}, ["m1"]),
+    ({"status": "COMPLETED", "section": "SECTION_B"}, []),
+])
+def test_filters(client, missions, params, expected):
+    assert _names(walk_pages(client, "/api/v1/missions", 100, **params)) == expected
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4])
+@pytest.mark.parametrize("params, expected", [
+    ({}, ["m1", "m2", "m3", "m6", "m4", "m5"]),
+    ({"descending": True}, ["m5", "m4", "m6", "m3", "m2", "m1"]),
+    ({"descending": True, "status": "PLANNED"}, ["m5", "m3", "m1"]),
+    ({"descending": True, "scheduled_from": at(2), "scheduled_to": at(4)}, ["m4", "m6", "m3", "m2"]),
+])
+def test_cursor_pages_walk_every_mission_once(client, missions, params, expected, limit):
+    pages = walk_pages(client, "/api/v1/missions", limit, **params)
+
+    assert all(len(page) == limit for page in pages[:-1])
+    assert _names(pages) == expected
+
+
+def test_items_are_summaries_without_timelines(client, missions):
+    [mission] = client.get("/api/v1/missions", params={"limit": 1}).json()
+
+    assert mission.keys() == MissionSummary.model_fields.keys()
+    assert mission["id"] == 1
+
+
+def test_invalid_filter_values_are_rejected(client, missions):
+    assert client.get("/api/v1/missions", params={"status": "DONE"}).status_code == 422
+    assert client.get("/api/v1/missions", params={"scheduled_from": "yesterday"}).status_code == 422
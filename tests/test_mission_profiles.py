@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.sql.manager import _instrument_engine, start_query_tracking, stop_query_tracking
+from app.domain.interfaces.repository import MissionLoadProfile
+from app.domain.schemas.enums import ResourceType
+from app.domain.schemas.mission import MissionRead
+from app.infrastructure.repositories.sql.mission import SQLMissionRepository, mission_load_options
+from tests.factories import at, create_missions, create_stations, insert_station_event
+
+
+@pytest.fixture
+def mission(client, db):
+    """Mission 1 with a station event (station 1 under black 1) and an operator event."""
+    create_stations(client, 1)
+    create_missions(client, 1)
+    assert client.post("/api/v1/roles", json={"name": "COMMANDER"}).status_code == 201
+    assert client.post("/api/v1/operators", json={"first_name": "Ada", "last_name": "L", "roles": []}).status_code == 201
+    insert_station_event(db, 1, 1, at(1), at(2))
+    db.execute(
+        "INSERT INTO mission_operators (mission_id, operator_id, role_id, start_time, end_time) "
+        "VALUES (1, 1, 1, '2026-01-01 00:00:00.000000', NULL)"
+    )
+    db.commit()
+
+
+def _load(db_path, profile, resource_type=None, inspect=lambda mission: None):
+    """Loads mission 1 under `profile`, then runs `inspect(mission)` counting the statements it issues."""
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        _instrument_engine(engine)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                mission = await SQLMissionRepository(session).get_with_profile(1, profile, resource_type)
+                stats, token = start_query_tracking()
+                try:
+                    return inspect(mission), stats.count
+                finally:
+                    stop_query_tracking(token)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(scenario())
+
+
+def test_summary_profile_loads_columns_only(db_path, mission):
+    assert _load(db_path, MissionLoadProfile.SUMMARY, inspect=lambda m: (m.name, m.version)) == (("m1", 1), 0)
+
+    for relationship in ("mission_stations", "mission_operators", "links"):
+        with pytest.raises(InvalidRequestError, match=relationship):
+            _load(db_path, MissionLoadProfile.SUMMARY, inspect=lambda m: getattr(m, relationship))
+
+
+def test_timeline_profile_loads_one_timeline_without_its_resources(db_path, mission):
+    def events(m):
+        return [(e.station_id, e.start_time.day) for e in m.mission_stations]
+
+    assert _load(db_path, MissionLoadProfile.TIMELINE, ResourceType.STATION, events) == ([(1, 1)], 0)
+
+    with pytest.raises(InvalidRequestError, match="mission_operators"):
+        _load(db_path, MissionLoadProfile.TIMELINE, ResourceType.STATION, lambda m: m.mission_operators)
+    with pytest.raises(InvalidRequestError, match="station"):
+        _load(db_path, MissionLoadProfile.TIMELINE, ResourceType.STATION, lambda m: m.mission_stations[0].station)
+
+
+def test_timeline_profile_needs_a_resource_type():
+    with pytest.raises(ValueError):
+        mission_load_options(MissionLoadProfile.TIMELINE)
+
+
+def test_full_profile_serializes_mission_read_without_lazy_loads(db_path, mission):
+    def serialize(m):
+        return MissionRead.model_validate(m).model_dump(mode="json", by_alias=True)
+
+    body, queries = _load(db_path, MissionLoadProfile.FULL, inspect=serialize)
+
+    assert queries == 0
+    assert body["mission_stations"][0]["station"] == {
+        "num": 1, "name": "s1", "site": "NORTH", "black_num": 1,
+        "black": {"num": 1, "name": "b1", "site": "NORTH"}
+    }
+    operator_event = body["mission_operators"][0]
+    assert operator_event["operator"] == {"id": 1, "first_name": "Ada", "last_name": "L", "roles": []}
+    assert operator_event["role"] == {"id": 1, "name": "COMMANDER"}
+    assert body["mission_crawlers"] == body["mission_platforms"] == body["links"] == []
+
+
+def test_full_profile_replaces_a_summary_already_in_the_session(db_path, mission):
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                repository = SQLMissionRepository(session)
+                summary = await repository.get_with_profile(1, MissionLoadProfile.SUMMARY)
+                full = await repository.get_with_profile(1, MissionLoadProfile.FULL)
+                return full is summary, len(MissionRead.model_validate(full).stations)
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(scenario()) == (True, 1)
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.sql.manager import _instrument_engine, start_query_tracking, stop_query_tracking
+from app.db.sql.slow_queries import SlowQueryRecorder
+
+
+def test_failed_statements_are_counted_and_leave_no_state_on_the_connection():
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        _instrument_engine(engine)
+        stats, token = start_query_tracking()
+        try:
+            async with engine.connect() as conn:
+                with pytest.raises(OperationalError):
+                    await conn.execute(text("SELECT * FROM missing_table"))
+                await conn.execute(text("SELECT 1"))
+                info = dict(conn.sync_connection.info)
+        finally:
+            stop_query_tracking(token)
+            await engine.dispose()
+        return stats, info
+
+    stats, info = asyncio.run(scenario())
+    assert stats.count == 2
+    assert stats.duration > 0
+    assert not any("started_at" in key for key in info)
+
+
+def test_slow_query_recorder_survives_failed_statements():
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        recorder = SlowQueryRecorder(threshold_ms=0)
+        recorder.attach(engine)
+        try:
+            async with engine.connect() as conn:
+                with pytest.raises(OperationalError):
+                    await conn.execute(text("SELECT * FROM missing_table"))
+                await conn.execute(text("SELECT 1"))
+                info = dict(conn.sync_connection.info)
+        finally:
+            await engine.dispose()
+        return recorder, info
+
+    recorder, info = asyncio.run(scenario())
+    assert [entry.statement for entry in recorder.entries()] == ["SELECT 1"]
+    assert not any("started_at" in key for key in info)
@@ -0,0 +1,104 @@
+import asyncio
+import json
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import select
+
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.api.serialization import SchemaResponse, schema_adapter
+from app.db.sql.models.station import Station
+from app.domain.interfaces.repository import MissionLoadProfile
+from app.domain.schemas.mission import MissionRead
+from app.domain.schemas.resources import StationRead
+from app.infrastructure.repositories.sql.loading import schema_load_options
+from app.infrastructure.repositories.sql.mission import SQLMissionRepository
+from tests.factories import at, create_missions, create_stations, insert_station_event
+
+
+@pytest.fixture
+def mission(client, db):
+    create_stations(client, 1, 2, 3)
+    create_missions(client, 1)
+    insert_station_event(db, 1, 1, at(1), at(2))
+    insert_station_event(db, 1, 2, at(1, 6), None)
+
+
+def _load_orm(db_path):
+    """Mission 1 (FULL profile) and every station with its black, detached but fully loaded."""
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                mission = await SQLMissionRepository(session).get_with_profile(1, MissionLoadProfile.FULL)
+                result = await session.execute(
+                    select(Station).options(*schema_load_options(Station, StationRead)).order_by(Station.num)
+                )
+                return mission, result.scalars().all()
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(scenario())
+
+
+def test_schema_adapters_are_built_once():
+    assert schema_adapter(MissionRead) is schema_adapter(MissionRead)
+    assert schema_adapter(List[StationRead]) is schema_adapter(List[StationRead])
+
+
+def test_output_matches_the_response_model_path(db_path, mission):
+    orm_mission, orm_stations = _load_orm(db_path)
+    app = FastAPI()
+
+    @app.get("/model/mission", response_model=MissionRead)
+    def model_mission():
+        return orm_mission
+
+    @app.get("/fast/mission", response_model=MissionRead)
+    def fast_mission():
+        return SchemaResponse(orm_mission, MissionRead)
+
+    @app.get("/model/stations", response_model=List[StationRead])
+    def model_stations():
+        return orm_stations
+
+    @app.get("/fast/stations", response_model=List[StationRead])
+    def fast_stations():
+        return SchemaResponse(orm_stations, List[StationRead])
+
+    with TestClient(app) as client:
+        for path in ("mission", "stations"):
+            assert client.get(f"/fast/{path}").json() == client.get(f"/model/{path}").json()
+        events = client.get("/fast/mission").json()["mission_stations"]
+
+    # Aliased timelines, nested resources and open events are part of what was compared
+    assert [(e["station"]["black"]["num"], e["end_time"]) for e in events] == [(1, "2026-01-02T00:00:00Z"), (1, None)]
+
+
+def test_headers_and_status(client, mission):
+    response = client.get("/api/v1/missions/1")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["content-length"] == str(len(response.content))
+    assert response.headers["ETag"] == '"1"'
+
+    created = SchemaResponse({"num": 9, "name": "s9", "site": "NORTH", "black_num": 1}, StationRead, status_code=201)
+    assert created.status_code == 201
+    assert json.loads(created.body) == {"num": 9, "name": "s9", "site": "NORTH", "black_num": 1, "black": None}
+
+
+def test_headers_passed_in_are_sent(client, mission):
+    response = client.get("/api/v1/availability/station", params={"from": at(5), "to": at(6), "limit": 1})
+
+    assert response.status_code == 200, response.text
+    # Station 2 is booked from day 1 with no end
+    assert [s["num"] for s in response.json()] == [1]
+    assert NEXT_CURSOR_HEADER in response.headers
+    rest = client.get("/api/v1/availability/station", params={
+        "from": at(5), "to": at(6), "cursor": response.headers[NEXT_CURSOR_HEADER]
+    })
+    assert [s["num"] for s in rest.json()] == [3]
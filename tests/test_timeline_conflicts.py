@@ -0,0 +1,116 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.domain.schemas.enums import ResourceType
+from app.infrastructure.repositories.sql import mission as mission_repository
+from app.infrastructure.repositories.sql.mission import SQLMissionRepository
+from tests.factories import at, create_missions, create_stations, insert_station_event
+
+
+@pytest.fixture
+def bookings(client, db):
+    """Mission 2 holds station 1 on [2, 4) and station 2 from day 5 on; mission 1 holds station 3 on [8, 9)."""
+    create_stations(client, 1, 2, 3)
+    create_missions(client, 2)
+    return {
+        "m2_station_1": insert_station_event(db, 2, 1, at(2), at(4)),
+        "m2_station_2": insert_station_event(db, 2, 2, at(5), None),
+        "m1_station_3": insert_station_event(db, 1, 3, at(8), at(9)),
+    }
+
+
+def _day(day: int) -> datetime:
+    return datetime(2026, 1, day, tzinfo=timezone.utc)
+
+
+def _find_conflicts(db_path, candidates, exclude_mission_id=None):
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            async with AsyncSession(engine) as session:
+                conflicts = await SQLMissionRepository(session).find_conflicts(
+                    ResourceType.STATION, candidates, exclude_mission_id
+                )
+                return [(index, event.id) for index, event in conflicts]
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(scenario())
+
+
+def _batch(client, bookings):
+    return client.patch("/api/v1/missions/1/timeline/stations", json={
+        "mission_id": 1,
+        "auto_fix_gaps": False,
+        "creates": [
+            {"station_id": 1, "start_time": at(1), "end_time": at(3)},  # Overlaps mission 2's [2, 4)
+            {"station_id": 3, "start_time": at(1), "end_time": at(3)},
+            {"station_id": 2, "start_time": at(6), "end_time": at(7)},  # Inside mission 2's open event
+            {"station_id": 1, "start_time": at(4), "end_time": at(5)},  # Right after mission 2's
+        ],
+        # Moves [8, 9) onto station 2, keeping its times
+        "updates": [{"id": bookings["m1_station_3"], "station_id": 2}],
+    })
+
+
+def _clashes(response) -> list[tuple]:
+    return [
+        (c["operation"], c["index"], c["resource_id"], c["conflicts_with"]["event_id"])
+        for c in response.json()["conflicts"]
+    ]
+
+
+def test_every_conflicting_item_is_reported(client, db, bookings):
+    response = _batch(client, bookings)
+
+    assert response.status_code == 409, response.text
+    assert response.json()["detail"] == "Resources busy in other missions: 1, 2."
+    assert _clashes(response) == [
+        ("create", 0, 1, bookings["m2_station_1"]),
+        ("create", 2, 2, bookings["m2_station_2"]),
+        ("update", 0, 2, bookings["m2_station_2"]),
+    ]
+    conflict = response.json()["conflicts"][1]
+    assert conflict["end_time"].startswith("2026-01-07")
+    assert conflict["conflicts_with"]["mission_id"] == 2
+    assert conflict["conflicts_with"]["end_time"] is None
+    # Nothing was written
+    assert db.execute("SELECT COUNT(*) FROM mission_stations").fetchone()[0] == 3
+
+
+def test_chunks_report_the_same_conflicts(client, bookings, monkeypatch):
+    expected = _clashes(_batch(client, bookings))
+    monkeypatch.setattr(mission_repository, "CONFLICT_CHECK_CHUNK", 2)
+
+    response = _batch(client, bookings)
+
+    assert response.status_code == 409
+    assert _clashes(response) == expected
+
+
+def test_exclude_mission_id_skips_that_missions_events(db_path, bookings):
+    candidates = [(1, _day(3), _day(5)), (3, _day(8), _day(10))]
+
+    assert _find_conflicts(db_path, candidates) == [(0, bookings["m2_station_1"]), (1, bookings["m1_station_3"])]
+    assert _find_conflicts(db_path, candidates, exclude_mission_id=1) == [(0, bookings["m2_station_1"])]
+    assert _find_conflicts(db_path, candidates, exclude_mission_id=2) == [(1, bookings["m1_station_3"])]
+
+
+def test_candidate_indexes_stay_global_across_chunks(db_path, bookings, monkeypatch):
+    monkeypatch.setattr(mission_repository, "CONFLICT_CHECK_CHUNK", 2)
+    candidates = [
+        (3, _day(1), _day(2)),
+        (1, _day(1), _day(3)),
+        (3, _day(2), _day(3)),
+        (2, _day(10), _day(11)),
+        (1, _day(3), _day(4)),
+    ]
+
+    assert _find_conflicts(db_path, candidates, exclude_mission_id=1) == [
+        (1, bookings["m2_station_1"]),
+        (3, bookings["m2_station_2"]),
+        (4, bookings["m2_station_1"]),
+    ]
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+
+from tests.factories import at, create_missions, create_stations
+
+
+@pytest.fixture
+def peak_connections(client):
+    """Peak number of pool connections checked out at once, reset by the test."""
+    pool = client.app.state.db_manager._engine.sync_engine.pool
+    state = {"current": 0, "peak": 0}
+
+    def checkout(*args):
+        state["current"] += 1
+        state["peak"] = max(state["peak"], state["current"])
+
+    def checkin(*args):
+        state["current"] -= 1
+
+    event.listen(pool, "checkout", checkout)
+    event.listen(pool, "checkin", checkin)
+    yield state
+    event.remove(pool, "checkout", checkout)
+    event.remove(pool, "checkin", checkin)
+
+
+@pytest.mark.parametrize("slots, max_connections", [(0, 1), (2, 3), (4, 5)])
+def test_timeline_window_fan_out_is_capped(client, peak_connections, slots, max_connections):
+    create_stations(client, 1, 2)
+    create_missions(client, 1)
+    for station in (1, 2):
+        response = client.post(
+            "/api/v1/missions/1/stations", json={"station_id": station, "start_time": at(1), "end_time": at(2)}
+        )
+        assert response.status_code == 201, response.text
+
+    client.app.state.read_fanout_slots = asyncio.Semaphore(slots)
+    peak_connections["peak"] = 0
+    response = client.get("/api/v1/missions/1/timeline", params={"from": at(1), "to": at(3)})
+
+    assert response.status_code == 200, response.text
+    assert [e["station_id"] for e in response.json()["mission_stations"]] == [1, 2]
+    assert 1 <= peak_connections["peak"] <= max_connections
+
+
+def test_timeline_window_of_unknown_mission_is_404(client):
+    response = client.get("/api/v1/missions/99/timeline", params={"from": at(1), "to": at(3)})
+    assert response.status_code == 404
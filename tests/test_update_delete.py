@@ -0,0 +1,78 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.sql.models.station import Station
+from app.domain.schemas.resources import StationRead
+from app.infrastructure.repositories.sql.base import SQLAlchemyRepository
+from tests.factories import MISSION, at, create_stations
+
+
+def test_patch_and_delete_of_a_missing_id_are_not_found(client):
+    create_stations(client, 1)
+
+    for method, kwargs in (
+            ("PATCH", {"json": {"name": "renamed"}}),
+            ("PATCH", {"json": {"num": 99}}),  # Only the pk: nothing to UPDATE, falls back to a get
+            ("DELETE", {}),
+    ):
+        response = client.request(method, "/api/v1/stations/99", **kwargs)
+        assert response.status_code == 404, (method, response.text)
+        assert response.json()["detail"] == "Resource with id 99 not found"
+
+    assert client.get("/api/v1/stations/1").json()["name"] == "s1"
+
+
+def test_delete_reports_only_the_row_it_removed(client):
+    create_stations(client, 1, 2)
+
+    assert client.delete("/api/v1/stations/1").status_code == 204
+    assert client.delete("/api/v1/stations/1").status_code == 404
+    assert [s["num"] for s in client.get("/api/v1/stations").json()] == [2]
+
+
+def test_patch_returns_the_updated_row(client):
+    create_stations(client, 1)
+
+    response = client.patch("/api/v1/stations/1", json={"name": "renamed"})
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"num": 1, "name": "renamed", "site": "NORTH", "black_num": 1,
+                               "black": {"num": 1, "name": "b1", "site": "NORTH"}}
+
+
+def test_event_patch_of_a_missing_event_is_not_found(client):
+    create_stations(client, 1)
+    client.post("/api/v1/missions", json={"name": "m1", **MISSION})
+
+    response = client.patch("/api/v1/missions/1/stations/99", json={"id": 99, "end_time": at(3)})
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Event 99 not found"
+
+
+def test_update_by_id_overwrites_a_stale_loaded_instance(client, db, db_path):
+    create_stations(client, 1)
+    client.post("/api/v1/blacks", json={"num": 2, "name": "b2", "site": "SOUTH"})
+
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                repository = SQLAlchemyRepository(session, Station, StationRead)
+                loaded = await repository.get(1)
+                await session.run_sync(lambda _: loaded.black)
+                # Someone else renames the station after it was loaded into this session
+                db.execute("UPDATE stations SET name = 'elsewhere' WHERE num = 1")
+                db.commit()
+
+                updated = await repository.update_by_id(1, {"num": 1, "black_num": 2})
+                return updated is loaded, StationRead.model_validate(updated).model_dump()
+        finally:
+            await engine.dispose()
+
+    same_instance, station = asyncio.run(scenario())
+
+    assert same_instance
+    assert station == {"num": 1, "name": "elsewhere", "site": "NORTH", "black_num": 2,
+                       "black": {"num": 2, "name": "b2", "site": "SOUTH"}}